@@ -0,0 +1,139 @@
+"""Benchmark the client's transport modes on a mixed workload.
+
+Runs the same mix of small ``find_agents`` calls and large
+``grab_web_text(mode="crawl")`` calls under every ``TransportMode`` and
+reports throughput and latency percentiles for each call type, so the
+best mode for a given traffic mix can be picked from measurements.
+
+The benchmark talks to a real agent.ai deployment (or anything serving
+the same API, such as a staging or mock server). Configure it with the
+usual ``AGENTAI_API_KEY`` / ``AGENTAI_API_URL`` environment variables.
+
+Usage:
+    python benchmarks/bench_transport_modes.py \\
+        --requests 400 --concurrency 100 --crawl-ratio 0.1 \\
+        --crawl-url https://example.com
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from pyagentai import AgentAIClient, AgentAIConfig
+from pyagentai.config import get_default_endpoints
+from pyagentai.types.transport import TransportMode
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    """Get a percentile of the samples, in milliseconds."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index] * 1000
+
+
+async def _run_mode(
+    mode: TransportMode, args: argparse.Namespace
+) -> dict[str, list[float]]:
+    """Run the workload under one transport mode.
+
+    Returns:
+        Latencies in seconds, by call type. Failed calls are recorded
+        under ``"errors"``.
+    """
+    # The workload repeats identical calls, which would otherwise be
+    # coalesced into a few requests and hide the transport differences
+    endpoints = get_default_endpoints().with_overrides(
+        find_agents={"coalesce": False},
+        grab_web_text={"coalesce": False},
+    )
+    config = AgentAIConfig(
+        transport_mode=mode,
+        http2_stripes=args.stripes,
+        endpoints=endpoints,
+    )
+    client = AgentAIClient(config=config)
+    latencies: dict[str, list[float]] = {
+        "find_agents": [],
+        "crawl": [],
+        "errors": [],
+    }
+    semaphore = asyncio.Semaphore(args.concurrency)
+    rng = random.Random(args.seed)  # noqa: S311
+    workload = [
+        "crawl" if rng.random() < args.crawl_ratio else "find_agents"
+        for _ in range(args.requests)
+    ]
+
+    async def run_one(kind: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if kind == "crawl":
+                    await client.grab_web_text(args.crawl_url, mode="crawl")
+                else:
+                    await client.find_agents(query="marketing", limit=10)
+            except ValueError:
+                latencies["errors"].append(time.perf_counter() - started)
+                return
+            latencies[kind].append(time.perf_counter() - started)
+
+    try:
+        await client.warmup()
+        await asyncio.gather(*(run_one(kind) for kind in workload))
+    finally:
+        await client.close()
+    return latencies
+
+
+def _report(
+    mode: TransportMode, latencies: dict[str, list[float]], elapsed: float
+) -> None:
+    """Write one mode's results to stdout."""
+    completed = len(latencies["find_agents"]) + len(latencies["crawl"])
+    sys.stdout.write(
+        f"\n{mode.value}: {completed / elapsed:.1f} req/s, "
+        f"{len(latencies['errors'])} errors\n"
+    )
+    for kind in ("find_agents", "crawl"):
+        samples = latencies[kind]
+        if not samples:
+            continue
+        sys.stdout.write(
+            f"  {kind:<12} n={len(samples):<5} "
+            f"mean={statistics.fmean(samples) * 1000:8.1f}ms "
+            f"p50={_percentile(samples, 50):8.1f}ms "
+            f"p95={_percentile(samples, 95):8.1f}ms "
+            f"p99={_percentile(samples, 99):8.1f}ms\n"
+        )
+
+
+async def main() -> None:
+    """Benchmark every transport mode and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--crawl-ratio", type=float, default=0.1)
+    parser.add_argument("--crawl-url", default="https://example.com")
+    parser.add_argument("--stripes", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        type=TransportMode,
+        default=list(TransportMode),
+    )
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        started = time.perf_counter()
+        latencies = await _run_mode(mode, args)
+        _report(mode, latencies, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,11 +4,17 @@
 from pyagentai.client import AgentAIClient
 from pyagentai.config.agentai_config import AgentAIConfig
 from pyagentai.config.agentai_endpoints import AgentAIEndpoints
+from pyagentai.sync_client import SyncAgentAIClient
 from pyagentai.utils.logger import initialize_logging
 
 __version__ = "0.1.1"
 
-__all__ = ["AgentAIClient", "AgentAIConfig", "AgentAIEndpoints"]
+__all__ = [
+    "AgentAIClient",
+    "AgentAIConfig",
+    "AgentAIEndpoints",
+    "SyncAgentAIClient",
+]
 
 
 def configure_logging(
@@ -18,6 +18,10 @@ async def find_agents(
     This method allows you to find agents by filtering based on their status,
     slug, tags, or by using a search query or a natural language intent.
 
+    With ``agent_cache_ttl`` configured, the results of each search are
+    cached, and every page of them is served from memory. Stale results
+    are served while they are refreshed in the background.
+
     For more details, see the official `Find Agents API documentation
     <https://docs.agent.ai/api-reference/agent-discovery/find-agents>`_.
 
@@ -66,17 +70,24 @@ async def find_agents(
         )
         return []
 
-    response = await self._make_request(
-        endpoint=endpoint,
-        data=data,
-    )
-    response_data = response.json()
+    async def fetch() -> list[AgentInfo]:
+        response = await self._make_request(
+            endpoint=endpoint,
+            data=data,
+        )
+        response_data = response.json()
 
-    # Extract agents from response
-    agents_data: list[dict] = response_data.get("response", [])
-    agents = [
-        AgentInfo.model_validate(agent_data) for agent_data in agents_data
-    ]
+        # Extract agents from response
+        agents_data: list[dict] = response_data.get("response", [])
+        return [
+            AgentInfo.model_validate(agent_data)
+            for agent_data in agents_data
+        ]
+
+    # Every page of a search is served from the same cached results
+    agents = await self._agent_cache.get(
+        self._agent_cache_key(endpoint, data), fetch
+    )
 
     # Apply pagination in memory
     start_idx = min(offset, len(agents))
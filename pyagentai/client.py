@@ -1,18 +1,92 @@
 """Client for interacting with agent.ai API."""
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import ExitStack, contextmanager
 from typing import Any
+from urllib.parse import urlparse
 
 import httpx
 import structlog
 
 from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.exceptions import (
+    AgentAIError,
+    APIConnectionError,
+    APIError,
+    APIStatusError,
+    APITimeoutError,
+    BulkheadFullError,
+    CircuitOpenError,
+    DeadlineExceededError,
+)
+from pyagentai.types.cache import CacheEntry, CacheStats
+from pyagentai.types.circuit_breaker import CircuitState
+from pyagentai.types.concurrency import ConcurrencyStats, TenantStats
+from pyagentai.types.policies import (
+    BulkheadPolicy,
+    CachePolicy,
+    CircuitBreakerPolicy,
+    ConcurrencyPolicy,
+    RetryPolicy,
+)
+from pyagentai.types.priority import RequestPriority
+from pyagentai.types.request_timings import RequestTimings
+from pyagentai.types.transport import ConnectionPoolConfig, TransportMode
 from pyagentai.types.url_endpoint import (
     Endpoint,
     EndpointParameter,
     ParameterType,
     UrlType,
 )
+from pyagentai.utils.agent_catalog import AgentCatalog
+from pyagentai.utils.borrowed_transport import BorrowedTransport
+from pyagentai.utils.cache import MemoryCache, cache_key
+from pyagentai.utils.circuit_breaker import CircuitBreaker
+from pyagentai.utils.compression import (
+    TransferStats,
+    accept_encoding,
+    compress,
+)
+from pyagentai.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    CapacityLimiter,
+    PriorityLimiter,
+)
+from pyagentai.utils.hedging import Hedger
+from pyagentai.utils.host_limiter import HostLimiter
+from pyagentai.utils.loop_resources import LoopResources, current_loop
 from pyagentai.utils.method_registrar_mixin import _MethodRegistrarMixin
+from pyagentai.utils.rate_limiter import TokenBucket
+from pyagentai.utils.request_context import (
+    api_key_override,
+    request_deadline,
+    request_priority,
+    request_tenant,
+    scoped_value,
+)
+from pyagentai.utils.request_timing import RequestTimer
+from pyagentai.utils.retry import (
+    RetryBudget,
+    backoff_delay,
+    parse_retry_after,
+)
+from pyagentai.utils.single_flight import SingleFlight
+from pyagentai.utils.striped_transport import StripedTransport
+from pyagentai.utils.transport_registry import shared_client_registry
+
+TimingHook = Callable[[RequestTimings], Awaitable[None] | None]
+
+# The most per-credential rate limiters kept before idle ones are dropped.
+_MAX_RATE_LIMITERS = 1024
 
 
 class AgentAIClient(_MethodRegistrarMixin):
@@ -22,12 +96,15 @@ class AgentAIClient(_MethodRegistrarMixin):
 
     Attributes:
         config: The configuration for the client.
+        transfer_stats: Bytes sent and received, before and after
+            compression.
     """
 
     def __init__(
         self,
         api_key: str | None = None,
         config: AgentAIConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the agent.ai API client.
 
@@ -36,6 +113,10 @@ class AgentAIClient(_MethodRegistrarMixin):
                 If provided, overrides the key in the config.
             config: The configuration for the client.
                 If not provided, a default configuration is used.
+            transport: A custom httpx transport to send requests through,
+                such as one connected to a local sidecar proxy. If
+                provided, overrides the transport in the config. The
+                transport is not closed by :meth:`close`.
         """
         self._logger = structlog.get_logger("pyagentai")
         if config is None:
@@ -45,34 +126,539 @@ class AgentAIClient(_MethodRegistrarMixin):
         if api_key:
             self.config.api_key = api_key
 
-        self._http_client: httpx.AsyncClient | None = None
-        self._agent_cache: dict[str, dict[str, Any]] = {}
-        self._initialize_client()
+        self._transport = transport or self.config.transport
+        self._loop_lock = threading.Lock()
+        self._loop_resources: dict[
+            asyncio.AbstractEventLoop | None, LoopResources
+        ] = {}
+        self.transfer_stats = TransferStats()
+        self._retry_budget = RetryBudget(self.config.retry_budget)
+        self._limiter_lock = threading.Lock()
+        self._rate_limiters: OrderedDict[Hashable, TokenBucket] = (
+            OrderedDict()
+        )
+        self._concurrency_limiters: dict[
+            tuple[UrlType, str, ConcurrencyPolicy], AdaptiveConcurrencyLimiter
+        ] = {}
+        self._circuit_breakers: dict[
+            tuple[UrlType, str, CircuitBreakerPolicy], CircuitBreaker
+        ] = {}
+        self._hedgers: dict[Hashable, Hedger] = {}
+        self._bulkheads: dict[Hashable, CapacityLimiter] = {}
+        self._dispatchers: dict[UrlType, PriorityLimiter] = {}
+        self._cache = self.config.cache_backend or MemoryCache(
+            self.config.cache_max_entries, self.config.cache_max_bytes
+        )
+        self._cache_lock = threading.Lock()
+        self._single_flight: SingleFlight[httpx.Response] = SingleFlight()
+        self._cache_counts = {"hits": 0, "stale_hits": 0, "misses": 0}
+        self._host_limiter = (
+            HostLimiter(self.config.host_limit)
+            if self.config.host_limit is not None
+            else None
+        )
+        self._timing_hooks: list[TimingHook] = []
+        self._agent_cache = AgentCatalog(
+            self.config.agent_cache_ttl, self.config.agent_cache_max_entries
+        )
+
+    def _get_loop_resources(self) -> LoopResources:
+        """Get the HTTP clients and tasks of the running event loop.
+
+        Resources are created lazily the first time a loop uses the
+        client, and those of loops that have since been closed are
+        dropped.
+
+        Returns:
+            The resources of the running loop.
+        """
+        loop = current_loop()
+        with self._loop_lock:
+            resources = self._loop_resources.get(loop)
+            if resources is None:
+                for other_loop in list(self._loop_resources):
+                    if other_loop is not None and other_loop.is_closed():
+                        self._loop_resources.pop(other_loop).discard()
+                resources = LoopResources()
+                self._loop_resources[loop] = resources
+            return resources
+
+    @property
+    def _http_clients(self) -> dict[UrlType, httpx.AsyncClient]:
+        """The HTTP clients of the running event loop, by host."""
+        return self._get_loop_resources().http_clients
+
+    @property
+    def _keepalive_task(self) -> asyncio.Task[None] | None:
+        """The keep-alive task of the running event loop, if any."""
+        return self._get_loop_resources().keepalive_task
+
+    def _get_pool_config(self, url_type: UrlType) -> ConnectionPoolConfig:
+        """Get the connection pool limits for a host.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            The connection pool configuration for the host.
+        """
+        if url_type == UrlType.WEB:
+            return self.config.web_pool
+        return self.config.api_pool
+
+    def _get_base_url(self, url_type: UrlType) -> str:
+        """Get the base URL for a host.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            The base URL of the host.
+        """
+        if url_type == UrlType.WEB:
+            return self.config.web_url
+        return self.config.api_url
+
+    def _get_transport_key(self, url_type: UrlType) -> Hashable:
+        """Get the key identifying a host's transport settings.
+
+        Clients with equal keys can safely share one connection pool.
+        Pools are bound to an event loop, so the running loop is part of
+        the key.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            A hashable key built from the base URL and transport settings.
+        """
+        pool_config = self._get_pool_config(url_type)
+        return (
+            current_loop(),
+            self._get_base_url(url_type),
+            self.config.timeout,
+            self.config.transport_mode,
+            self.config.http2_stripes,
+            self.config.uds_path,
+            id(self._transport) if self._transport is not None else None,
+            pool_config.max_connections,
+            pool_config.max_keepalive_connections,
+            pool_config.keepalive_expiry,
+        )
+
+    def _create_transport(
+        self, url_type: UrlType
+    ) -> httpx.AsyncBaseTransport:
+        """Create the transport for a host according to the transport mode.
+
+        A custom transport given to the client is used as-is for every
+        host, wrapped so that closing the client leaves it open.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            A transport configured with the host's pool limits.
+        """
+        if self._transport is not None:
+            return BorrowedTransport(self._transport)
+
+        pool_config = self._get_pool_config(url_type)
+        mode = self.config.transport_mode
+        uds_path = self.config.uds_path
+
+        if mode == TransportMode.HTTP2_STRIPED:
+            # One connection per stripe; the striped transport balances
+            # streams across them.
+            stripe_limits = httpx.Limits(
+                max_connections=1,
+                max_keepalive_connections=1,
+                keepalive_expiry=pool_config.keepalive_expiry,
+            )
+            return StripedTransport(
+                [
+                    httpx.AsyncHTTPTransport(
+                        http2=True, limits=stripe_limits, uds=uds_path
+                    )
+                    for _ in range(self.config.http2_stripes)
+                ]
+            )
+
+        return httpx.AsyncHTTPTransport(
+            http2=mode == TransportMode.HTTP2,
+            limits=httpx.Limits(
+                max_connections=pool_config.max_connections,
+                max_keepalive_connections=(
+                    pool_config.max_keepalive_connections
+                ),
+                keepalive_expiry=pool_config.keepalive_expiry,
+            ),
+            uds=uds_path,
+        )
+
+    def _create_http_client(self, url_type: UrlType) -> httpx.AsyncClient:
+        """Create a new HTTP client for a host.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            A new HTTP client using the host's transport.
+        """
+        return httpx.AsyncClient(
+            headers={
+                "Content-Type": "application/json",
+            },
+            timeout=self.config.timeout,
+            transport=self._create_transport(url_type),
+        )
+
+    def _initialize_client(
+        self, url_type: UrlType = UrlType.API
+    ) -> httpx.AsyncClient:
+        """Initialize the HTTP client for a host.
+
+        The API host and the web host each get their own client, and so
+        their own connection pool, so that slow calls against one host
+        cannot exhaust the connections available to the other. Clients
+        are created lazily, once per event loop, so one client object
+        can be used from several loops and threads at once. When
+        ``config.share_transport`` is enabled, the client is taken from
+        the process-wide shared registry instead of being created here.
 
-    def _initialize_client(self) -> httpx.AsyncClient:
-        """Initialize the HTTP client.
+        Args:
+            url_type: The type of host (API or web) to get the client for.
 
         Returns:
             The initialized HTTP client.
         """
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                headers={
-                    "Content-Type": "application/json",
-                },
-                timeout=self.config.timeout,
-                http2=True,
+        resources = self._get_loop_resources()
+        http_client = resources.http_clients.get(url_type)
+        if http_client is not None and not http_client.is_closed:
+            return http_client
+
+        if self.config.share_transport:
+            shared_key = resources.shared_keys.get(url_type)
+            if shared_key is None:
+                shared_key = self._get_transport_key(url_type)
+                http_client = shared_client_registry.acquire(
+                    shared_key,
+                    lambda: self._create_http_client(url_type),
+                )
+                resources.shared_keys[url_type] = shared_key
+            else:
+                # We already hold a reference; only replace a shared
+                # client that was closed from outside the registry.
+                http_client = shared_client_registry.get(
+                    shared_key,
+                    lambda: self._create_http_client(url_type),
+                )
+        else:
+            http_client = self._create_http_client(url_type)
+
+        resources.http_clients[url_type] = http_client
+        return http_client
+
+    async def _ping_host(self, url_type: UrlType) -> bool:
+        """Send a lightweight request to a host to open or keep a connection.
+
+        The response status is irrelevant; only the connection matters.
+
+        Args:
+            url_type: The type of host (API or web) to ping.
+
+        Returns:
+            Whether the host could be reached.
+        """
+        http_client = self._initialize_client(url_type)
+        try:
+            await http_client.head(self._get_base_url(url_type))
+        except httpx.HTTPError as e:
+            await self._logger.warning(
+                f"Could not reach {url_type.value} host: {str(e)}"
+            )
+            return False
+        return True
+
+    async def _warmup_host(self, url_type: UrlType, connections: int) -> int:
+        """Resolve and pre-connect to a host.
+
+        Args:
+            url_type: The type of host (API or web) to warm up.
+            connections: The number of connections to open.
+
+        Returns:
+            The number of successful pre-connect requests.
+        """
+        parsed_url = urlparse(self._get_base_url(url_type))
+        if parsed_url.hostname:
+            port = parsed_url.port or (
+                443 if parsed_url.scheme == "https" else 80
+            )
+            try:
+                await asyncio.get_running_loop().getaddrinfo(
+                    parsed_url.hostname, port
+                )
+            except OSError as e:
+                await self._logger.warning(
+                    f"Could not resolve {parsed_url.hostname}: {str(e)}"
+                )
+
+        # Concurrent requests force the pool to open separate connections
+        max_connections = self._get_pool_config(url_type).max_connections
+        if max_connections is not None:
+            connections = min(connections, max_connections)
+        results = await asyncio.gather(
+            *(self._ping_host(url_type) for _ in range(connections))
+        )
+        return sum(results)
+
+    async def _keepalive_loop(self, interval: float) -> None:
+        """Ping every host periodically so idle connections stay open.
+
+        Args:
+            interval: Seconds between pings.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.gather(
+                *(self._ping_host(url_type) for url_type in UrlType)
+            )
+
+    async def warmup(
+        self,
+        connections: int | None = None,
+        keepalive_interval: float | None = None,
+    ) -> None:
+        """Pre-resolve and pre-connect to the API and web hosts.
+
+        Call this on startup so that the first real request does not pay
+        for DNS resolution and TCP, TLS and HTTP/2 setup. Optionally
+        starts a background task that pings the hosts so idle
+        connections are not dropped between bursts of traffic; the task
+        is stopped by :meth:`close`.
+
+        Args:
+            connections: Number of connections to open per host.
+                Defaults to ``config.warmup_connections``.
+            keepalive_interval: Seconds between keep-alive pings.
+                Defaults to ``config.keepalive_ping_interval``; no pings
+                are sent if both are None.
+
+        Raises:
+            ValueError: If connections is less than 1.
+        """
+        if connections is None:
+            connections = self.config.warmup_connections
+        if connections < 1:
+            raise ValueError("Number of connections must be at least 1.")
+
+        results = await asyncio.gather(
+            *(
+                self._warmup_host(url_type, connections)
+                for url_type in UrlType
+            )
+        )
+        await self._logger.info(
+            f"Warmed up {sum(results)} connections to agent.ai hosts"
+        )
+
+        if keepalive_interval is None:
+            keepalive_interval = self.config.keepalive_ping_interval
+        resources = self._get_loop_resources()
+        keepalive_running = (
+            resources.keepalive_task is not None
+            and not resources.keepalive_task.done()
+        )
+        if keepalive_interval and not keepalive_running:
+            resources.keepalive_task = asyncio.create_task(
+                self._keepalive_loop(keepalive_interval)
             )
-        return self._http_client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._http_client is not None and not self._http_client.is_closed:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Close the HTTP clients of every event loop.
+
+        Shared clients are only released; the registry closes them once
+        their last user is gone. Clients of other loops that are still
+        running are closed on their own loop. Background refreshes of
+        the agent cache are cancelled first, so they open no new clients.
+        """
+        await self._agent_cache.aclose()
+        with self._loop_lock:
+            loop_resources = self._loop_resources
+            self._loop_resources = {}
+
+        loop = current_loop()
+        for resources_loop, resources in loop_resources.items():
+            if resources_loop is None or resources_loop is loop:
+                await resources.aclose()
+            elif resources_loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(
+                    resources.aclose(), resources_loop
+                )
+                await asyncio.wrap_future(future)
+            else:
+                resources.discard()
+
+        if self._host_limiter is not None:
+            self._host_limiter.close()
 
         await self._logger.debug("HTTP client closed")
 
+    @contextmanager
+    def as_tenant(self, api_key: str) -> Iterator["AgentAIClient"]:
+        """Use a different API key for requests made within a block.
+
+        The override is carried in a context variable, so it applies to
+        every request made from the current task (and tasks spawned from
+        it) while the block is active. All tenants keep sharing this
+        client's connection pools and endpoint configuration.
+
+        Example:
+            .. code-block:: python
+
+                with client.as_tenant("tenant-api-key"):
+                    agents = await client.find_agents(query="seo")
+
+        Args:
+            api_key: The API key to authenticate with inside the block.
+
+        Yields:
+            This client.
+
+        Raises:
+            ValueError: If the API key is empty.
+        """
+        if not api_key or not api_key.strip():
+            raise ValueError("API key cannot be empty.")
+
+        with scoped_value(api_key_override, api_key.strip()):
+            yield self
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[float]:
+        """Bound every request made within a block by a shared deadline.
+
+        Requests that would start after the deadline fail immediately
+        with :class:`DeadlineExceededError` instead of being sent, and
+        requests in flight are cut off when it expires. Nested deadlines
+        never extend an enclosing one.
+
+        Example:
+            .. code-block:: python
+
+                with client.deadline(3.0):
+                    agents = await client.find_agents(query="seo")
+                    text, _ = await client.grab_web_text(url)
+
+        Args:
+            seconds: The time budget for the block, in seconds.
+
+        Yields:
+            The absolute deadline, in ``time.monotonic()`` seconds.
+
+        Raises:
+            ValueError: If seconds is not positive.
+        """
+        if seconds <= 0:
+            raise ValueError("Deadline must be a positive number of seconds.")
+
+        deadline = time.monotonic() + seconds
+        enclosing = request_deadline.get()
+        if enclosing is not None:
+            deadline = min(deadline, enclosing)
+        with scoped_value(request_deadline, deadline):
+            yield deadline
+
+    @contextmanager
+    def tenant(self, tenant_id: str) -> Iterator[str]:
+        """Queue requests made within a block fairly with other tenants.
+
+        When more requests are ready than ``max_in_flight`` allows, each
+        tenant of equal priority gets a share of the throughput in
+        proportion to its weight in ``tenant_weights``, so one tenant
+        queueing thousands of requests only delays its own. Requests made
+        outside any tenant block share one queue.
+
+        Example:
+            .. code-block:: python
+
+                with client.tenant("acme"):
+                    await asyncio.gather(*scrape_calls)
+
+        Args:
+            tenant_id: The ID of the tenant the requests are made for.
+
+        Yields:
+            The tenant ID.
+
+        Raises:
+            ValueError: If the tenant ID is empty.
+        """
+        if not tenant_id:
+            raise ValueError("Tenant ID cannot be empty.")
+
+        with scoped_value(request_tenant, tenant_id):
+            yield tenant_id
+
+    @contextmanager
+    def priority(
+        self, priority: RequestPriority
+    ) -> Iterator[RequestPriority]:
+        """Set the priority of requests made within a block.
+
+        When more requests are ready than ``max_in_flight`` allows, the
+        queued requests are sent in order of priority, so interactive
+        calls overtake background work. Queued requests gain priority
+        the longer they wait, so background work still makes progress.
+        Wrap a single call to set the priority of that call only.
+
+        Example:
+            .. code-block:: python
+
+                with client.priority(RequestPriority.LOW):
+                    await asyncio.gather(*backfill_calls)
+
+        Args:
+            priority: The priority of the requests inside the block.
+
+        Yields:
+            The priority.
+        """
+        with scoped_value(request_priority, priority):
+            yield priority
+
+    def _time_left(self) -> float | None:
+        """Get the seconds left until the caller's deadline, if any."""
+        deadline = request_deadline.get()
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    def _get_timeout(
+        self, endpoint: Endpoint, remaining: float | None = None
+    ) -> httpx.Timeout:
+        """Build the timeouts for a request to an endpoint.
+
+        Args:
+            endpoint: The API endpoint to call.
+            remaining: Seconds left until the caller's deadline, if any.
+                Every phase is capped to it.
+
+        Returns:
+            The per-phase timeouts for the request.
+        """
+        default = self.config.timeout
+        phases = dict.fromkeys(("connect", "read", "write", "pool"), default)
+        if endpoint.timeout is not None:
+            phases.update(endpoint.timeout.model_dump(exclude_none=True))
+        if remaining is not None:
+            phases = {
+                phase: min(value, remaining)
+                for phase, value in phases.items()
+            }
+        return httpx.Timeout(**phases)
+
     async def _validate_parameter(
         self, param: EndpointParameter, value: Any
     ) -> Any:
@@ -99,7 +685,7 @@ class AgentAIClient(_MethodRegistrarMixin):
         if should_validate:
             raise ValueError(
                 f"Invalid value for {param.name}: '{value}'. "
-                f"Allowed: {param.allowed_values}"
+                f"Allowed: {list(param.allowed_values)}"
             )
 
         # data type validation
@@ -135,11 +721,788 @@ class AgentAIClient(_MethodRegistrarMixin):
 
         return value
 
+    def _encode_body(
+        self, body_params: dict[str, Any]
+    ) -> tuple[bytes, bytes, dict[str, str]]:
+        """Serialize a JSON request body, compressing it if configured.
+
+        Args:
+            body_params: The body parameters to send.
+
+        Returns:
+            A tuple of the uncompressed body, the body to send and the
+            extra headers to send with it.
+        """
+        body = json.dumps(
+            body_params,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            allow_nan=False,
+        ).encode("utf-8")
+
+        compression = self.config.compression
+        encoding = compression.request_encoding
+        if encoding is None or len(body) < compression.request_min_size:
+            return body, body, {}
+        compressed = compress(body, encoding)
+        return body, compressed, {"Content-Encoding": encoding.value}
+
+    def add_timing_hook(self, hook: TimingHook) -> None:
+        """Register a hook that receives the timings of every request.
+
+        The hook is called with a :class:`RequestTimings` breakdown after
+        each HTTP request, whether it succeeded or failed. It may be a
+        plain function or a coroutine function. Exceptions raised by the
+        hook are logged and otherwise ignored.
+
+        Args:
+            hook: The hook to register.
+        """
+        self._timing_hooks.append(hook)
+
+    def remove_timing_hook(self, hook: TimingHook) -> None:
+        """Unregister a hook added with :meth:`add_timing_hook`.
+
+        Args:
+            hook: The hook to remove.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._timing_hooks.remove(hook)
+
+    async def _report_timings(self, timings: RequestTimings) -> None:
+        """Log the timings of a request and pass them to the hooks.
+
+        Args:
+            timings: The timings of the request.
+        """
+        await self._logger.debug(
+            f"{timings.method} {timings.url} took {timings.total:.3f}s",
+            **timings.model_dump(exclude={"method", "url", "total"}),
+        )
+        for hook in self._timing_hooks:
+            try:
+                result = hook(timings)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:  # noqa: W0718
+                await self._logger.warning(f"Timing hook failed: {str(e)}")
+
+    async def _send(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        query_params: dict[str, Any],
+        body_params: dict[str, Any],
+        headers: dict[str, str],
+        timeout: httpx.Timeout | None = None,
+    ) -> httpx.Response:
+        """Send one HTTP request and record its transfer sizes and timings.
+
+        The timings are attached to the response as the ``"timings"``
+        extension and passed to the registered timing hooks.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            query_params: The validated query parameters.
+            body_params: The validated body parameters.
+            headers: The request headers.
+            timeout: The request timeouts. Defaults to the endpoint's.
+
+        Returns:
+            The httpx response object, with its body read.
+        """
+        if timeout is None:
+            timeout = self._get_timeout(endpoint)
+        client = self._initialize_client(endpoint.url_type)
+        body, content, content_headers = self._encode_body(body_params)
+        timer = RequestTimer(endpoint.method.value, url)
+
+        try:
+            response = await client.request(
+                method=endpoint.method.value,
+                url=url,
+                params=query_params,
+                content=content,
+                headers={**headers, **content_headers},
+                timeout=timeout,
+                extensions={"trace": timer.trace},
+            )
+        except Exception:
+            await self._report_timings(timer.finish())
+            raise
+
+        timings = timer.finish(response.status_code)
+        response.extensions["timings"] = timings
+        self.transfer_stats.record(
+            request_bytes=len(body),
+            request_bytes_sent=len(content),
+            response_bytes_received=response.num_bytes_downloaded,
+            response_bytes=len(response.content),
+        )
+        await self._report_timings(timings)
+        return response
+
+    def _get_rate_limiter(self, endpoint: Endpoint) -> TokenBucket | None:
+        """Get the token bucket that paces requests to an endpoint.
+
+        Args:
+            endpoint: The API endpoint to call.
+
+        Buckets are keyed by a digest of the API key, never the key
+        itself. Past ``_MAX_RATE_LIMITERS`` buckets, the least recently
+        used idle ones are dropped; an idle bucket is full, so a new one
+        paces requests the same.
+
+        Returns:
+            The bucket for the endpoint and, if the limit is per
+            credential, the current API key. None if the endpoint has no
+            rate limit.
+        """
+        policy = endpoint.rate_limit
+        if policy is None:
+            return None
+        credential = None
+        if policy.per_credential:
+            api_key = api_key_override.get() or self.config.api_key
+            credential = hashlib.sha256(api_key.encode()).hexdigest()
+        key = (endpoint.url_type, endpoint.url, policy, credential)
+        with self._limiter_lock:
+            limiter = self._rate_limiters.get(key)
+            if limiter is not None:
+                self._rate_limiters.move_to_end(key)
+                return limiter
+            limiter = self._rate_limiters[key] = TokenBucket(policy)
+            self._forget_idle_rate_limiters()
+            return limiter
+
+    def _forget_idle_rate_limiters(self) -> None:
+        """Drop the least recently used idle buckets beyond the limit.
+
+        The newest bucket is always kept. Must be called with the limiter
+        lock held.
+        """
+        excess = len(self._rate_limiters) - _MAX_RATE_LIMITERS
+        if excess <= 0:
+            return
+        buckets = list(self._rate_limiters.items())[:-1]
+        idle = [key for key, bucket in buckets if bucket.idle]
+        for key in idle[:excess]:
+            del self._rate_limiters[key]
+
+    def _get_dispatcher(self, url_type: UrlType) -> PriorityLimiter:
+        """Get the dispatcher that limits the requests sent to a host.
+
+        Without ``max_in_flight``, an HTTP/1.1 host is limited to its
+        pool's ``max_connections``, the most requests the pool sends at
+        once anyway. HTTP/2 hosts and unlimited pools are not limited, as
+        connections there do not bound the requests in flight.
+
+        Args:
+            url_type: The type of host (API or web).
+
+        Returns:
+            The host's dispatcher.
+        """
+        with self._limiter_lock:
+            dispatcher = self._dispatchers.get(url_type)
+            if dispatcher is None:
+                capacity: float | None = self.config.max_in_flight
+                if (
+                    capacity is None
+                    and self.config.transport_mode == TransportMode.HTTP1
+                ):
+                    # The pool already sends one request per connection
+                    capacity = self._get_pool_config(url_type).max_connections
+                dispatcher = PriorityLimiter(
+                    math.inf if capacity is None else capacity,
+                    self.config.priority_aging_interval,
+                    self.config.tenant_weights,
+                )
+                self._dispatchers[url_type] = dispatcher
+            return dispatcher
+
+    def _get_bulkhead(
+        self, endpoint: Endpoint, params: dict[str, Any]
+    ) -> tuple[CapacityLimiter, BulkheadPolicy, int] | None:
+        """Get the bulkhead pool a call to an endpoint takes slots from.
+
+        Args:
+            endpoint: The API endpoint to call.
+            params: The call's query and body parameters.
+
+        Returns:
+            The pool, the bulkhead policy and the call's cost in slots,
+            or None if the endpoint has no bulkhead.
+        """
+        policy = endpoint.bulkhead
+        if policy is None:
+            return None
+        value = params.get(policy.parameter) if policy.parameter else None
+        partition = str(value) if policy.partition else None
+        key = (endpoint.url_type, endpoint.url, policy, partition)
+        with self._limiter_lock:
+            pool = self._bulkheads.get(key)
+            if pool is None:
+                pool = self._bulkheads[key] = CapacityLimiter(policy.slots)
+        return pool, policy, policy.cost_for(value)
+
+    async def _enter_bulkhead(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        pool: CapacityLimiter,
+        policy: BulkheadPolicy,
+        cost: int,
+        remaining: float | None,
+        stack: ExitStack,
+    ) -> None:
+        """Take a call's slots from a bulkhead until the stack closes.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            pool: The bulkhead pool to take slots from.
+            policy: The bulkhead policy.
+            cost: The slots the call takes.
+            remaining: Seconds left until the caller's deadline, if any.
+            stack: The stack that returns the slots when it closes.
+
+        Raises:
+            BulkheadFullError: If no slots freed up within the policy's
+                ``max_wait``.
+            DeadlineExceededError: If no slots freed up before the
+                caller's deadline.
+        """
+        waits = [w for w in (policy.max_wait, remaining) if w is not None]
+        max_wait = min(waits) if waits else None
+        if await pool.acquire(cost=cost, max_wait=max_wait):
+            stack.callback(pool.release, cost)
+            return
+        if remaining is not None and max_wait == remaining:
+            raise await self._deadline_exceeded(
+                endpoint, url, "waiting for the bulkhead of"
+            )
+        await self._logger.warning(f"Bulkhead of {url} is full")
+        raise BulkheadFullError(f"Bulkhead of {endpoint.url} is full")
+
+    def _get_concurrency_limiter(
+        self, endpoint: Endpoint
+    ) -> AdaptiveConcurrencyLimiter | None:
+        """Get the adaptive limit on concurrent requests to an endpoint.
+
+        Args:
+            endpoint: The API endpoint to call.
+
+        Returns:
+            The endpoint's limiter, or None if it has no concurrency
+            limit.
+        """
+        policy = endpoint.concurrency
+        if policy is None:
+            return None
+        key = (endpoint.url_type, endpoint.url, policy)
+        with self._limiter_lock:
+            limiter = self._concurrency_limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveConcurrencyLimiter(policy)
+                self._concurrency_limiters[key] = limiter
+            return limiter
+
+    def _get_circuit_breaker(
+        self, endpoint: Endpoint
+    ) -> CircuitBreaker | None:
+        """Get the circuit breaker of an endpoint.
+
+        Args:
+            endpoint: The API endpoint to call.
+
+        Returns:
+            The endpoint's breaker, or None if it has no breaker.
+        """
+        policy = endpoint.circuit_breaker
+        if policy is None:
+            return None
+        key = (endpoint.url_type, endpoint.url, policy)
+        with self._limiter_lock:
+            breaker = self._circuit_breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(policy, name=endpoint.url)
+                self._circuit_breakers[key] = breaker
+            return breaker
+
+    def _get_hedger(self, endpoint: Endpoint) -> Hedger | None:
+        """Get the hedger of an endpoint.
+
+        Args:
+            endpoint: The API endpoint to call.
+
+        Returns:
+            The endpoint's hedger, or None if the endpoint has no hedging
+            policy or is not idempotent.
+        """
+        policy = endpoint.hedge
+        if policy is None or not endpoint.idempotent:
+            return None
+        key = (endpoint.url_type, endpoint.url, policy)
+        with self._limiter_lock:
+            hedger = self._hedgers.get(key)
+            if hedger is None:
+                hedger = self._hedgers[key] = Hedger(policy)
+            return hedger
+
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """Get the state of the circuit breakers.
+
+        Returns:
+            The state of the breaker of each endpoint with a circuit
+            breaker policy that has been called, keyed by full URL.
+        """
+        with self._limiter_lock:
+            breakers = list(self._circuit_breakers.items())
+        return {
+            f"{self._get_base_url(url_type)}{url}": breaker.state
+            for (url_type, url, _), breaker in breakers
+        }
+
+    def concurrency_stats(self) -> dict[str, ConcurrencyStats]:
+        """Get the current adaptive concurrency limits.
+
+        Returns:
+            A snapshot of the limit, the requests in flight and waiting,
+            and the smoothed latency of each endpoint with a concurrency
+            policy that has been called, keyed by full URL.
+        """
+        with self._limiter_lock:
+            limiters = list(self._concurrency_limiters.items())
+        return {
+            f"{self._get_base_url(url_type)}{url}": limiter.stats()
+            for (url_type, url, _), limiter in limiters
+        }
+
+    def tenant_stats(self) -> dict[str | None, TenantStats]:
+        """Get the queue depth and waiting times of each tenant.
+
+        Requests only wait in the queue while more are ready than
+        ``max_in_flight`` allows.
+
+        Returns:
+            The requests each tenant has waiting and has sent, and how
+            long they waited, across the API and web hosts. Keyed by
+            tenant ID, with None for requests made outside any tenant
+            block.
+        """
+        with self._limiter_lock:
+            dispatchers = list(self._dispatchers.values())
+        stats: dict[str | None, TenantStats] = {}
+        for dispatcher in dispatchers:
+            for tenant, host in dispatcher.tenant_stats().items():
+                total = stats.get(tenant)
+                if total is None:
+                    stats[tenant] = host
+                    continue
+                dispatched = total.dispatched + host.dispatched
+                stats[tenant] = TenantStats(
+                    queued=total.queued + host.queued,
+                    dispatched=dispatched,
+                    mean_wait=(
+                        (
+                            total.mean_wait * total.dispatched
+                            + host.mean_wait * host.dispatched
+                        )
+                        / dispatched
+                        if dispatched
+                        else 0.0
+                    ),
+                    max_wait=max(total.max_wait, host.max_wait),
+                )
+        return stats
+
+    async def _get_retry_delay(
+        self,
+        policy: RetryPolicy,
+        error: AgentAIError,
+        attempt: int,
+        max_attempts: int,
+    ) -> float | None:
+        """Decide whether and when to retry a failed attempt.
+
+        Args:
+            policy: The retry policy of the endpoint.
+            error: The error the attempt failed with.
+            attempt: The number of the failed attempt, starting at 1.
+            max_attempts: The most attempts allowed for the request.
+
+        Returns:
+            The seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= max_attempts or not error.retryable:
+            return None
+        if isinstance(error, APITimeoutError) and not policy.retry_on_timeout:
+            return None
+
+        retry_after = (
+            error.retry_after if isinstance(error, APIError) else None
+        )
+        if policy.respect_retry_after and retry_after is not None:
+            if retry_after > policy.max_retry_after:
+                return None
+            delay = retry_after
+        else:
+            delay = backoff_delay(policy, attempt)
+
+        # A retry that cannot finish before the deadline is pointless
+        remaining = self._time_left()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        if not self._retry_budget.try_withdraw():
+            await self._logger.warning("Retry budget exhausted")
+            return None
+        return delay
+
+    async def _deadline_exceeded(
+        self, endpoint: Endpoint, url: str, stage: str
+    ) -> DeadlineExceededError:
+        """Log and build the error for a deadline that expired.
+
+        Args:
+            endpoint: The API endpoint being called.
+            url: The full URL of the request.
+            stage: What the request was doing, e.g. ``"before request
+                to"``.
+
+        Returns:
+            The error to raise.
+        """
+        await self._logger.error(f"Deadline exceeded {stage} {url}")
+        return DeadlineExceededError(
+            f"Deadline exceeded {stage} {endpoint.url}"
+        )
+
+    async def _attempt_request(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        query_params: dict[str, Any],
+        body_params: dict[str, Any],
+        headers: dict[str, str],
+        policy: RetryPolicy,
+    ) -> httpx.Response:
+        """Make one attempt at a request.
+
+        The attempt fails fast while the endpoint's circuit breaker is
+        open, and reports its outcome to the breaker otherwise. A slow
+        attempt at an endpoint with a hedging policy is raced against a
+        duplicate.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            query_params: The validated query parameters.
+            body_params: The validated body parameters.
+            headers: The request headers.
+            policy: The retry policy, which decides which HTTP status
+                codes are retryable.
+
+        Returns:
+            The httpx response object.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            BulkheadFullError: If the endpoint's bulkhead stayed full.
+            DeadlineExceededError: If the caller's deadline expires
+                before or during the attempt.
+            APIStatusError: If the API answers with an error status.
+            APITimeoutError: If the attempt times out.
+            APIConnectionError: If the connection fails.
+            AgentAIError: If the attempt fails for any other reason.
+        """
+        # Never launch a request once the caller's deadline has passed
+        remaining = self._time_left()
+        if remaining is not None and remaining <= 0:
+            raise await self._deadline_exceeded(
+                endpoint, url, "before request to"
+            )
+
+        breaker = self._get_circuit_breaker(endpoint)
+        ticket = breaker.acquire() if breaker is not None else 0
+        healthy: bool | None = None
+        send = functools.partial(
+            self._limited_exchange,
+            endpoint=endpoint,
+            url=url,
+            query_params=query_params,
+            body_params=body_params,
+            headers=headers,
+            policy=policy,
+            remaining=remaining,
+        )
+        hedger = self._get_hedger(endpoint)
+        try:
+            if hedger is None:
+                response = await send()
+            else:
+                response = await hedger.run(send)
+            healthy = True
+            return response
+        except APIStatusError as e:
+            healthy = e.status_code < 500
+            raise
+        except (APITimeoutError, APIConnectionError):
+            healthy = False
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record(ticket, healthy)
+
+    async def _limited_exchange(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        query_params: dict[str, Any],
+        body_params: dict[str, Any],
+        headers: dict[str, str],
+        policy: RetryPolicy,
+        remaining: float | None,
+    ) -> httpx.Response:
+        """Send a request once the endpoint's limits allow it.
+
+        The request first waits for the endpoint's rate limit, the rate
+        limit shared by the processes on this machine, and the endpoint's
+        bulkhead and concurrency limit. It then waits for the dispatcher
+        of the API or web host, which sends queued requests in order of
+        priority, and for a concurrency slot shared by the processes on
+        this machine. Its outcome is reported back to the limits.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            query_params: The validated query parameters.
+            body_params: The validated body parameters.
+            headers: The request headers.
+            policy: The retry policy, which decides which HTTP status
+                codes are retryable.
+            remaining: Seconds left until the caller's deadline, if any.
+
+        Returns:
+            The httpx response object.
+        """
+        rate_limiter = self._get_rate_limiter(endpoint)
+        if rate_limiter is not None:
+            if not await rate_limiter.acquire(max_wait=remaining):
+                raise await self._deadline_exceeded(
+                    endpoint, url, "waiting for the rate limit of"
+                )
+            remaining = self._time_left()
+
+        host_limiter = self._host_limiter
+        if host_limiter is not None:
+            if not await host_limiter.acquire(max_wait=remaining):
+                raise await self._deadline_exceeded(
+                    endpoint, url, "waiting for the host's rate limit for"
+                )
+            remaining = self._time_left()
+
+        with ExitStack() as stack:
+            bulkhead = self._get_bulkhead(
+                endpoint, {**query_params, **body_params}
+            )
+            if bulkhead is not None:
+                await self._enter_bulkhead(
+                    endpoint, url, *bulkhead, remaining, stack
+                )
+                remaining = self._time_left()
+
+            concurrency = self._get_concurrency_limiter(endpoint)
+            if concurrency is not None:
+                if not await concurrency.acquire(max_wait=remaining):
+                    raise await self._deadline_exceeded(
+                        endpoint, url, "waiting for a concurrency slot of"
+                    )
+                remaining = self._time_left()
+
+            dispatcher = self._get_dispatcher(endpoint.url_type)
+            ready = False
+            try:
+                if not await dispatcher.acquire(
+                    max_wait=remaining,
+                    priority=request_priority.get(),
+                    tenant=request_tenant.get(),
+                ):
+                    raise await self._deadline_exceeded(
+                        endpoint, url, "waiting for a connection to"
+                    )
+                stack.callback(dispatcher.release)
+                remaining = self._time_left()
+
+                if host_limiter is not None:
+                    slot = await host_limiter.acquire_slot(
+                        max_wait=remaining
+                    )
+                    if slot is None:
+                        raise await self._deadline_exceeded(
+                            endpoint, url, "waiting for a host-wide slot for"
+                        )
+                    stack.callback(host_limiter.release_slot, slot)
+                    remaining = self._time_left()
+                ready = True
+            finally:
+                if not ready and concurrency is not None:
+                    concurrency.release()
+
+            started = time.monotonic()
+            latency: float | None = None
+            overloaded = False
+            try:
+                response = await self._exchange(
+                    endpoint=endpoint,
+                    url=url,
+                    query_params=query_params,
+                    body_params=body_params,
+                    headers=headers,
+                    policy=policy,
+                    remaining=remaining,
+                )
+                latency = time.monotonic() - started
+                if rate_limiter is not None:
+                    rate_limiter.observe(
+                        response.headers, response.status_code
+                    )
+                return response
+            except APIStatusError as e:
+                overloaded = e.status_code == 429 or e.status_code >= 500
+                if rate_limiter is not None:
+                    rate_limiter.observe(e.response.headers, e.status_code)
+                raise
+            except APITimeoutError:
+                overloaded = True
+                raise
+            finally:
+                if concurrency is not None:
+                    concurrency.release(latency, overloaded)
+
+    async def _exchange(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        query_params: dict[str, Any],
+        body_params: dict[str, Any],
+        headers: dict[str, str],
+        policy: RetryPolicy,
+        remaining: float | None,
+    ) -> httpx.Response:
+        """Send a request and turn its failure into a typed error.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            query_params: The validated query parameters.
+            body_params: The validated body parameters.
+            headers: The request headers.
+            policy: The retry policy, which decides which HTTP status
+                codes are retryable.
+            remaining: Seconds left until the caller's deadline, if any.
+
+        Returns:
+            The httpx response object.
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline expires
+                during the request.
+            APIStatusError: If the API answers with an error status.
+            APITimeoutError: If the request times out.
+            APIConnectionError: If the connection fails.
+            AgentAIError: If the request fails for any other reason.
+        """
+        try:
+            await self._logger.info(
+                f"Making {endpoint.method} request to {url}"
+            )
+            send = self._send(
+                endpoint=endpoint,
+                url=url,
+                query_params=query_params,
+                body_params=body_params,
+                headers=headers,
+                timeout=self._get_timeout(endpoint, remaining),
+            )
+            if remaining is None:
+                response = await send
+            else:
+                response = await asyncio.wait_for(send, remaining)
+            response.raise_for_status()
+            return response
+
+        except AgentAIError:
+            raise
+
+        except asyncio.TimeoutError as e:
+            # Only the deadline's wait_for raises asyncio.TimeoutError.
+            await self._logger.error("Deadline exceeded during request")
+            raise DeadlineExceededError(
+                "Deadline exceeded during request"
+            ) from e
+
+        except httpx.HTTPStatusError as e:
+            error_detail = f"HTTP error {e.response.status_code}"
+            try:
+                error_json = e.response.json()
+                error_detail = f"{error_detail}: {error_json}"
+            except Exception as exc:  # noqa: W0718
+                error_detail = f"Error parsing response: {str(exc)}"
+            await self._logger.error(f"API request failed: {error_detail}")
+            raise APIStatusError(
+                f"API request failed: {error_detail}",
+                response=e.response,
+                retryable=e.response.status_code in policy.retry_on_status,
+                retry_after=parse_retry_after(
+                    e.response.headers.get("Retry-After")
+                ),
+            ) from e
+
+        except httpx.TimeoutException as e:
+            left = self._time_left()
+            if left is not None and left <= 0:
+                await self._logger.error("Deadline exceeded during request")
+                raise DeadlineExceededError(
+                    "Deadline exceeded during request"
+                ) from e
+            await self._logger.error(f"API request timed out: {str(e)}")
+            raise APITimeoutError(
+                "API request timed out", retryable=True
+            ) from e
+
+        except httpx.TransportError as e:
+            await self._logger.error(f"HTTP error: {str(e)}")
+            raise APIConnectionError(
+                f"HTTP error: {str(e)}",
+                retryable=isinstance(
+                    e, httpx.NetworkError | httpx.RemoteProtocolError
+                ),
+            ) from e
+
+        except httpx.HTTPError as e:
+            await self._logger.error(f"HTTP error: {str(e)}")
+            raise APIError(f"HTTP error: {str(e)}") from e
+
+        except Exception as e:
+            await self._logger.error(f"Unexpected error: {str(e)}")
+            raise AgentAIError(f"Unexpected error: {str(e)}") from e
+
     async def _make_request(
         self, endpoint: Endpoint, data: dict[str, Any] | None = None
     ) -> httpx.Response:
         """Make a request to the agent.ai API.
 
+        Failed attempts at idempotent endpoints are retried according to
+        the endpoint's retry policy, within the client's retry budget.
+        Responses of idempotent endpoints with a cache policy are served
+        from the response cache while they are fresh, and concurrent
+        identical calls to endpoints that coalesce share one request.
+
         Args:
             endpoint: The API endpoint to call.
             data: Data to build the request body and query parameters.
@@ -148,18 +1511,17 @@ class AgentAIClient(_MethodRegistrarMixin):
             The httpx response object.
 
         Raises:
-            ValueError: If the request fails.
+            DeadlineExceededError: If the caller's deadline expires
+                before or during the request.
+            APIError: If the last attempt fails. See
+                :meth:`_attempt_request` for the subclasses raised.
+            ValueError: If a parameter is missing or invalid.
         """
         if data is None:
             data = {}
 
-        client = self._initialize_client()
-
         # Determine base URL based on endpoint type
-        if endpoint.url_type == UrlType.WEB:
-            base_url = self.config.web_url
-        else:
-            base_url = self.config.api_url
+        base_url = self._get_base_url(endpoint.url_type)
 
         url = f"{base_url}{endpoint.url}"
         query_params: dict[str, Any] = {}
@@ -190,45 +1552,238 @@ class AgentAIClient(_MethodRegistrarMixin):
         headers: dict[str, str] = {}
         headers["Content-Type"] = endpoint.request_content_type
         headers["Accept"] = endpoint.response_content_type
+        headers["Accept-Encoding"] = accept_encoding(
+            self.config.compression.response_encodings
+        )
 
+        api_key = api_key_override.get() or self.config.api_key
         if endpoint.requires_auth:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        send = functools.partial(
+            self._request_with_retries,
+            endpoint=endpoint,
+            url=url,
+            query_params=query_params,
+            body_params=body_params,
+            headers=headers,
+        )
+        if not endpoint.idempotent:
+            return await send()
+
+        key = cache_key(
+            endpoint,
+            query_params,
+            body_params,
+            api_key if endpoint.requires_auth else None,
+        )
+        if endpoint.cache is not None:
+            send = functools.partial(
+                self._cached_request,
+                endpoint.cache,
+                key,
+                httpx.Request(endpoint.method.value, url),
+                send,
+            )
+        if endpoint.coalesce:
+            return await self._coalesced_request(endpoint, url, key, send)
+        return await send()
+
+    async def _coalesced_request(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        key: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Make a request, or join the identical one already in flight.
+
+        The shared request is made without a deadline, because the
+        callers joining it may have different ones or none. Each caller
+        instead stops waiting when its own deadline expires. The
+        priority and tenant of the request are those of the caller that
+        started it.
+
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            key: The request's cache key, shared by identical requests.
+            send: Makes the request.
+
+        Returns:
+            The httpx response object.
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline expires
+                before the shared request finishes.
+        """
 
+        async def shared() -> httpx.Response:
+            with scoped_value(request_deadline, None):
+                return await send()
+
+        remaining = self._time_left()
         try:
-            await self._logger.info(
-                f"Making {endpoint.method} request to {url}"
+            return await self._single_flight.run(
+                key, shared, timeout=remaining
             )
-            response = await client.request(
-                method=endpoint.method.value,
-                url=url,
-                params=query_params,
-                json=body_params,
-                headers=headers,
+        except asyncio.TimeoutError:
+            if remaining is None:
+                raise
+            raise await self._deadline_exceeded(
+                endpoint, url, "waiting for a shared request to"
+            ) from None
+
+    def _count_cache(self, outcome: str) -> None:
+        """Count a hit, stale hit or miss of the response cache."""
+        with self._cache_lock:
+            self._cache_counts[outcome] += 1
+
+    def cache_stats(self) -> CacheStats:
+        """Get the counters of the response cache.
+
+        Returns:
+            The hits, stale hits, misses and evictions since the client
+            was created.
+        """
+        with self._cache_lock:
+            counts = dict(self._cache_counts)
+        return CacheStats(**counts, evictions=self._cache.evictions)
+
+    async def clear_cache(self) -> None:
+        """Drop every cached response and agent search result."""
+        await self._cache.clear()
+        self._agent_cache.clear()
+
+    def _agent_cache_key(
+        self, endpoint: Endpoint, data: dict[str, Any]
+    ) -> str:
+        """Build the agent cache key of a search.
+
+        Args:
+            endpoint: The endpoint that searches for agents.
+            data: The search filters.
+
+        Returns:
+            A key that differs per filters and API key.
+        """
+        api_key = api_key_override.get() or self.config.api_key
+        return cache_key(endpoint, {}, data, api_key)
+
+    async def _cached_request(
+        self,
+        policy: CachePolicy,
+        key: str,
+        request: httpx.Request,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Serve a request from the response cache, or send it.
+
+        Args:
+            policy: The cache policy of the endpoint.
+            key: The request's cache key.
+            request: The request, attached to cached responses.
+            send: Sends the request.
+
+        Returns:
+            The cached response while it is fresh, otherwise the new one.
+
+        Raises:
+            AgentAIError: If the request fails and there is no stale
+                response to serve instead.
+        """
+        try:
+            entry = await self._cache.get(key)
+        except Exception as e:  # noqa: W0718
+            # A broken cache must not fail the request
+            await self._logger.warning(f"Response cache failed: {str(e)}")
+            entry = None
+        if entry is not None and time.time() < entry.expires_at:
+            self._count_cache("hits")
+            return entry.to_response(request)
+        self._count_cache("misses")
+
+        try:
+            response = await send()
+        except AgentAIError as e:
+            transient = e.retryable or isinstance(
+                e, CircuitOpenError | BulkheadFullError | DeadlineExceededError
             )
-            response.raise_for_status()
-            return response
+            if entry is None or not transient:
+                raise
+            await self._logger.warning(
+                f"Serving a stale response for {request.url}: {str(e)}"
+            )
+            self._count_cache("stale_hits")
+            return entry.to_response(request)
 
-        except httpx.HTTPStatusError as e:
-            error_detail = f"HTTP error {e.response.status_code}"
+        if response.is_success:
+            now = time.time()
             try:
-                error_json = e.response.json()
-                error_detail = f"{error_detail}: {error_json}"
-            except Exception as exc:  # noqa: W0718
-                error_detail = f"Error parsing response: {str(exc)}"
-            await self._logger.error(f"API request failed: {error_detail}")
-            raise ValueError(f"API request failed: {error_detail}") from e
+                await self._cache.set(
+                    key,
+                    CacheEntry.from_response(
+                        response,
+                        expires_at=now + policy.ttl,
+                        stale_until=now + policy.ttl + policy.stale_if_error,
+                    ),
+                )
+            except Exception as e:  # noqa: W0718
+                await self._logger.warning(
+                    f"Response cache failed: {str(e)}"
+                )
+        return response
 
-        except httpx.TimeoutException as e:
-            await self._logger.error(f"API request timed out: {str(e)}")
-            raise ValueError("API request timed out") from e
+    async def _request_with_retries(
+        self,
+        endpoint: Endpoint,
+        url: str,
+        query_params: dict[str, Any],
+        body_params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send a request, retrying failed attempts.
 
-        except httpx.HTTPError as e:
-            await self._logger.error(f"HTTP error: {str(e)}")
-            raise ValueError(f"HTTP error: {str(e)}") from e
+        Failed attempts at idempotent endpoints are retried according to
+        the endpoint's retry policy, within the client's retry budget.
 
-        except Exception as e:
-            await self._logger.error(f"Unexpected error: {str(e)}")
-            raise ValueError(f"Unexpected error: {str(e)}") from e
+        Args:
+            endpoint: The API endpoint to call.
+            url: The full URL of the request.
+            query_params: The validated query parameters.
+            body_params: The validated body parameters.
+            headers: The request headers.
+
+        Returns:
+            The httpx response object.
+        """
+        policy = endpoint.retry or self.config.retry
+        max_attempts = policy.max_attempts if endpoint.idempotent else 1
+        self._retry_budget.record_request()
+
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt_request(
+                    endpoint=endpoint,
+                    url=url,
+                    query_params=query_params,
+                    body_params=body_params,
+                    headers=headers,
+                    policy=policy,
+                )
+            except AgentAIError as e:
+                delay = await self._get_retry_delay(
+                    policy, e, attempt, max_attempts
+                )
+                if delay is None:
+                    raise
+                await self._logger.warning(
+                    f"Retrying request to {url} in {delay:.2f}s after "
+                    f"attempt {attempt}/{max_attempts} failed: {str(e)}"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
 
 
 # This import will trigger the registration of decorated methods.
@@ -1,14 +1,23 @@
 # pyagentai/client.pyi
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
 from typing import Any, TypeVar
 
 import httpx
 
 from pyagentai.config.agentai_config import AgentAIConfig
 from pyagentai.types.agent_info import AgentInfo
+from pyagentai.types.cache import CacheStats
+from pyagentai.types.circuit_breaker import CircuitState
+from pyagentai.types.concurrency import ConcurrencyStats, TenantStats
+from pyagentai.types.priority import RequestPriority
+from pyagentai.types.request_timings import RequestTimings
 from pyagentai.types.url_endpoint import Endpoint
+from pyagentai.utils.agent_catalog import AgentCatalog
+from pyagentai.utils.compression import TransferStats
 
 T = TypeVar("T", bound=Callable[..., Awaitable[Any]])
+TimingHook = Callable[[RequestTimings], Awaitable[None] | None]
 
 class AgentAIClient:
     """
@@ -21,20 +30,48 @@ class AgentAIClient:
 
     # --- Statically defined attributes ---
     config: AgentAIConfig
+    transfer_stats: TransferStats
     _logger: Any
+    _agent_cache: AgentCatalog
 
     # --- Statically defined methods ---
     def __init__(
         self,
         api_key: str | None = None,
         config: AgentAIConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None: ...
     async def close(self) -> None: ...
+    async def warmup(
+        self,
+        connections: int | None = None,
+        keepalive_interval: float | None = None,
+    ) -> None: ...
+    def add_timing_hook(self, hook: TimingHook) -> None: ...
+    def remove_timing_hook(self, hook: TimingHook) -> None: ...
+    def concurrency_stats(self) -> dict[str, ConcurrencyStats]: ...
+    def circuit_states(self) -> dict[str, CircuitState]: ...
+    def tenant_stats(self) -> dict[str | None, TenantStats]: ...
+    def cache_stats(self) -> CacheStats: ...
+    async def clear_cache(self) -> None: ...
+    def deadline(
+        self, seconds: float
+    ) -> AbstractContextManager[float]: ...
+    def as_tenant(
+        self, api_key: str
+    ) -> AbstractContextManager[AgentAIClient]: ...
+    def priority(
+        self, priority: RequestPriority
+    ) -> AbstractContextManager[RequestPriority]: ...
+    def tenant(self, tenant_id: str) -> AbstractContextManager[str]: ...
 
     # --- Internal methods used by registered functions ---
     async def _make_request(
         self, endpoint: Endpoint, data: dict[str, Any] | None = None
     ) -> httpx.Response: ...
+    def _agent_cache_key(
+        self, endpoint: Endpoint, data: dict[str, Any]
+    ) -> str: ...
 
     # --- Class methods for dynamic registration ---
     @classmethod
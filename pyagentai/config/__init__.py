@@ -1,6 +1,13 @@
 """Configuration for agent.ai integration."""
 
 from pyagentai.config.agentai_config import AgentAIConfig
-from pyagentai.config.agentai_endpoints import AgentAIEndpoints
+from pyagentai.config.agentai_endpoints import (
+    AgentAIEndpoints,
+    get_default_endpoints,
+)
 
-__all__: list[str] = ["AgentAIEndpoints", "AgentAIConfig"]
+__all__: list[str] = [
+    "AgentAIEndpoints",
+    "AgentAIConfig",
+    "get_default_endpoints",
+]
@@ -1,14 +1,29 @@
 import os
 
+import httpx
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat
 
-from .agentai_endpoints import AgentAIEndpoints
+from pyagentai.types.policies import (
+    HostLimitPolicy,
+    RetryBudgetPolicy,
+    RetryPolicy,
+)
+from pyagentai.types.transport import (
+    CompressionConfig,
+    ConnectionPoolConfig,
+    TransportMode,
+)
+from pyagentai.utils.cache import CacheBackend
+
+from .agentai_endpoints import AgentAIEndpoints, get_default_endpoints
 
 
 class AgentAIConfig(BaseModel):
     """Configuration for the agent.ai client."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     api_url: str = Field(
         default=os.getenv("AGENTAI_API_URL", "https://api-lr.agent.ai/v1"),
         description="Base URL for the agent.ai API",
@@ -24,8 +39,152 @@ class AgentAIConfig(BaseModel):
     timeout: float = Field(
         default=60.0, description="Timeout in seconds for API requests"
     )
+    api_pool: ConnectionPoolConfig = Field(
+        default_factory=ConnectionPoolConfig,
+        description="Connection pool limits for the API host (api_url)",
+    )
+    web_pool: ConnectionPoolConfig = Field(
+        default_factory=ConnectionPoolConfig,
+        description="Connection pool limits for the web host (web_url)",
+    )
+    transport_mode: TransportMode = Field(
+        default=TransportMode.HTTP2,
+        description=(
+            "How requests are spread over connections: an HTTP/1.1 pool, "
+            "a single HTTP/2 connection, or striped HTTP/2 connections"
+        ),
+    )
+    http2_stripes: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Number of HTTP/2 connections per host in the http2_striped "
+            "transport mode"
+        ),
+    )
+    uds_path: str | None = Field(
+        default=None,
+        description=(
+            "Path of a Unix domain socket to send all requests through, "
+            "e.g. to a local caching or egress sidecar"
+        ),
+    )
+    transport: httpx.AsyncBaseTransport | None = Field(
+        default=None,
+        exclude=True,
+        description=(
+            "Custom httpx transport for all requests. It is owned by the "
+            "caller, who must close it; pool, transport mode and "
+            "uds_path settings do not apply to it"
+        ),
+    )
+    compression: CompressionConfig = Field(
+        default_factory=CompressionConfig,
+        description="Compression settings for requests and responses",
+    )
+    share_transport: bool = Field(
+        default=False,
+        description=(
+            "Whether to share connection pools with other clients that "
+            "use the same base URL and transport settings"
+        ),
+    )
+    warmup_connections: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of connections warmup() opens to each host. With "
+            "HTTP/2 a single connection carries all concurrent requests"
+        ),
+    )
+    keepalive_ping_interval: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Seconds between keep-alive pings started by warmup(). Should "
+            "be shorter than the pools' keepalive_expiry. None disables "
+            "pings"
+        ),
+    )
+    max_in_flight: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Requests sent to each host at once. Further requests queue "
+            "and are dispatched by priority. None uses the host pool's "
+            "max_connections with HTTP/1.1 and no limit with HTTP/2"
+        ),
+    )
+    priority_aging_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description=(
+            "Seconds a queued request waits before its priority is raised "
+            "by one level, so that low-priority work is not starved"
+        ),
+    )
+    tenant_weights: dict[str, PositiveFloat] = Field(
+        default_factory=dict,
+        description=(
+            "Share of the queued throughput each tenant ID gets, relative "
+            "to the default weight of 1"
+        ),
+    )
+    host_limit: HostLimitPolicy | None = Field(
+        default=None,
+        description=(
+            "Rate and concurrency limit shared by every process on the "
+            "host that uses the same path"
+        ),
+    )
+    cache_backend: CacheBackend | None = Field(
+        default=None,
+        exclude=True,
+        description=(
+            "Storage of cached responses. None keeps them in memory, "
+            "bounded by cache_max_entries and cache_max_bytes"
+        ),
+    )
+    cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description="Most responses kept by the in-memory cache",
+    )
+    cache_max_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Most bytes of responses kept by the in-memory cache. None "
+            "sets no limit"
+        ),
+    )
+    agent_cache_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Seconds find_agents results stay fresh. Stale results are "
+            "served while they are refreshed in the background. 0 "
+            "disables the cache"
+        ),
+    )
+    agent_cache_max_entries: int = Field(
+        default=128,
+        ge=1,
+        description="Most distinct agent searches kept in the cache",
+    )
+    retry: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description=(
+            "Retry policy for idempotent endpoints that do not set their "
+            "own"
+        ),
+    )
+    retry_budget: RetryBudgetPolicy = Field(
+        default_factory=RetryBudgetPolicy,
+        description="Cap on retries as a fraction of recent traffic",
+    )
     endpoints: AgentAIEndpoints = Field(
-        default_factory=lambda: AgentAIEndpoints(),
+        default_factory=get_default_endpoints,
         description="API endpoints configuration",
     )
 
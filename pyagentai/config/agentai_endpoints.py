@@ -1,6 +1,9 @@
 """Configuration for agent.ai API endpoints."""
 
-from pydantic import BaseModel, Field
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from pyagentai.types.url_endpoint import (
     Endpoint,
@@ -12,7 +15,15 @@ from pyagentai.types.url_endpoint import (
 
 
 class AgentAIEndpoints(BaseModel):
-    """Endpoints for agent.ai API."""
+    """Endpoints for agent.ai API.
+
+    The registry is immutable, so one instance (see
+    :func:`get_default_endpoints`) is shared by reference between all
+    configurations that do not customize their endpoints. Use
+    :meth:`with_overrides` to derive a customized registry.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     find_agents: Endpoint = Field(
         default=Endpoint(
@@ -24,15 +35,17 @@ class AgentAIEndpoints(BaseModel):
                 "criteria including status, tags, and search terms."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="status",
                     param_type=ParameterType.STRING,
                     required=False,
                     description="Filter agents by their visibility status.",
-                    allowed_values=["any", "public", "private"],
+                    allowed_values=("any", "public", "private"),
                     validate_parameter=True,
                 ),
                 EndpointParameter(
@@ -69,7 +82,7 @@ class AgentAIEndpoints(BaseModel):
                     ),
                     validate_parameter=False,
                 ),
-            ],
+            ),
         ),
     )
 
@@ -82,9 +95,11 @@ class AgentAIEndpoints(BaseModel):
                 "Extract text content from a specified web page or domain."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="url",
                     param_type=ParameterType.STRING,
@@ -100,10 +115,10 @@ class AgentAIEndpoints(BaseModel):
                         "Crawler mode: 'scrape' for one page,"
                         " 'crawl' for up to 100 pages."
                     ),
-                    allowed_values=["scrape", "crawl"],
+                    allowed_values=("scrape", "crawl"),
                     validate_parameter=True,
                 ),
-            ],
+            ),
         ),
     )
 
@@ -117,9 +132,11 @@ class AgentAIEndpoints(BaseModel):
                 "documentation or analysis."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="url",
                     param_type=ParameterType.STRING,
@@ -134,10 +151,10 @@ class AgentAIEndpoints(BaseModel):
                     description=(
                         "Cache expiration time for the screenshot in seconds."
                     ),
-                    allowed_values=[3600, 86400, 604800, 18144000],
+                    allowed_values=(3600, 86400, 604800, 18144000),
                     validate_parameter=True,
                 ),
-            ],
+            ),
         ),
     )
 
@@ -151,17 +168,19 @@ class AgentAIEndpoints(BaseModel):
                 " the video URL."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="url",
                     param_type=ParameterType.STRING,
                     required=True,
                     description="URL of the YouTube video.",
                     validate_parameter=False,
-                )
-            ],
+                ),
+            ),
         ),
     )
 
@@ -175,17 +194,19 @@ class AgentAIEndpoints(BaseModel):
                 " including its videos and statistics."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="url",
                     param_type=ParameterType.STRING,
                     required=True,
                     description="URL of the YouTube channel.",
                     validate_parameter=False,
-                )
-            ],
+                ),
+            ),
         ),
     )
 
@@ -199,9 +220,11 @@ class AgentAIEndpoints(BaseModel):
                 " specific keywords for targeted social media analysis."
             ),
             requires_auth=True,
+            idempotent=True,
+            coalesce=True,
             response_content_type="application/json",
             request_content_type="application/json",
-            body_parameters=[
+            body_parameters=(
                 EndpointParameter(
                     name="keywords",
                     param_type=ParameterType.STRING,
@@ -214,9 +237,60 @@ class AgentAIEndpoints(BaseModel):
                     param_type=ParameterType.INTEGER,
                     required=True,
                     description="Number of user profiles to retrieve.",
-                    allowed_values=[1, 5, 10, 25, 50, 100],
+                    allowed_values=(1, 5, 10, 25, 50, 100),
                     validate_parameter=True,
                 ),
-            ],
+            ),
         ),
     )
+
+    def with_overrides(
+        self, **overrides: Endpoint | dict[str, Any]
+    ) -> "AgentAIEndpoints":
+        """Create a copy of the registry with some endpoints replaced.
+
+        This is a copy-on-write operation: endpoints that are not
+        overridden are shared with this registry rather than copied.
+
+        Example:
+            .. code-block:: python
+
+                endpoints = get_default_endpoints().with_overrides(
+                    find_agents={"url": "/v2/action/find_agents"},
+                )
+
+        Args:
+            **overrides: Endpoints to replace, by name. A value can be a
+                complete ``Endpoint`` or a mapping of the endpoint fields
+                to change.
+
+        Returns:
+            A new endpoint registry.
+
+        Raises:
+            ValueError: If an override names an unknown endpoint.
+        """
+        updates: dict[str, Endpoint] = {}
+        for name, override in overrides.items():
+            current = getattr(self, name, None)
+            if not isinstance(current, Endpoint):
+                raise ValueError(f"Unknown endpoint: '{name}'")
+            if isinstance(override, Endpoint):
+                updates[name] = override
+            else:
+                updates[name] = current.with_overrides(**override)
+
+        return self.model_copy(update=updates)
+
+
+@cache
+def get_default_endpoints() -> AgentAIEndpoints:
+    """Get the shared default endpoint registry.
+
+    The registry is built and validated once per process; every call
+    returns the same immutable instance.
+
+    Returns:
+        The default endpoint registry.
+    """
+    return AgentAIEndpoints()
@@ -0,0 +1,92 @@
+"""Exceptions raised by the agent.ai client.
+
+All exceptions derive from :class:`AgentAIError`, which is a
+``ValueError`` so that code written against earlier versions of the
+client, which raised plain ``ValueError`` for every failure, keeps
+working.
+"""
+
+import httpx
+
+
+class AgentAIError(ValueError):
+    """Base class for errors raised by the agent.ai client.
+
+    Attributes:
+        retryable: Whether the failed request may succeed if repeated.
+    """
+
+    retryable: bool = False
+
+
+class DeadlineExceededError(AgentAIError):
+    """The caller's deadline expired before the request could complete."""
+
+
+class CircuitOpenError(AgentAIError):
+    """The endpoint's circuit breaker is open, so no request was sent.
+
+    Attributes:
+        retry_after: Seconds until the breaker lets a trial request
+            through.
+    """
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BulkheadFullError(AgentAIError):
+    """The endpoint's bulkhead had no free slots, so no request was sent."""
+
+
+class APIError(AgentAIError):
+    """A request to the agent.ai API failed.
+
+    Attributes:
+        retryable: Whether the failed request may succeed if repeated.
+        retry_after: Seconds the server asked to wait before retrying,
+            if it said so.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class APIStatusError(APIError):
+    """The API answered with an HTTP error status.
+
+    Attributes:
+        status_code: The HTTP status code of the response.
+        response: The error response.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        response: httpx.Response,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(
+            message, retryable=retryable, retry_after=retry_after
+        )
+        self.response = response
+        self.status_code = response.status_code
+
+
+class APITimeoutError(APIError):
+    """A request timed out before the API answered."""
+
+
+class APIConnectionError(APIError):
+    """The API could not be reached or the connection failed."""
@@ -0,0 +1,226 @@
+"""Synchronous client for interacting with agent.ai API."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.priority import RequestPriority
+from pyagentai.utils.compression import TransferStats
+
+R = TypeVar("R")
+
+
+class SyncAgentAIClient:
+    """Blocking facade over :class:`AgentAIClient`.
+
+    Every method registered on ``AgentAIClient`` (``find_agents``,
+    ``grab_web_text``, ...) is available here as a blocking call. All
+    calls run on one long-lived event loop in a background thread, so
+    connection pools and caches survive between calls, and any number of
+    threads can submit calls at the same time.
+
+    Example:
+        .. code-block:: python
+
+            with SyncAgentAIClient(api_key="your_agentai_api_key") as ag:
+                agents = ag.find_agents(limit=10)
+
+    Attributes:
+        client: The asynchronous client the calls are delegated to.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        config: AgentAIConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the client and start its background event loop.
+
+        Args:
+            api_key: The API key for authenticating with agent.ai.
+                If provided, overrides the key in the config.
+            config: The configuration for the client.
+                If not provided, a default configuration is used.
+            transport: A custom httpx transport to send requests through.
+                The transport is not closed by :meth:`close`.
+        """
+        self.client = AgentAIClient(
+            api_key=api_key, config=config, transport=transport
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="pyagentai-sync-client",
+            daemon=True,
+        )
+        self._thread.start()
+        self._close_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def config(self) -> AgentAIConfig:
+        """The configuration of the underlying client."""
+        return self.client.config
+
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Bytes sent and received by the underlying client."""
+        return self.client.transfer_stats
+
+    def _run(
+        self,
+        func: Callable[..., Coroutine[Any, Any, R]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R:
+        """Run a coroutine function on the background loop and wait for it.
+
+        Context variables of the calling thread, such as those set by
+        :meth:`as_tenant` and :meth:`deadline`, are carried over to the
+        background loop.
+
+        Args:
+            func: The coroutine function to run.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The result of the coroutine.
+
+        Raises:
+            RuntimeError: If the client is closed, or if called from the
+                background loop itself, which would deadlock.
+        """
+        if self._closed:
+            raise RuntimeError("Client is closed.")
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "Blocking calls cannot be made from the client's own "
+                "event loop; use the async client instead."
+            )
+
+        caller_context = contextvars.copy_context()
+
+        async def run_in_caller_context() -> R:
+            for var, value in caller_context.items():
+                var.set(value)
+            return await func(*args, **kwargs)
+
+        future = asyncio.run_coroutine_threadsafe(
+            run_in_caller_context(), self._loop
+        )
+        return future.result()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Expose the registered API methods as blocking calls.
+
+        Args:
+            name: The name of the registered method.
+
+        Returns:
+            A blocking wrapper around the registered method.
+
+        Raises:
+            AttributeError: If no method with this name is registered.
+        """
+        method = AgentAIClient._registered.get(name)
+        if method is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        @functools.wraps(method)
+        def blocking_method(*args: Any, **kwargs: Any) -> Any:
+            return self._run(method, self.client, *args, **kwargs)
+
+        return blocking_method
+
+    def warmup(
+        self,
+        connections: int | None = None,
+        keepalive_interval: float | None = None,
+    ) -> None:
+        """Pre-resolve and pre-connect to the API and web hosts.
+
+        See :meth:`AgentAIClient.warmup`.
+        """
+        self._run(self.client.warmup, connections, keepalive_interval)
+
+    @contextmanager
+    def as_tenant(self, api_key: str) -> Iterator["SyncAgentAIClient"]:
+        """Use a different API key for calls made within a block.
+
+        See :meth:`AgentAIClient.as_tenant`.
+        """
+        with self.client.as_tenant(api_key):
+            yield self
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[float]:
+        """Bound every call made within a block by a shared deadline.
+
+        See :meth:`AgentAIClient.deadline`.
+        """
+        with self.client.deadline(seconds) as deadline:
+            yield deadline
+
+    @contextmanager
+    def priority(
+        self, priority: RequestPriority
+    ) -> Iterator[RequestPriority]:
+        """Set the priority of calls made within a block.
+
+        See :meth:`AgentAIClient.priority`.
+        """
+        with self.client.priority(priority):
+            yield priority
+
+    @contextmanager
+    def tenant(self, tenant_id: str) -> Iterator[str]:
+        """Queue calls made within a block fairly with other tenants.
+
+        See :meth:`AgentAIClient.tenant`.
+        """
+        with self.client.tenant(tenant_id):
+            yield tenant_id
+
+    def close(self) -> None:
+        """Close the client and stop its background event loop.
+
+        Calling this more than once is safe.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.client.close(), self._loop
+                ).result()
+            finally:
+                self._closed = True
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+
+    def __enter__(self) -> "SyncAgentAIClient":
+        """Enter a ``with`` block that closes the client on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client."""
+        self.close()
@@ -0,0 +1,115 @@
+# pyagentai/sync_client.pyi
+from collections.abc import Callable, Coroutine
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.agent_info import AgentInfo
+from pyagentai.types.priority import RequestPriority
+from pyagentai.utils.compression import TransferStats
+
+R = TypeVar("R")
+
+class SyncAgentAIClient:
+    """
+    Type stub for SyncAgentAIClient.
+
+    This file provides type hints for the blocking counterparts of the
+    methods that are dynamically registered on AgentAIClient.
+    """
+
+    # --- Statically defined attributes ---
+    client: AgentAIClient
+    @property
+    def config(self) -> AgentAIConfig: ...
+    @property
+    def transfer_stats(self) -> TransferStats: ...
+
+    # --- Statically defined methods ---
+    def __init__(
+        self,
+        api_key: str | None = None,
+        config: AgentAIConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None: ...
+    def close(self) -> None: ...
+    def warmup(
+        self,
+        connections: int | None = None,
+        keepalive_interval: float | None = None,
+    ) -> None: ...
+    def deadline(
+        self, seconds: float
+    ) -> AbstractContextManager[float]: ...
+    def as_tenant(
+        self, api_key: str
+    ) -> AbstractContextManager[SyncAgentAIClient]: ...
+    def priority(
+        self, priority: RequestPriority
+    ) -> AbstractContextManager[RequestPriority]: ...
+    def tenant(self, tenant_id: str) -> AbstractContextManager[str]: ...
+    def __enter__(self) -> SyncAgentAIClient: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
+    # --- Internal methods ---
+    def _run(
+        self,
+        func: Callable[..., Coroutine[Any, Any, R]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R: ...
+
+    # --- Blocking versions of the registered methods ---
+    # --- Find Agents ---
+    def find_agents(
+        self,
+        status: str | None = None,
+        slug: str | None = None,
+        query: str | None = None,
+        tag: str | None = None,
+        intent: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[AgentInfo]: ...
+
+    # --- Grab Web Text ---
+    def grab_web_text(
+        self,
+        url: str,
+        mode: str = "scrape",
+    ) -> tuple[str, dict]: ...
+
+    # --- Grab Web Screenshot ---
+    def grab_web_screenshot(
+        self,
+        url: str,
+        ttl_for_screenshot: int = 3600,
+    ) -> str: ...
+
+    # --- Get YouTube Transcript ---
+    def get_youtube_transcript(
+        self,
+        url: str,
+    ) -> tuple[str, dict]: ...
+
+    # --- Get YouTube Channel ---
+    def get_youtube_channel(
+        self,
+        url: str,
+    ) -> dict: ...
+
+    # --- Get Twitter Users ---
+    def get_twitter_users(
+        self,
+        keywords: str,
+        num_users: int = 1,
+    ) -> list[str]: ...
@@ -0,0 +1,93 @@
+"""Types describing the response cache."""
+import httpx
+from pydantic import BaseModel, Field
+
+# Headers that describe the encoded body, which is cached decoded.
+_ENCODING_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class CacheEntry(BaseModel):
+    """A cached response and the times it stays usable."""
+
+    status_code: int = Field(description="Response status code")
+    headers: list[tuple[str, str]] = Field(
+        description="Response headers, without those of the encoding"
+    )
+    content: bytes = Field(description="Decoded response body")
+    expires_at: float = Field(
+        description="Unix time after which the response is stale"
+    )
+    stale_until: float = Field(
+        description=(
+            "Unix time after which the response may no longer be served, "
+            "even if a fresh request fails"
+        )
+    )
+
+    @classmethod
+    def from_response(
+        cls, response: httpx.Response, expires_at: float, stale_until: float
+    ) -> "CacheEntry":
+        """Create an entry from a response whose body has been read.
+
+        Args:
+            response: The response to cache.
+            expires_at: Unix time after which the response is stale.
+            stale_until: Unix time after which it may not be served.
+
+        Returns:
+            The entry.
+        """
+        return cls(
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _ENCODING_HEADERS
+            ],
+            content=response.content,
+            expires_at=expires_at,
+            stale_until=stale_until,
+        )
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes the entry takes."""
+        return len(self.content) + sum(
+            len(name) + len(value) for name, value in self.headers
+        )
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild the cached response.
+
+        Args:
+            request: The request the response answers.
+
+        Returns:
+            A response with the cached status, headers and body.
+        """
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class CacheStats(BaseModel):
+    """Counters of the response cache."""
+
+    hits: int = Field(description="Requests served a fresh cached response")
+    stale_hits: int = Field(
+        description=(
+            "Requests that failed and were served a stale cached response"
+        )
+    )
+    misses: int = Field(
+        description="Requests that found no fresh cached response"
+    )
+    evictions: int = Field(
+        description="Entries removed to keep the cache within its size"
+    )
@@ -0,0 +1,13 @@
+"""Types describing circuit breakers."""
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests flow normally."""
+    OPEN = "open"
+    """Requests fail fast."""
+    HALF_OPEN = "half_open"
+    """A limited number of trial requests probe for recovery."""
@@ -0,0 +1,30 @@
+"""Types describing concurrency limits."""
+from pydantic import BaseModel, Field
+
+
+class ConcurrencyStats(BaseModel):
+    """Snapshot of an adaptive concurrency limit."""
+
+    limit: int = Field(description="Requests currently allowed at once")
+    in_flight: int = Field(description="Requests currently being sent")
+    waiting: int = Field(description="Requests waiting for a slot")
+    latency: float | None = Field(
+        default=None,
+        description=(
+            "Smoothed latency of successful requests in seconds, the "
+            "signal the limit adapts to"
+        ),
+    )
+
+
+class TenantStats(BaseModel):
+    """Snapshot of one tenant's share of a client's request queue."""
+
+    queued: int = Field(description="Requests waiting to be sent")
+    dispatched: int = Field(description="Requests sent so far")
+    mean_wait: float = Field(
+        description="Mean seconds requests waited in the queue"
+    )
+    max_wait: float = Field(
+        description="Longest seconds a request waited in the queue"
+    )
@@ -0,0 +1,449 @@
+"""Per-endpoint request policies."""
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+
+class TimeoutPolicy(BaseModel):
+    """Timeouts for an endpoint, split by phase.
+
+    Each timeout is in seconds. A phase left as None falls back to the
+    client-wide ``AgentAIConfig.timeout``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    connect: float | None = Field(
+        default=None, gt=0, description="Timeout for opening a connection"
+    )
+    read: float | None = Field(
+        default=None,
+        gt=0,
+        description="Timeout for each read of the response",
+    )
+    write: float | None = Field(
+        default=None,
+        gt=0,
+        description="Timeout for each write of the request",
+    )
+    pool: float | None = Field(
+        default=None,
+        gt=0,
+        description="Timeout for acquiring a connection from the pool",
+    )
+
+
+class RetryPolicy(BaseModel):
+    """Retries of failed requests to an endpoint.
+
+    Failed attempts are retried after an exponential backoff with full
+    jitter: the n-th retry waits a random time between zero and
+    ``min(max_backoff, initial_backoff * multiplier ** (n - 1))`` seconds.
+    A ``Retry-After`` header on the response takes precedence over the
+    backoff. Only endpoints marked as idempotent are retried.
+
+    The default policy makes a single attempt, so retries are opt-in:
+    raise ``max_attempts`` to enable them. Timeouts are only retried with
+    ``retry_on_timeout``, since each retry can wait as long again.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Maximum number of attempts, including the first. 1 disables "
+            "retries"
+        ),
+    )
+    initial_backoff: float = Field(
+        default=0.1, gt=0, description="Backoff before the first retry"
+    )
+    max_backoff: float = Field(
+        default=10.0, gt=0, description="Upper bound of any backoff"
+    )
+    multiplier: float = Field(
+        default=2.0,
+        ge=1,
+        description="Factor the backoff grows by after each retry",
+    )
+    jitter: bool = Field(
+        default=True,
+        description="Whether to randomize each backoff (full jitter)",
+    )
+    retry_on_status: tuple[int, ...] = Field(
+        default=(408, 425, 429, 500, 502, 503, 504),
+        description="HTTP status codes that are retried",
+    )
+    retry_on_timeout: bool = Field(
+        default=False,
+        description="Whether requests that timed out are retried",
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to wait as long as a Retry-After header asks",
+    )
+    max_retry_after: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Longest Retry-After that is waited for. Requests asked to "
+            "wait longer fail instead"
+        ),
+    )
+
+
+class RetryBudgetPolicy(BaseModel):
+    """Client-wide cap on retries, as a fraction of recent traffic.
+
+    Over a sliding window, retries may not exceed ``ratio`` times the
+    number of requests plus a fixed allowance of
+    ``min_retries_per_second`` per second, so that retries cannot
+    multiply the load on an API that is already failing.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ratio: float = Field(
+        default=0.2,
+        ge=0,
+        description="Retries allowed per request made in the window",
+    )
+    min_retries_per_second: float = Field(
+        default=10.0,
+        ge=0,
+        description="Retries allowed per second regardless of traffic",
+    )
+    window: int = Field(
+        default=10,
+        ge=1,
+        description="Length of the sliding window in seconds",
+    )
+
+
+class RateLimitPolicy(BaseModel):
+    """Client-side rate limit of an endpoint, as a token bucket.
+
+    Requests wait locally for a token instead of being sent and rejected
+    with a 429. When the API reports its limits in ``RateLimit-*`` or
+    ``X-RateLimit-*`` response headers, the bucket follows them instead
+    of the configured rate.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    rate: float = Field(gt=0, description="Requests allowed per second")
+    burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may be sent at once after a lull",
+    )
+    per_credential: bool = Field(
+        default=True,
+        description=(
+            "Whether each API key gets its own bucket, rather than one "
+            "bucket shared by all keys"
+        ),
+    )
+    adapt_to_headers: bool = Field(
+        default=True,
+        description=(
+            "Whether to follow the rate limit headers and Retry-After of "
+            "the API's responses"
+        ),
+    )
+
+
+class ConcurrencyPolicy(BaseModel):
+    """Adaptive limit on concurrent requests to an endpoint.
+
+    The limit grows additively while latency stays stable and shrinks
+    multiplicatively on 429s, 5xx responses, timeouts or latency spikes
+    (AIMD), so it tracks what the API can currently sustain. The limits
+    must satisfy ``min_limit <= initial_limit <= max_limit``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    initial_limit: int = Field(
+        default=20, ge=1, description="Concurrency limit to start with"
+    )
+    min_limit: int = Field(
+        default=1, ge=1, description="Lowest the limit may fall to"
+    )
+    max_limit: int = Field(
+        default=200, ge=1, description="Highest the limit may grow to"
+    )
+    increase: float = Field(
+        default=1.0,
+        gt=0,
+        description="Growth of the limit per window of successful requests",
+    )
+    backoff_ratio: float = Field(
+        default=0.9,
+        gt=0,
+        lt=1,
+        description="Factor the limit is cut by on overload",
+    )
+    latency_tolerance: float = Field(
+        default=2.0,
+        gt=1,
+        description=(
+            "How many times the smoothed latency a request may take "
+            "before it counts as a latency spike"
+        ),
+    )
+    smoothing: float = Field(
+        default=0.1,
+        gt=0,
+        le=1,
+        description="Weight of each new sample in the smoothed latency",
+    )
+
+    @model_validator(mode="after")
+    def _check_limits(self) -> "ConcurrencyPolicy":
+        """Check that the initial limit lies within the bounds."""
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "Expected min_limit <= initial_limit <= max_limit, got "
+                f"{self.min_limit}, {self.initial_limit}, {self.max_limit}"
+            )
+        return self
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """Circuit breaker that fails fast while an endpoint is failing.
+
+    After ``failure_threshold`` consecutive failures (5xx responses,
+    timeouts or connection errors) the circuit opens and requests fail
+    at once with ``CircuitOpenError``. After ``open_duration`` it lets
+    up to ``half_open_max_calls`` trial requests through, and closes
+    again once ``success_threshold`` of them succeed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failures that open the circuit",
+    )
+    open_duration: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds the circuit stays open before a trial",
+    )
+    half_open_max_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Trial requests allowed at once while half-open",
+    )
+    success_threshold: int = Field(
+        default=1,
+        ge=1,
+        description="Successful trial requests that close the circuit",
+    )
+
+
+class HedgePolicy(BaseModel):
+    """Hedged requests to an idempotent endpoint.
+
+    If no response has arrived by the given percentile of the endpoint's
+    recent latencies, a duplicate request is sent. Whichever response
+    arrives first is used and the other request is cancelled. Hedging
+    only applies to endpoints marked as idempotent.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Latency percentile after which a hedge is sent",
+    )
+    max_hedges: int = Field(
+        default=1, ge=1, description="Most hedges sent for one request"
+    )
+    max_hedge_ratio: float = Field(
+        default=0.1,
+        gt=0,
+        le=1,
+        description="Most hedges sent per request, across all requests",
+    )
+    min_hedges_per_second: float = Field(
+        default=1.0,
+        ge=0,
+        description=(
+            "Hedges allowed per second regardless of traffic, so that "
+            "hedging also works for rarely called endpoints"
+        ),
+    )
+    initial_delay: float = Field(
+        default=1.0,
+        gt=0,
+        description=(
+            "Delay before a hedge while too few latencies are known to "
+            "compute the percentile"
+        ),
+    )
+    min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Latencies needed before the percentile is used",
+    )
+    sample_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of recent latencies the percentile is over",
+    )
+
+
+class BulkheadPolicy(BaseModel):
+    """Bulkhead that isolates an endpoint's concurrent requests.
+
+    Each endpoint with a bulkhead gets its own pool of ``slots``, and
+    every call takes ``cost`` of them, so a flood of calls to one
+    endpoint cannot take the capacity other endpoints need. Costs can
+    depend on a request parameter, e.g. ``mode`` of ``grab_web_text``,
+    and each value of that parameter can get a pool of its own.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    slots: int = Field(ge=1, description="Slots in the bulkhead's pool")
+    cost: int = Field(
+        default=1,
+        ge=1,
+        description="Slots a call takes unless costs says otherwise",
+    )
+    parameter: str | None = Field(
+        default=None,
+        description=(
+            "Request parameter whose value selects the cost and, with "
+            "partition, the pool"
+        ),
+    )
+    costs: tuple[tuple[str, int], ...] = Field(
+        default=(),
+        description=(
+            "Slots a call takes, by value of the parameter. A mapping is "
+            "accepted"
+        ),
+    )
+    partition: bool = Field(
+        default=False,
+        description=(
+            "Whether each value of the parameter gets a pool of its own"
+        ),
+    )
+    max_wait: float | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Longest a call waits for slots before failing with "
+            "BulkheadFullError. None waits as long as the deadline allows"
+        ),
+    )
+
+    @field_validator("costs", mode="before")
+    @classmethod
+    def _costs_from_mapping(cls, value: Any) -> Any:
+        """Accept the costs as a mapping of parameter value to cost."""
+        if isinstance(value, Mapping):
+            return tuple(value.items())
+        return value
+
+    def cost_for(self, value: Any) -> int:
+        """Get the slots a call takes.
+
+        Args:
+            value: The call's value of the parameter, if any.
+
+        Returns:
+            The cost for that value, or the default cost.
+        """
+        if value is not None:
+            for key, cost in self.costs:
+                if key == str(value):
+                    return cost
+        return self.cost
+
+
+class HostLimitPolicy(BaseModel):
+    """Rate and concurrency limit shared by every process on a host.
+
+    Processes that point at the same ``path`` share one token bucket and
+    one pool of concurrency slots, coordinated through file locks, so a
+    fleet of workers on one machine respects a single global budget
+    without a network service. Slots held by a process that dies are
+    freed by the operating system.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str = Field(
+        description=(
+            "Path prefix of the files the processes coordinate through, "
+            "e.g. /tmp/pyagentai-quota"
+        ),
+    )
+    rate: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Requests per second allowed across the host. None sets no "
+            "rate limit"
+        ),
+    )
+    burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may be sent at once after a lull",
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Requests in flight at once across the host. None sets no "
+            "concurrency limit"
+        ),
+    )
+    poll_interval: float = Field(
+        default=0.01,
+        gt=0,
+        description=(
+            "Seconds between attempts to take a concurrency slot while "
+            "all are held"
+        ),
+    )
+
+
+class CachePolicy(BaseModel):
+    """Caching of an idempotent endpoint's successful responses.
+
+    Responses are cached per endpoint, validated parameters and API key,
+    so tenants never see each other's responses.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ttl: float = Field(
+        gt=0, description="Seconds a cached response is served for"
+    )
+    stale_if_error: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Seconds past the TTL during which an expired response is "
+            "served if a fresh request fails with a transient error"
+        ),
+    )
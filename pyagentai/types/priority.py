@@ -0,0 +1,13 @@
+"""Types for request priorities."""
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """Priority of a request. Lower values are served first."""
+
+    HIGH = 0
+    """Interactive, user-facing requests."""
+    NORMAL = 1
+    """Requests that set no priority."""
+    LOW = 2
+    """Background work such as backfills."""
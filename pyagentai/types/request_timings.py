@@ -0,0 +1,51 @@
+"""Types for request timing breakdowns."""
+from pydantic import BaseModel, Field
+
+
+class RequestTimings(BaseModel):
+    """Per-phase timing breakdown of a single HTTP request.
+
+    All durations are in seconds. A phase is None when it did not happen
+    for this request (for example ``connect`` and ``tls`` on a reused
+    connection) or when the transport does not report it.
+    """
+
+    method: str = Field(description="HTTP method of the request")
+    url: str = Field(description="URL of the request")
+    status_code: int | None = Field(
+        default=None,
+        description="Response status code, or None if the request failed",
+    )
+    pool_wait: float | None = Field(
+        default=None,
+        description="Time spent waiting for a connection from the pool",
+    )
+    connect: float | None = Field(
+        default=None,
+        description=(
+            "Time to open a new connection, including DNS resolution"
+        ),
+    )
+    tls: float | None = Field(
+        default=None, description="Time spent on the TLS handshake"
+    )
+    request_write: float | None = Field(
+        default=None,
+        description="Time to send the request headers and body",
+    )
+    time_to_first_byte: float | None = Field(
+        default=None,
+        description=(
+            "Time from the request being sent to the response headers "
+            "being received; mostly server processing time"
+        ),
+    )
+    body_read: float | None = Field(
+        default=None, description="Time to receive the response body"
+    )
+    total: float = Field(description="Total time of the request")
+
+    @property
+    def reused_connection(self) -> bool:
+        """Whether the request was sent on an already open connection."""
+        return self.connect is None
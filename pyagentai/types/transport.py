@@ -0,0 +1,94 @@
+"""Types for the HTTP transport layer."""
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class TransportMode(str, Enum):
+    """How requests to a host are spread over connections.
+
+    - ``HTTP1``: a pool of HTTP/1.1 connections, one request per
+      connection at a time.
+    - ``HTTP2``: HTTP/2, multiplexing all requests over a single
+      connection per host.
+    - ``HTTP2_STRIPED``: several HTTP/2 connections per host, with each
+      request sent on the connection with the fewest in-flight streams.
+    """
+
+    HTTP1 = "http1"
+    HTTP2 = "http2"
+    HTTP2_STRIPED = "http2_striped"
+
+
+class ConnectionPoolConfig(BaseModel):
+    """Connection pool limits for a single agent.ai host."""
+
+    max_connections: int | None = Field(
+        default=100,
+        ge=1,
+        description=(
+            "Maximum number of concurrent connections to the host. "
+            "None means unlimited."
+        ),
+    )
+    max_keepalive_connections: int | None = Field(
+        default=20,
+        ge=0,
+        description=(
+            "Maximum number of idle connections kept alive in the pool. "
+            "None means unlimited."
+        ),
+    )
+    keepalive_expiry: float | None = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "Seconds an idle connection is kept alive before it is closed. "
+            "None means idle connections never expire."
+        ),
+    )
+
+
+class ContentEncoding(str, Enum):
+    """HTTP content encodings supported for compression.
+
+    ``br`` requires the ``brotli`` (or ``brotlicffi``) package and
+    ``zstd`` requires the ``zstandard`` package; encodings whose package
+    is not installed are skipped.
+    """
+
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+    BROTLI = "br"
+    ZSTD = "zstd"
+
+
+class CompressionConfig(BaseModel):
+    """Compression settings for requests and responses."""
+
+    response_encodings: tuple[ContentEncoding, ...] = Field(
+        default=(
+            ContentEncoding.ZSTD,
+            ContentEncoding.BROTLI,
+            ContentEncoding.GZIP,
+            ContentEncoding.DEFLATE,
+        ),
+        description=(
+            "Response encodings to accept, most preferred first. Sent in "
+            "the Accept-Encoding header; empty disables compression"
+        ),
+    )
+    request_encoding: ContentEncoding | None = Field(
+        default=None,
+        description=(
+            "Encoding used to compress request bodies. None sends "
+            "bodies uncompressed"
+        ),
+    )
+    request_min_size: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Minimum request body size in bytes before it is compressed"
+        ),
+    )
@@ -1,7 +1,19 @@
 """Types for URL endpoints."""
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from pyagentai.types.policies import (
+    BulkheadPolicy,
+    CachePolicy,
+    CircuitBreakerPolicy,
+    ConcurrencyPolicy,
+    HedgePolicy,
+    RateLimitPolicy,
+    RetryPolicy,
+    TimeoutPolicy,
+)
 
 
 class RequestMethod(str, Enum):
@@ -34,6 +46,8 @@ class ParameterType(str, Enum):
 class EndpointParameter(BaseModel):
     """Parameter for an endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Name of the parameter")
     param_type: ParameterType = Field(description="Data type of the parameter")
     required: bool = Field(
@@ -42,8 +56,8 @@ class EndpointParameter(BaseModel):
     description: str = Field(
         default="", description="Description of the parameter"
     )
-    allowed_values: list[str | int | bool | None] = Field(
-        default=[], description="Allowed values for the parameter"
+    allowed_values: tuple[str | int | bool | None, ...] = Field(
+        default=(), description="Allowed values for the parameter"
     )
     validate_parameter: bool = Field(
         default=True,
@@ -54,7 +68,14 @@ class EndpointParameter(BaseModel):
 
 
 class Endpoint(BaseModel):
-    """Metadata for an agent.ai endpoint."""
+    """Metadata for an agent.ai endpoint.
+
+    Endpoints are immutable so that a single instance can be shared by
+    reference between any number of configurations. Use
+    :meth:`with_overrides` to derive a modified copy.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     url: str = Field(description="The endpoint URL path")
     url_type: UrlType = Field(
@@ -64,11 +85,11 @@ class Endpoint(BaseModel):
     description: str = Field(
         default="", description="Description of the endpoint"
     )
-    query_parameters: list[EndpointParameter] = Field(
-        default_factory=list, description="Query parameters for the endpoint"
+    query_parameters: tuple[EndpointParameter, ...] = Field(
+        default=(), description="Query parameters for the endpoint"
     )
-    body_parameters: list[EndpointParameter] = Field(
-        default_factory=list, description="Body parameters for the endpoint"
+    body_parameters: tuple[EndpointParameter, ...] = Field(
+        default=(), description="Body parameters for the endpoint"
     )
     request_content_type: str = Field(
         default="application/json", description="Content type for the request"
@@ -80,6 +101,89 @@ class Endpoint(BaseModel):
         default=True,
         description="Whether this endpoint requires authentication",
     )
-    path_parameters: list[EndpointParameter] = Field(
-        default_factory=list, description="Path parameters for the endpoint"
+    path_parameters: tuple[EndpointParameter, ...] = Field(
+        default=(), description="Path parameters for the endpoint"
+    )
+    timeout: TimeoutPolicy | None = Field(
+        default=None,
+        description=(
+            "Per-phase timeouts for this endpoint. None uses the "
+            "client-wide timeout"
+        ),
+    )
+    idempotent: bool = Field(
+        default=False,
+        description=(
+            "Whether repeating a request has no additional effect, which "
+            "makes it safe to retry"
+        ),
+    )
+    retry: RetryPolicy | None = Field(
+        default=None,
+        description=(
+            "Retry policy for this endpoint. None uses the client-wide "
+            "retry policy"
+        ),
+    )
+    rate_limit: RateLimitPolicy | None = Field(
+        default=None,
+        description=(
+            "Client-side rate limit for this endpoint. None sends "
+            "requests without limit"
+        ),
+    )
+    bulkhead: BulkheadPolicy | None = Field(
+        default=None,
+        description=(
+            "Bulkhead isolating this endpoint's concurrent requests. None "
+            "shares the connection pool without limit"
+        ),
+    )
+    concurrency: ConcurrencyPolicy | None = Field(
+        default=None,
+        description=(
+            "Adaptive limit on concurrent requests to this endpoint. None "
+            "sends requests without limit"
+        ),
+    )
+    circuit_breaker: CircuitBreakerPolicy | None = Field(
+        default=None,
+        description=(
+            "Circuit breaker for this endpoint. None never fails fast"
+        ),
+    )
+    hedge: HedgePolicy | None = Field(
+        default=None,
+        description=(
+            "Hedging policy for this endpoint, which must be idempotent. "
+            "None never sends duplicate requests"
+        ),
     )
+    coalesce: bool = Field(
+        default=False,
+        description=(
+            "Whether concurrent identical calls to this endpoint, which "
+            "must be idempotent, share one request"
+        ),
+    )
+    cache: CachePolicy | None = Field(
+        default=None,
+        description=(
+            "Response caching for this endpoint, which must be "
+            "idempotent. None never caches its responses"
+        ),
+    )
+
+    def with_overrides(self, **updates: Any) -> "Endpoint":
+        """Create a copy of the endpoint with some fields replaced.
+
+        Fields that are not overridden, including the parameter
+        definitions, are shared with this endpoint rather than copied.
+
+        Args:
+            **updates: Endpoint fields to replace.
+
+        Returns:
+            A new, validated endpoint.
+        """
+        return type(self).model_validate({**dict(self), **updates})
@@ -0,0 +1,161 @@
+"""Stale-while-revalidate cache of agent search results."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from pyagentai.types.agent_info import AgentInfo
+from pyagentai.types.priority import RequestPriority
+from pyagentai.utils.request_context import (
+    request_deadline,
+    request_priority,
+    scoped_value,
+)
+
+Fetch = Callable[[], Awaitable[list[AgentInfo]]]
+
+
+class _Listing:
+    """The agents found for one search and when they were fetched."""
+
+    __slots__ = ("agents", "fetched_at", "refresh")
+
+    def __init__(self, agents: list[AgentInfo], fetched_at: float) -> None:
+        self.agents = agents
+        self.fetched_at = fetched_at
+        self.refresh: asyncio.Task[None] | None = None
+
+
+class AgentCatalog:
+    """Cache of the agents found per search, refreshed in the background.
+
+    The first search for a key waits for the API. Later searches are
+    answered from memory; once a listing is older than ``ttl``, it is
+    still served while a background task fetches a fresh one, so only
+    cold searches wait on the network. A ``ttl`` of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty catalog.
+
+        Args:
+            ttl: Seconds a listing is fresh for, or 0 to disable caching.
+            max_entries: The most searches kept, evicting the least
+                recently used.
+            clock: Source of the current time in seconds.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._listings: OrderedDict[str, _Listing] = OrderedDict()
+        self._refreshes: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    async def get(self, key: str, fetch: Fetch) -> list[AgentInfo]:
+        """Get the agents found by a search.
+
+        Args:
+            key: Identifies the search, including its filters and API key.
+            fetch: Fetches the agents from the API.
+
+        Returns:
+            The cached agents, or the fetched ones if none are cached.
+        """
+        if self._ttl <= 0:
+            return await fetch()
+
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is not None:
+                self._listings.move_to_end(key)
+                stale = self._clock() - listing.fetched_at >= self._ttl
+                refreshing = (
+                    listing.refresh is not None and not listing.refresh.done()
+                )
+                if stale and not refreshing:
+                    task = asyncio.create_task(
+                        self._refresh(key, listing, fetch)
+                    )
+                    listing.refresh = task
+                    self._refreshes.add(task)
+                    task.add_done_callback(self._refresh_done)
+                return listing.agents
+
+        agents = await fetch()
+        self._store(key, agents)
+        return agents
+
+    def _store(self, key: str, agents: list[AgentInfo]) -> None:
+        """Cache a fresh listing, evicting the least recently used."""
+        with self._lock:
+            self._listings[key] = _Listing(agents, self._clock())
+            self._listings.move_to_end(key)
+            while len(self._listings) > self._max_entries:
+                self._listings.popitem(last=False)
+
+    async def _refresh(
+        self, key: str, listing: _Listing, fetch: Fetch
+    ) -> None:
+        """Replace a stale listing, keeping it if the fetch fails.
+
+        The refresh is background work: it ignores the deadline of the
+        search that started it and runs at low priority.
+        """
+        try:
+            with (
+                scoped_value(request_deadline, None),
+                scoped_value(request_priority, RequestPriority.LOW),
+            ):
+                agents = await fetch()
+        except Exception:
+            # The failure was logged by the request; retry on next use
+            return
+        finally:
+            # Also reached on cancellation, e.g. when the loop shuts down
+            with self._lock:
+                listing.refresh = None
+        self._store(key, agents)
+
+    def _refresh_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a refresh that has finished."""
+        with self._lock:
+            self._refreshes.discard(task)
+
+    async def aclose(self) -> None:
+        """Cancel the refreshes in progress and wait for them to stop.
+
+        Refreshes running on other event loops are cancelled without
+        waiting for them.
+        """
+        with self._lock:
+            tasks = list(self._refreshes)
+        loop = asyncio.get_running_loop()
+        own_tasks = []
+        for task in tasks:
+            task_loop = task.get_loop()
+            if task_loop is loop:
+                task.cancel()
+                own_tasks.append(task)
+            elif not task_loop.is_closed():
+                task_loop.call_soon_threadsafe(task.cancel)
+        await asyncio.gather(*own_tasks, return_exceptions=True)
+
+    def clear(self) -> None:
+        """Drop every listing, cancelling refreshes in progress."""
+        with self._lock:
+            listings = list(self._listings.values())
+            self._listings.clear()
+        for listing in listings:
+            task = listing.refresh
+            if task is not None and not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
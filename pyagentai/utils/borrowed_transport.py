@@ -0,0 +1,36 @@
+"""Transport wrapper for transports owned by the caller."""
+
+import httpx
+
+
+class BorrowedTransport(httpx.AsyncBaseTransport):
+    """Delegate to a transport without taking ownership of it.
+
+    ``httpx.AsyncClient.aclose`` closes its transport. When a transport is
+    supplied by the caller it may be shared by several HTTP clients, so
+    closing one client must not close it; the caller closes it instead.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            transport: The caller-owned transport to delegate to.
+        """
+        self.transport = transport
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """Send a request through the wrapped transport.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response from the wrapped transport.
+        """
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Leave the wrapped transport open for its owner to close."""
@@ -0,0 +1,429 @@
+"""Response cache keys and storage backends."""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from pyagentai.types.cache import CacheEntry
+from pyagentai.types.url_endpoint import Endpoint
+
+T = TypeVar("T")
+
+# The largest integer SQLite stores, standing in for "no limit".
+_UNLIMITED = 2**63 - 1
+
+
+def cache_key(
+    endpoint: Endpoint,
+    query_params: dict[str, Any],
+    body_params: dict[str, Any],
+    credential: str | None,
+) -> str:
+    """Build the cache key of a request.
+
+    Parameters are normalized by sorting their names, so equal requests
+    share a key however their parameters were ordered. The credential is
+    part of the key, so tenants never share entries, but only a digest of
+    it is stored.
+
+    Args:
+        endpoint: The API endpoint called.
+        query_params: The validated query parameters.
+        body_params: The validated body parameters.
+        credential: The API key the request is made with, if any.
+
+    Returns:
+        A hex digest identifying the request.
+    """
+    payload = json.dumps(
+        [
+            endpoint.method.value,
+            endpoint.url_type.value,
+            endpoint.url,
+            query_params,
+            body_params,
+            credential,
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage of cached responses.
+
+    Implement this to keep the cache somewhere other than in memory, and
+    pass the backend to :class:`~pyagentai.config.agentai_config.AgentAIConfig`
+    as ``cache_backend``. Backends drop entries past their
+    ``stale_until`` time and may evict others to bound their size.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cached response.
+
+        Args:
+            key: The request's cache key.
+
+        Returns:
+            The entry, or None if there is no usable one.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Cache a response, replacing any previous entry.
+
+        Args:
+            key: The request's cache key.
+            entry: The response to cache.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry."""
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries evicted to bound the cache's size."""
+        return 0
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-memory cache with least-recently-used eviction."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: The most entries kept.
+            max_bytes: The most bytes of responses kept, or None for no
+                limit.
+            clock: Source of the current Unix time.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries evicted to bound the cache's size."""
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        """Remove an entry. Called with the lock held."""
+        self._bytes -= self._entries.pop(key).size
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cached response, marking it as recently used.
+
+        Args:
+            key: The request's cache key.
+
+        Returns:
+            The entry, or None if there is none or it may no longer be
+            served.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.stale_until <= self._clock():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Cache a response, evicting the least recently used ones.
+
+        A response larger than ``max_bytes`` is not cached.
+
+        Args:
+            key: The request's cache key.
+            entry: The response to cache.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self._max_bytes is not None and entry.size > self._max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    async def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class SQLiteCache(CacheBackend):
+    """Cache in an SQLite database, shared by the processes using it.
+
+    The database is opened in WAL mode, so processes on one host can
+    share it and readers never block the writer: a restarted worker
+    starts with the responses cached by the others. Reads are read-only;
+    the times entries are used are kept in memory and written with the
+    process's next write, which then deletes entries past their
+    ``stale_until`` time and evicts the least recently used ones beyond
+    ``max_bytes`` or ``max_entries``. Bodies of at least
+    ``compress_min_size`` bytes are stored compressed with zlib.
+
+    Database calls run in worker threads, through one reading and one
+    writing connection per process that are reopened after a fork.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        compress_min_size: int | None = 1024,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize a cache without opening its database yet.
+
+        Args:
+            path: The path of the database file.
+            max_bytes: The most bytes of responses kept, before
+                compression, or None for no limit.
+            max_entries: The most entries kept, or None for no limit.
+            compress_min_size: The smallest body that is compressed, or
+                None to never compress.
+            busy_timeout: Seconds to wait for another process's write to
+                finish before failing.
+            clock: Source of the current Unix time, shared by the
+                processes.
+        """
+        self._path = path
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._compress_min_size = compress_min_size
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        # Keyed by whether the connection is read-only
+        self._locks = {True: threading.Lock(), False: threading.Lock()}
+        self._connections: dict[bool, tuple[int, sqlite3.Connection]] = {}
+        self._accessed_lock = threading.Lock()
+        self._accessed: dict[str, float] = {}
+        self._evictions = 0
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries this process evicted to bound the size."""
+        return self._evictions
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Get this process's reading or writing connection.
+
+        Called with the connection's lock held.
+        """
+        opened = self._connections.get(read_only)
+        if opened is not None and opened[0] == os.getpid():
+            return opened[1]
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                compressed INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_by_access "
+            "ON responses (accessed_at)"
+        )
+        if read_only:
+            connection.execute("PRAGMA query_only=ON")
+        self._connections[read_only] = (os.getpid(), connection)
+        return connection
+
+    async def _run(
+        self, func: Callable[[sqlite3.Connection], T], read_only: bool
+    ) -> T:
+        """Run a database call in a worker thread."""
+
+        def call() -> T:
+            with self._locks[read_only]:
+                return func(self._connect(read_only))
+
+        return await asyncio.to_thread(call)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cached response, marking it as recently used.
+
+        Args:
+            key: The request's cache key.
+
+        Returns:
+            The entry, or None if there is none or it may no longer be
+            served.
+        """
+
+        def get(connection: sqlite3.Connection) -> CacheEntry | None:
+            now = self._clock()
+            row = connection.execute(
+                "SELECT status_code, headers, content, compressed, "
+                "expires_at, stale_until FROM responses "
+                "WHERE key = ? AND stale_until > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            if self._max_bytes is not None or self._max_entries is not None:
+                with self._accessed_lock:
+                    self._accessed[key] = now
+            status_code, headers, content, compressed, expires, stale = row
+            return CacheEntry(
+                status_code=status_code,
+                headers=json.loads(headers),
+                content=zlib.decompress(content) if compressed else content,
+                expires_at=expires,
+                stale_until=stale,
+            )
+
+        return await self._run(get, read_only=True)
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Cache a response, evicting the least recently used ones.
+
+        Args:
+            key: The request's cache key.
+            entry: The response to cache.
+        """
+
+        def set_(connection: sqlite3.Connection) -> None:
+            content = entry.content
+            compressed = (
+                self._compress_min_size is not None
+                and len(content) >= self._compress_min_size
+            )
+            if compressed:
+                content = zlib.compress(content)
+
+            now = self._clock()
+            connection.execute("BEGIN IMMEDIATE")
+            with self._accessed_lock:
+                accessed, self._accessed = self._accessed, {}
+            try:
+                connection.executemany(
+                    "UPDATE responses SET accessed_at = ? "
+                    "WHERE key = ? AND accessed_at < ?",
+                    [(at, used, at) for used, at in accessed.items()],
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.status_code,
+                        json.dumps(entry.headers),
+                        content,
+                        int(compressed),
+                        entry.size,
+                        entry.expires_at,
+                        entry.stale_until,
+                        now,
+                    ),
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE stale_until <= ?", (now,)
+                )
+                if (
+                    self._max_bytes is not None
+                    or self._max_entries is not None
+                ):
+                    evicted = connection.execute(
+                        """
+                        DELETE FROM responses WHERE key IN (
+                            SELECT key FROM (
+                                SELECT key,
+                                    SUM(size) OVER recent AS total,
+                                    ROW_NUMBER() OVER recent AS position
+                                FROM responses
+                                WINDOW recent AS (
+                                    ORDER BY accessed_at DESC, rowid DESC
+                                )
+                            )
+                            WHERE total > ? OR position > ?
+                        )
+                        """,
+                        (
+                            self._max_bytes or _UNLIMITED,
+                            self._max_entries or _UNLIMITED,
+                        ),
+                    ).rowcount
+                    self._evictions += max(0, evicted)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                with self._accessed_lock:
+                    # Keep the access times for the next write
+                    self._accessed = {**accessed, **self._accessed}
+                raise
+
+        await self._run(set_, read_only=False)
+
+    async def clear(self) -> None:
+        """Drop every entry."""
+        with self._accessed_lock:
+            self._accessed.clear()
+        await self._run(
+            lambda connection: connection.execute("DELETE FROM responses"),
+            read_only=False,
+        )
+
+    def close(self) -> None:
+        """Close this process's connections.
+
+        They are reopened if the cache is used again.
+        """
+        for read_only, lock in self._locks.items():
+            with lock:
+                opened = self._connections.pop(read_only, None)
+                if opened is not None and opened[0] == os.getpid():
+                    opened[1].close()
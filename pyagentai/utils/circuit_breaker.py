@@ -0,0 +1,125 @@
+"""Circuit breaker that fails fast while an endpoint is failing."""
+
+import threading
+import time
+from collections.abc import Callable
+
+from pyagentai.exceptions import CircuitOpenError
+from pyagentai.types.circuit_breaker import CircuitState
+from pyagentai.types.policies import CircuitBreakerPolicy
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one endpoint.
+
+    Every request asks the breaker for permission with :meth:`acquire`
+    and reports its outcome with :meth:`record`. Outcomes of requests
+    that started before the breaker last changed state are ignored, so
+    slow stragglers cannot reopen a breaker that already recovered.
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            policy: The thresholds of the breaker.
+            name: The name used in error messages, e.g. the endpoint URL.
+            clock: Source of the current time in seconds.
+        """
+        self._policy = policy
+        self._name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._generation = 0
+        self._failures = 0
+        self._successes = 0
+        self._trials = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving to half-open once it is due."""
+        with self._lock:
+            self._check_open_duration()
+            return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state. Called with the lock held."""
+        self._state = state
+        self._generation += 1
+        self._failures = 0
+        self._successes = 0
+        self._trials = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+    def _check_open_duration(self) -> None:
+        """Half-open an open breaker whose time is up."""
+        if self._state != CircuitState.OPEN:
+            return
+        if self._clock() - self._opened_at >= self._policy.open_duration:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def acquire(self) -> int:
+        """Get permission to send a request.
+
+        Returns:
+            A ticket to pass to :meth:`record` with the outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with
+                all trial requests in flight.
+        """
+        with self._lock:
+            self._check_open_duration()
+            if self._state == CircuitState.CLOSED:
+                return self._generation
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._trials < self._policy.half_open_max_calls
+            ):
+                self._trials += 1
+                return self._generation
+            retry_after = max(
+                0.0,
+                self._opened_at + self._policy.open_duration - self._clock(),
+            )
+        raise CircuitOpenError(
+            f"Circuit breaker is open for {self._name}",
+            retry_after=retry_after,
+        )
+
+    def record(self, ticket: int, success: bool | None) -> None:
+        """Report the outcome of a request allowed by :meth:`acquire`.
+
+        Args:
+            ticket: The ticket returned by :meth:`acquire`.
+            success: Whether the request succeeded, or None if its
+                outcome says nothing about the endpoint's health, e.g.
+                because the caller gave up.
+        """
+        policy = self._policy
+        with self._lock:
+            if ticket != self._generation:
+                return
+            if self._state == CircuitState.CLOSED:
+                if success is False:
+                    self._failures += 1
+                    if self._failures >= policy.failure_threshold:
+                        self._transition(CircuitState.OPEN)
+                elif success:
+                    self._failures = 0
+            elif self._state == CircuitState.HALF_OPEN:
+                self._trials -= 1
+                if success is False:
+                    self._transition(CircuitState.OPEN)
+                elif success:
+                    self._successes += 1
+                    if self._successes >= policy.success_threshold:
+                        self._transition(CircuitState.CLOSED)
@@ -0,0 +1,170 @@
+"""Compression helpers and transfer statistics."""
+
+import gzip
+import importlib
+import threading
+import zlib
+from collections.abc import Callable
+from functools import cache
+from types import ModuleType
+
+from pyagentai.types.transport import ContentEncoding
+
+
+def _import_first(*names: str) -> ModuleType | None:
+    """Import the first installed module among *names*."""
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+_brotli = _import_first("brotli", "brotlicffi")
+_zstandard = _import_first("zstandard")
+
+
+_COMPRESSORS: dict[ContentEncoding, Callable[[bytes], bytes]] = {
+    ContentEncoding.GZIP: gzip.compress,
+    ContentEncoding.DEFLATE: zlib.compress,
+}
+if _brotli is not None:
+    _COMPRESSORS[ContentEncoding.BROTLI] = _brotli.compress
+if _zstandard is not None:
+    _zstd_compressor_class = _zstandard.ZstdCompressor
+    # Compressor objects are not thread-safe, so use one per call.
+    _COMPRESSORS[ContentEncoding.ZSTD] = (
+        lambda data: _zstd_compressor_class().compress(data)
+    )
+
+
+def is_available(encoding: ContentEncoding) -> bool:
+    """Check whether the package needed for an encoding is installed.
+
+    Args:
+        encoding: The content encoding.
+
+    Returns:
+        Whether bodies can be compressed and decompressed with it.
+    """
+    return encoding in _COMPRESSORS
+
+
+@cache
+def accept_encoding(encodings: tuple[ContentEncoding, ...]) -> str:
+    """Build an Accept-Encoding header value.
+
+    Encodings whose package is not installed are left out, since their
+    responses could not be decoded.
+
+    Args:
+        encodings: The accepted encodings, most preferred first.
+
+    Returns:
+        The header value, or ``"identity"`` if no encoding is usable.
+    """
+    usable = [encoding for encoding in encodings if is_available(encoding)]
+    if not usable:
+        return "identity"
+
+    # Spread quality values evenly to express the preference order.
+    step = 1 / (len(usable) + 1)
+    parts = []
+    for index, encoding in enumerate(usable):
+        quality = round(1 - index * step, 2)
+        if quality >= 1:
+            parts.append(encoding.value)
+        else:
+            parts.append(f"{encoding.value};q={quality}")
+    return ", ".join(parts)
+
+
+def compress(data: bytes, encoding: ContentEncoding) -> bytes:
+    """Compress a request body.
+
+    Args:
+        data: The body to compress.
+        encoding: The content encoding to use.
+
+    Returns:
+        The compressed body.
+
+    Raises:
+        ValueError: If the package for the encoding is not installed.
+    """
+    compressor = _COMPRESSORS.get(encoding)
+    if compressor is None:
+        raise ValueError(
+            f"Content encoding '{encoding.value}' is not available; "
+            "install the package that provides it."
+        )
+    return compressor(data)
+
+
+class TransferStats:
+    """Thread-safe counters of bytes sent and received by a client.
+
+    Attributes:
+        requests: Number of requests recorded.
+        request_bytes: Request body bytes before compression.
+        request_bytes_sent: Request body bytes sent on the wire.
+        response_bytes_received: Response body bytes received on the wire.
+        response_bytes: Response body bytes after decompression.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.request_bytes = 0
+        self.request_bytes_sent = 0
+        self.response_bytes_received = 0
+        self.response_bytes = 0
+
+    def record(
+        self,
+        request_bytes: int,
+        request_bytes_sent: int,
+        response_bytes_received: int,
+        response_bytes: int,
+    ) -> None:
+        """Record the sizes of one request and its response.
+
+        Args:
+            request_bytes: Request body size before compression.
+            request_bytes_sent: Request body size on the wire.
+            response_bytes_received: Response body size on the wire.
+            response_bytes: Response body size after decompression.
+        """
+        with self._lock:
+            self.requests += 1
+            self.request_bytes += request_bytes
+            self.request_bytes_sent += request_bytes_sent
+            self.response_bytes_received += response_bytes_received
+            self.response_bytes += response_bytes
+
+    @property
+    def request_compression_ratio(self) -> float:
+        """Uncompressed over sent request bytes (1.0 if nothing sent)."""
+        with self._lock:
+            if not self.request_bytes_sent:
+                return 1.0
+            return self.request_bytes / self.request_bytes_sent
+
+    @property
+    def response_compression_ratio(self) -> float:
+        """Decompressed over received response bytes (1.0 if none)."""
+        with self._lock:
+            if not self.response_bytes_received:
+                return 1.0
+            return self.response_bytes / self.response_bytes_received
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.request_bytes = 0
+            self.request_bytes_sent = 0
+            self.response_bytes_received = 0
+            self.response_bytes = 0
@@ -0,0 +1,515 @@
+"""Concurrency limiters that work across event loops and threads."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Mapping
+from typing import cast
+
+from pyagentai.types.concurrency import ConcurrencyStats, TenantStats
+from pyagentai.types.policies import ConcurrencyPolicy
+from pyagentai.types.priority import RequestPriority
+
+
+class _Waiter:
+    """A coroutine waiting for capacity."""
+
+    __slots__ = (
+        "loop",
+        "future",
+        "cost",
+        "lane",
+        "enqueued_at",
+        "granted",
+        "tag",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        future: "asyncio.Future[None]",
+        cost: float,
+        lane: Hashable,
+        enqueued_at: float,
+    ) -> None:
+        self.loop = loop
+        self.future = future
+        self.cost = cost
+        self.lane = lane
+        self.enqueued_at = enqueued_at
+        self.granted = False
+        self.tag = 0.0
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    """Resolve a waiter's future from its own event loop."""
+    if not future.done():
+        future.set_result(None)
+
+
+class CapacityLimiter:
+    """Thread-safe limiter of concurrent work, weighted by cost.
+
+    Unlike ``asyncio.Semaphore``, one limiter can be shared by coroutines
+    running on different event loops, and its capacity can change while
+    it is in use. Waiters are served in order; a waiter whose cost does
+    not fit holds back those behind it, so heavy work is not starved.
+    Work that costs more than the whole capacity runs once nothing else
+    does.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an idle limiter.
+
+        Args:
+            capacity: The total cost of work allowed at once.
+            clock: Source of the current time in seconds.
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._capacity = capacity
+        self._in_use = 0.0
+        self._waiters: deque[_Waiter] = deque()
+
+    @property
+    def capacity(self) -> float:
+        """The total cost of work allowed at once."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: float) -> None:
+        with self._lock:
+            self._capacity = capacity
+            self._dispatch()
+
+    @property
+    def in_use(self) -> float:
+        """The total cost of the work holding capacity."""
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        """The number of waiters queued for capacity."""
+        return len(self._waiters)
+
+    # Queue discipline. Subclasses override these to change the order in
+    # which waiters are served; they are called with the lock held.
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        """Add a waiter to the queue."""
+        self._waiters.append(waiter)
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Get the waiter to serve next, without removing it."""
+        return self._waiters[0] if self._waiters else None
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        """Remove a waiter from the queue."""
+        self._waiters.remove(waiter)
+
+    def _on_grant(self, lane: Hashable, waiter: _Waiter | None) -> None:
+        """Observe work acquiring capacity.
+
+        Args:
+            lane: The lane of the work.
+            waiter: The waiter granted capacity, or None if the work did
+                not have to wait.
+        """
+
+    def _fits(self, cost: float) -> bool:
+        """Check whether work of some cost may start now."""
+        return self._in_use == 0 or self._in_use + cost <= self._capacity
+
+    def _dispatch(self) -> None:
+        """Grant capacity to queued waiters. Called with the lock held."""
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None or not self._fits(waiter.cost):
+                return
+            self._dequeue(waiter)
+            if waiter.loop.is_closed():
+                continue
+            waiter.granted = True
+            self._in_use += waiter.cost
+            self._on_grant(waiter.lane, waiter)
+            waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    async def acquire(
+        self, cost: float = 1.0, max_wait: float | None = None
+    ) -> bool:
+        """Wait for capacity.
+
+        Args:
+            cost: The share of the capacity the work takes.
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            Whether capacity was acquired. False means none became free
+            within ``max_wait``.
+        """
+        return await self._acquire(cost, max_wait, lane=None)
+
+    async def _acquire(
+        self, cost: float, max_wait: float | None, lane: Hashable
+    ) -> bool:
+        """Wait for capacity in a lane of the queue.
+
+        Args:
+            cost: The share of the capacity the work takes.
+            max_wait: The longest acceptable wait, in seconds.
+            lane: The lane to queue in, if the queue discipline has any.
+
+        Returns:
+            Whether capacity was acquired.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._next_waiter() is None and self._fits(cost):
+                self._in_use += cost
+                self._on_grant(lane, None)
+                return True
+            waiter = _Waiter(
+                loop, loop.create_future(), cost, lane, self._clock()
+            )
+            self._enqueue(waiter)
+
+        try:
+            await asyncio.wait_for(waiter.future, max_wait)
+        except asyncio.TimeoutError:
+            return self._abandon(waiter)
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self.release(cost)
+            raise
+        return True
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter that stopped waiting.
+
+        Args:
+            waiter: The waiter to withdraw.
+
+        Returns:
+            Whether capacity had already been granted to it.
+        """
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._dequeue(waiter)
+            # It may have been the head holding the others back
+            self._dispatch()
+            return False
+
+    def release(self, cost: float = 1.0) -> None:
+        """Return capacity taken by :meth:`acquire`.
+
+        Args:
+            cost: The cost that was acquired.
+        """
+        with self._lock:
+            self._in_use = max(0.0, self._in_use - cost)
+            self._dispatch()
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit that adapts to latency and overload (AIMD).
+
+    Each successful request raises the limit by ``increase / limit``, so
+    the limit grows by ``increase`` for every full window of successes,
+    as long as the requests actually use the limit. A 429, a 5xx, a
+    timeout or a latency spike cuts the limit by ``backoff_ratio``, at
+    most once per smoothed latency, so one burst of failures counts as
+    one signal. Spikes still feed the smoothed latency, so a lasting
+    shift in the API's latency becomes the new baseline instead of
+    cutting the limit forever.
+    """
+
+    def __init__(
+        self,
+        policy: ConcurrencyPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter at its initial limit.
+
+        Args:
+            policy: The bounds and tuning of the limit.
+            clock: Source of the current time in seconds.
+        """
+        self._policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(policy.initial_limit)
+        self._latency: float | None = None
+        self._last_decrease = -math.inf
+        self._slots = CapacityLimiter(self._capacity())
+
+    def _capacity(self) -> int:
+        """The whole number of requests the limit allows."""
+        return max(self._policy.min_limit, math.floor(self._limit))
+
+    @property
+    def limit(self) -> float:
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def latency(self) -> float | None:
+        """Smoothed latency of successful requests, in seconds."""
+        return self._latency
+
+    def stats(self) -> ConcurrencyStats:
+        """Get a snapshot of the limit, its use and the latency signal."""
+        return ConcurrencyStats(
+            limit=self._capacity(),
+            in_flight=int(self._slots.in_use),
+            waiting=self._slots.waiting,
+            latency=self._latency,
+        )
+
+    async def acquire(self, max_wait: float | None = None) -> bool:
+        """Wait until the limit allows another request.
+
+        Args:
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            Whether a slot was acquired.
+        """
+        return await self._slots.acquire(max_wait=max_wait)
+
+    def release(
+        self, latency: float | None = None, overloaded: bool = False
+    ) -> None:
+        """Free a slot and adjust the limit to the request's outcome.
+
+        Args:
+            latency: The request's latency in seconds, or None if it gave
+                no latency signal, e.g. because it failed to connect.
+            overloaded: Whether the API signalled overload, with a 429,
+                a 5xx or a timeout.
+        """
+        policy = self._policy
+        with self._lock:
+            in_flight = self._slots.in_use
+            spike = (
+                latency is not None
+                and self._latency is not None
+                and latency > self._latency * policy.latency_tolerance
+            )
+            if latency is not None and not overloaded:
+                if self._latency is None:
+                    self._latency = latency
+                else:
+                    self._latency += policy.smoothing * (
+                        latency - self._latency
+                    )
+
+            now = self._clock()
+            if overloaded or spike:
+                cooldown = self._latency or 0.0
+                if now - self._last_decrease >= cooldown:
+                    self._limit = max(
+                        policy.min_limit, self._limit * policy.backoff_ratio
+                    )
+                    self._last_decrease = now
+            elif latency is not None and in_flight * 2 >= self._limit:
+                self._limit = min(
+                    policy.max_limit,
+                    self._limit + policy.increase / self._limit,
+                )
+            capacity = self._capacity()
+
+        self._slots.capacity = capacity
+        self._slots.release()
+
+
+class _Flow:
+    """The queue state and statistics of one tenant."""
+
+    __slots__ = ("finish", "queued", "dispatched", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.finish = 0.0
+        self.queued = 0
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class PriorityLimiter(CapacityLimiter):
+    """Capacity limiter that serves waiters by priority and fair share.
+
+    Each priority has a lane per tenant, and freed capacity goes to the
+    most urgent priority. To keep low-priority work from starving, a
+    waiter's priority improves by one level for every ``aging_interval``
+    seconds it has waited.
+
+    Tenants of equal priority share the capacity in proportion to their
+    weights, using start-time fair queuing: each waiter is tagged with
+    the virtual time at which its tenant's share lets it start, and the
+    earliest tag is served first. A tenant that queues thousands of
+    requests only delays its own.
+
+    Statistics are kept for the ``max_tenants`` most recently active
+    tenants. Beyond that, idle tenants are forgotten, which does not
+    affect their share once they return.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        aging_interval: float,
+        weights: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_tenants: int = 1024,
+    ) -> None:
+        """Initialize an idle limiter.
+
+        Args:
+            capacity: The total cost of work allowed at once.
+            aging_interval: Seconds of waiting that raise a waiter's
+                priority by one level.
+            weights: The share of each tenant, relative to the default
+                weight of 1.
+            clock: Source of the current time in seconds.
+            max_tenants: The most tenants whose statistics are kept.
+        """
+        super().__init__(capacity, clock=clock)
+        self._aging_interval = aging_interval
+        self._weights = dict(weights or {})
+        self._max_tenants = max_tenants
+        self._lanes: dict[Hashable, deque[_Waiter]] = {}
+        self._flows: OrderedDict[str | None, _Flow] = OrderedDict()
+        self._virtual_time = 0.0
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """The number of waiters queued for capacity."""
+        return self._waiting
+
+    def tenant_stats(self) -> dict[str | None, TenantStats]:
+        """Get the queue depth and waiting times of each tenant.
+
+        Returns:
+            The statistics of each recently active tenant that has
+            acquired capacity, keyed by tenant ID.
+        """
+        with self._lock:
+            return {
+                tenant: TenantStats(
+                    queued=flow.queued,
+                    dispatched=flow.dispatched,
+                    mean_wait=(
+                        flow.total_wait / flow.dispatched
+                        if flow.dispatched
+                        else 0.0
+                    ),
+                    max_wait=flow.max_wait,
+                )
+                for tenant, flow in self._flows.items()
+            }
+
+    async def acquire(
+        self,
+        cost: float = 1.0,
+        max_wait: float | None = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        tenant: str | None = None,
+    ) -> bool:
+        """Wait for capacity.
+
+        Args:
+            cost: The share of the capacity the work takes.
+            max_wait: The longest acceptable wait, in seconds.
+            priority: The priority of the work.
+            tenant: The tenant the work is done for.
+
+        Returns:
+            Whether capacity was acquired.
+        """
+        return await self._acquire(cost, max_wait, lane=(priority, tenant))
+
+    def _flow(self, lane: Hashable) -> _Flow:
+        """Get the flow of the tenant queueing in a lane."""
+        _, tenant = cast(tuple[RequestPriority, str | None], lane)
+        flow = self._flows.get(tenant)
+        if flow is None:
+            flow = self._flows[tenant] = _Flow()
+            self._forget_idle_flows()
+        else:
+            self._flows.move_to_end(tenant)
+        return flow
+
+    def _forget_idle_flows(self) -> None:
+        """Drop the least recently active idle flows beyond the limit.
+
+        A flow is idle once nothing is queued in it and its finish tag
+        is behind the virtual time, so a fresh flow would be tagged the
+        same. The newest flow is always kept.
+        """
+        excess = len(self._flows) - self._max_tenants
+        if excess <= 0:
+            return
+        idle = [
+            tenant
+            for tenant, flow in list(self._flows.items())[:-1]
+            if flow.queued == 0 and flow.finish <= self._virtual_time
+        ]
+        for tenant in idle[:excess]:
+            del self._flows[tenant]
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        """Tag a waiter with its start time and add it to its lane."""
+        _, tenant = cast(tuple[RequestPriority, str | None], waiter.lane)
+        flow = self._flow(waiter.lane)
+        waiter.tag = max(self._virtual_time, flow.finish)
+        flow.finish = waiter.tag + waiter.cost / self._weights.get(
+            tenant or "", 1.0
+        )
+        flow.queued += 1
+        self._lanes.setdefault(waiter.lane, deque()).append(waiter)
+        self._waiting += 1
+
+    def _level(self, waiter: _Waiter, now: float) -> int:
+        """Get a waiter's priority, improved by the time it has waited."""
+        priority, _ = cast(tuple[RequestPriority, str | None], waiter.lane)
+        waited = now - waiter.enqueued_at
+        return int(priority) - math.floor(waited / self._aging_interval)
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Get the most urgent waiter, then the one with the earliest tag."""
+        now = self._clock()
+        heads = [lane[0] for lane in self._lanes.values()]
+        if not heads:
+            return None
+        return min(
+            heads,
+            key=lambda w: (self._level(w, now), w.tag, w.enqueued_at),
+        )
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        """Remove a waiter from its lane."""
+        lane = self._lanes[waiter.lane]
+        lane.remove(waiter)
+        if not lane:
+            del self._lanes[waiter.lane]
+        self._flow(waiter.lane).queued -= 1
+        self._waiting -= 1
+
+    def _on_grant(self, lane: Hashable, waiter: _Waiter | None) -> None:
+        """Advance the virtual time and record the tenant's wait."""
+        waited = 0.0
+        if waiter is not None:
+            self._virtual_time = max(self._virtual_time, waiter.tag)
+            waited = self._clock() - waiter.enqueued_at
+        flow = self._flow(lane)
+        flow.dispatched += 1
+        flow.total_wait += waited
+        flow.max_wait = max(flow.max_wait, waited)
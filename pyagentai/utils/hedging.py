@@ -0,0 +1,124 @@
+"""Hedged requests that race a duplicate against a slow original."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from pyagentai.types.policies import HedgePolicy, RetryBudgetPolicy
+from pyagentai.utils.retry import RetryBudget
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Sends hedges for one endpoint, timed by its recent latencies.
+
+    The hedges sent across all requests are capped with a
+    :class:`RetryBudget`, so hedging adds at most ``max_hedge_ratio``
+    extra requests per request, plus ``min_hedges_per_second``, however
+    slow the endpoint gets.
+    """
+
+    def __init__(
+        self,
+        policy: HedgePolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a hedger with no latency history.
+
+        Args:
+            policy: When and how often to hedge.
+            clock: Source of the current time in seconds.
+        """
+        self._policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=policy.sample_size)
+        self._budget = RetryBudget(
+            RetryBudgetPolicy(
+                ratio=policy.max_hedge_ratio,
+                min_retries_per_second=policy.min_hedges_per_second,
+            ),
+            clock=clock,
+        )
+
+    def delay(self) -> float:
+        """Get how long to wait for a response before hedging.
+
+        Returns:
+            The latency percentile of recent requests, in seconds, or the
+            initial delay while too few are known.
+        """
+        with self._lock:
+            if len(self._latencies) < self._policy.min_samples:
+                return self._policy.initial_delay
+            ordered = sorted(self._latencies)
+        rank = math.ceil(self._policy.percentile / 100 * len(ordered))
+        return ordered[max(0, rank - 1)]
+
+    def record(self, latency: float) -> None:
+        """Add the latency of a successful request to the history.
+
+        Args:
+            latency: The latency in seconds.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request, hedging it if it is slow.
+
+        Args:
+            send: Sends one copy of the request.
+
+        Returns:
+            The result of the first copy to succeed.
+
+        Raises:
+            Exception: The error of the first copy, if every copy fails.
+        """
+        self._budget.record_request()
+        started: dict[asyncio.Future[T], float] = {}
+
+        def launch() -> None:
+            started[asyncio.ensure_future(send())] = self._clock()
+
+        launch()
+        hedges = 0
+        error: BaseException | None = None
+        try:
+            while True:
+                can_hedge = hedges < self._policy.max_hedges
+                pending = [copy for copy in started if not copy.done()]
+                if not pending and error is not None:
+                    raise error
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.delay() if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if self._budget.try_withdraw():
+                        launch()
+                        hedges += 1
+                    else:
+                        hedges = self._policy.max_hedges
+                    continue
+
+                for copy in done:
+                    copy_error = copy.exception()
+                    if copy_error is None:
+                        self.record(self._clock() - started[copy])
+                        return copy.result()
+                    if error is None:
+                        error = copy_error
+        finally:
+            losers = [copy for copy in started if not copy.done()]
+            for copy in losers:
+                copy.cancel()
+            # Let the cancelled copies release what they hold
+            await asyncio.gather(*losers, return_exceptions=True)
@@ -0,0 +1,225 @@
+"""Rate and concurrency limits shared by the processes on one host."""
+
+import asyncio
+import importlib
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from types import ModuleType
+
+from pyagentai.exceptions import AgentAIError
+from pyagentai.types.policies import HostLimitPolicy
+
+
+def _import_fcntl() -> ModuleType | None:
+    """Import ``fcntl``, which only exists on POSIX systems."""
+    try:
+        return importlib.import_module("fcntl")
+    except ImportError:
+        return None
+
+
+_fcntl = _import_fcntl()
+
+# The token bucket's balance and the time up to which it was refilled.
+_BUCKET = struct.Struct("dd")
+
+
+class HostLimiter:
+    """Token bucket and concurrency slots shared through locked files.
+
+    The bucket lives in ``<path>.rate`` and is updated under an exclusive
+    ``flock``, which is held only for the few microseconds it takes to
+    read and write it. Each concurrency slot is a file ``<path>.slot<n>``
+    that is held with a non-blocking ``flock``; the operating system
+    releases it if its process dies, so crashed workers cannot leak
+    slots. Files are opened lazily and reopened after a fork, because
+    file locks are shared by processes that inherit the same descriptor.
+
+    Times are taken from the wall clock, the only clock that every
+    process on the host agrees on.
+    """
+
+    def __init__(
+        self,
+        policy: HostLimitPolicy,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize a limiter without opening its files yet.
+
+        Args:
+            policy: The shared files and the limits they enforce.
+            clock: Source of the current time in seconds, shared by the
+                processes.
+
+        Raises:
+            AgentAIError: If the platform has no file locks.
+        """
+        if _fcntl is None:
+            raise AgentAIError(
+                "Host-wide limits need POSIX file locks, which are not "
+                "available on this platform"
+            )
+        self._fcntl = _fcntl
+        self._policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._bucket_fd: int | None = None
+        self._slot_fds: list[int] = []
+        self._held: set[int] = set()
+
+    def _open(self) -> None:
+        """Open the shared files in this process. Called with the lock."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        self._close_files()
+        flags = os.O_RDWR | os.O_CREAT
+        if self._policy.rate is not None:
+            self._bucket_fd = os.open(f"{self._policy.path}.rate", flags)
+        for slot in range(self._policy.max_concurrency or 0):
+            self._slot_fds.append(
+                os.open(f"{self._policy.path}.slot{slot}", flags)
+            )
+        self._pid = pid
+
+    def _close_files(self) -> None:
+        """Close the shared files. Called with the lock held."""
+        for fd in [self._bucket_fd, *self._slot_fds]:
+            if fd is not None:
+                os.close(fd)
+        self._bucket_fd = None
+        self._slot_fds = []
+        self._held = set()
+        self._pid = None
+
+    def close(self) -> None:
+        """Close the shared files, releasing any slots still held.
+
+        The files are reopened if the limiter is used again.
+        """
+        with self._lock:
+            self._close_files()
+
+    def _update_bucket(
+        self, change: float, max_wait: float | None
+    ) -> float | None:
+        """Add to the shared bucket's balance, unless the wait is too long.
+
+        Args:
+            change: The tokens to add, negative to take tokens.
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            The seconds until the balance is no longer negative, or None
+            if that is longer than ``max_wait``, in which case the
+            balance is left unchanged.
+        """
+        policy = self._policy
+        rate = policy.rate or 0.0
+        with self._lock:
+            self._open()
+            fd = self._bucket_fd
+            if fd is None:
+                # No rate limit is configured
+                return 0.0
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+            try:
+                now = self._clock()
+                data = os.pread(fd, _BUCKET.size, 0)
+                tokens, updated = float(policy.burst), now
+                if len(data) == _BUCKET.size:
+                    tokens, updated = _BUCKET.unpack(data)
+                if now > updated:
+                    earned = (now - updated) * rate
+                    tokens = min(policy.burst, tokens + earned)
+                    updated = now
+                tokens = min(policy.burst, tokens + change)
+                wait = max(0.0, -tokens) / rate
+                if max_wait is not None and wait > max_wait:
+                    return None
+                os.pwrite(fd, _BUCKET.pack(tokens, updated), 0)
+                return wait
+            finally:
+                self._fcntl.flock(fd, self._fcntl.LOCK_UN)
+
+    async def acquire(self, max_wait: float | None = None) -> bool:
+        """Wait for a token from the host's shared rate limit.
+
+        Args:
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            Whether a token was acquired. False means it would have taken
+            longer than ``max_wait``, and nothing was waited for.
+        """
+        if self._policy.rate is None:
+            return True
+        wait = self._update_bucket(-1.0, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._update_bucket(1.0, None)
+                raise
+        return True
+
+    def _try_slot(self) -> int | None:
+        """Take a free concurrency slot without waiting."""
+        with self._lock:
+            self._open()
+            for slot, fd in enumerate(self._slot_fds):
+                if slot in self._held:
+                    continue
+                try:
+                    self._fcntl.flock(
+                        fd, self._fcntl.LOCK_EX | self._fcntl.LOCK_NB
+                    )
+                except BlockingIOError:
+                    continue
+                self._held.add(slot)
+                return slot
+        return None
+
+    async def acquire_slot(self, max_wait: float | None = None) -> int | None:
+        """Wait for one of the host's shared concurrency slots.
+
+        Args:
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            The slot to pass to :meth:`release_slot`, or None if no slot
+            became free within ``max_wait``. Always -1 without a
+            concurrency limit.
+        """
+        if self._policy.max_concurrency is None:
+            return -1
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            slot = self._try_slot()
+            if slot is not None:
+                return slot
+            delay = self._policy.poll_interval
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return None
+                delay = min(delay, left)
+            await asyncio.sleep(delay)
+
+    def release_slot(self, slot: int) -> None:
+        """Free a slot taken by :meth:`acquire_slot`.
+
+        Args:
+            slot: The slot to free.
+        """
+        with self._lock:
+            if slot not in self._held or self._pid != os.getpid():
+                return
+            self._fcntl.flock(self._slot_fds[slot], self._fcntl.LOCK_UN)
+            self._held.discard(slot)
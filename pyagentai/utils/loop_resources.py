@@ -0,0 +1,73 @@
+"""Per-event-loop ownership of HTTP clients and background tasks."""
+
+import asyncio
+from collections.abc import Hashable
+from contextlib import suppress
+
+import httpx
+
+from pyagentai.types.url_endpoint import UrlType
+from pyagentai.utils.transport_registry import shared_client_registry
+
+
+def current_loop() -> asyncio.AbstractEventLoop | None:
+    """Get the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LoopResources:
+    """HTTP clients and background tasks bound to one event loop.
+
+    httpx connection pools and asyncio tasks can only be used from the
+    event loop they were created on, so a client that is driven from
+    several loops keeps one set of these per loop.
+
+    Attributes:
+        http_clients: The HTTP client for each host.
+        shared_keys: Registry keys of the clients taken from the shared
+            transport registry, by host.
+        keepalive_task: The background keep-alive ping task, if running.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty resources."""
+        self.http_clients: dict[UrlType, httpx.AsyncClient] = {}
+        self.shared_keys: dict[UrlType, Hashable] = {}
+        self.keepalive_task: asyncio.Task[None] | None = None
+
+    async def aclose(self) -> None:
+        """Stop background tasks and close or release the HTTP clients.
+
+        Must be awaited on the loop the resources belong to.
+        """
+        if self.keepalive_task is not None:
+            self.keepalive_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.keepalive_task
+            self.keepalive_task = None
+
+        http_clients = self.http_clients
+        shared_keys = self.shared_keys
+        self.http_clients = {}
+        self.shared_keys = {}
+
+        for url_type, http_client in http_clients.items():
+            if url_type not in shared_keys and not http_client.is_closed:
+                await http_client.aclose()
+        for shared_key in shared_keys.values():
+            await shared_client_registry.release(shared_key)
+
+    def discard(self) -> None:
+        """Drop the resources of a loop that can no longer run them.
+
+        The connections cannot be closed gracefully without their loop,
+        so they are left to be closed when garbage collected.
+        """
+        for shared_key in self.shared_keys.values():
+            shared_client_registry.discard(shared_key)
+        self.http_clients = {}
+        self.shared_keys = {}
+        self.keepalive_task = None
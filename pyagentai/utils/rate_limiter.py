@@ -0,0 +1,201 @@
+"""Token-bucket rate limiting that follows the API's rate limit headers."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+
+from pyagentai.types.policies import RateLimitPolicy
+from pyagentai.utils.retry import parse_retry_after
+
+# A reset larger than this is a Unix timestamp rather than a delay.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_number(value: str | None) -> float | None:
+    """Parse a numeric header value, ignoring any parameters."""
+    if value is None:
+        return None
+    try:
+        return float(value.split(";")[0].split(",")[0].strip())
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str],
+) -> tuple[float | None, float | None]:
+    """Read the remaining quota and its reset time from response headers.
+
+    Both the ``RateLimit-*`` headers of the IETF draft and the common
+    ``X-RateLimit-*`` headers are understood. A reset given as a Unix
+    timestamp is converted to a delay.
+
+    Args:
+        headers: The response headers.
+
+    Returns:
+        The requests remaining in the current window and the seconds
+        until the window resets. Either is None if not reported.
+    """
+    remaining = _parse_number(
+        headers.get("RateLimit-Remaining")
+        or headers.get("X-RateLimit-Remaining")
+    )
+    reset = _parse_number(
+        headers.get("RateLimit-Reset") or headers.get("X-RateLimit-Reset")
+    )
+    if reset is not None and reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    if reset is not None:
+        reset = max(0.0, reset)
+    return remaining, reset
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests.
+
+    Tokens accrue at ``rate`` per second up to ``burst``. Each request
+    reserves a token, possibly driving the balance negative, and waits
+    until its token would have accrued, so waiting requests are served in
+    order without being woken up in between. The bucket works with any
+    event loop.
+    """
+
+    def __init__(
+        self,
+        policy: RateLimitPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            policy: The configured rate and burst.
+            clock: Source of the current time in seconds.
+        """
+        self._policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = policy.rate
+        self._tokens = float(policy.burst)
+        # Time up to which tokens have been accrued. It lies in the future
+        # while the API has asked to pause.
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        """The current rate in requests per second."""
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """The current balance. Negative while requests are waiting."""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    @property
+    def idle(self) -> bool:
+        """Whether the bucket is full and not paused, like a new one."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return (
+                self._updated <= now and self._tokens >= self._policy.burst
+            )
+
+    def _refill(self, now: float) -> None:
+        """Accrue the tokens earned since the last update."""
+        if now > self._updated:
+            earned = (now - self._updated) * self._rate
+            self._tokens = min(self._policy.burst, self._tokens + earned)
+            self._updated = now
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Reserve a token.
+
+        Args:
+            max_wait: The longest acceptable wait, in seconds. No token is
+                reserved if the wait would be longer.
+
+        Returns:
+            The seconds to wait before using the token, or None if it
+            would take longer than ``max_wait``.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            tokens = self._tokens - 1
+            wait = max(0.0, self._updated - now)
+            wait += max(0.0, -tokens) / self._rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens = tokens
+            return wait
+
+    def release(self) -> None:
+        """Return a reserved token that was not used."""
+        with self._lock:
+            self._tokens = min(self._policy.burst, self._tokens + 1)
+
+    async def acquire(self, max_wait: float | None = None) -> bool:
+        """Wait for a token.
+
+        Args:
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            Whether a token was acquired. False means it would have taken
+            longer than ``max_wait``, and nothing was waited for.
+        """
+        wait = self.reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for a while.
+
+        Args:
+            seconds: How long to pause.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def observe(self, headers: Mapping[str, str], status_code: int) -> None:
+        """Adjust the bucket to the limits reported by the API.
+
+        With a quota left, the rate becomes the one that spreads the
+        remaining requests evenly until the window resets. With no quota
+        left, or on a 429 with ``Retry-After``, requests are paused.
+
+        Args:
+            headers: The response headers.
+            status_code: The response status code.
+        """
+        if not self._policy.adapt_to_headers:
+            return
+
+        remaining, reset = parse_rate_limit_headers(headers)
+        if remaining is not None:
+            with self._lock:
+                self._refill(self._clock())
+                self._tokens = min(self._tokens, remaining)
+                if remaining > 0 and reset:
+                    self._rate = remaining / reset
+            if remaining <= 0 and reset is not None:
+                self.pause(reset)
+
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                self.pause(retry_after)
@@ -0,0 +1,51 @@
+"""Request-scoped settings carried through context variables.
+
+Values set here apply to every request made from the current context,
+including tasks spawned from it, without having to thread them through
+each API method's signature.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from pyagentai.types.priority import RequestPriority
+
+T = TypeVar("T")
+
+api_key_override: ContextVar[str | None] = ContextVar(
+    "pyagentai_api_key_override", default=None
+)
+
+# Absolute deadline, in ``time.monotonic()`` seconds.
+request_deadline: ContextVar[float | None] = ContextVar(
+    "pyagentai_request_deadline", default=None
+)
+
+request_priority: ContextVar[RequestPriority] = ContextVar(
+    "pyagentai_request_priority", default=RequestPriority.NORMAL
+)
+
+# Caller-supplied ID that requests are queued fairly by.
+request_tenant: ContextVar[str | None] = ContextVar(
+    "pyagentai_request_tenant", default=None
+)
+
+
+@contextmanager
+def scoped_value(var: ContextVar[T], value: T) -> Iterator[T]:
+    """Set a context variable for the duration of a ``with`` block.
+
+    Args:
+        var: The context variable to set.
+        value: The value to set for the block.
+
+    Yields:
+        The value that was set.
+    """
+    token = var.set(value)
+    try:
+        yield value
+    finally:
+        var.reset(token)
@@ -0,0 +1,103 @@
+"""Collection of per-phase request timings from httpcore trace events."""
+
+import time
+from typing import Any
+
+from pyagentai.types.request_timings import RequestTimings
+
+
+class RequestTimer:
+    """Record httpcore trace events for one request and derive timings.
+
+    Pass :meth:`trace` as the ``"trace"`` request extension. httpcore
+    reports DNS resolution as part of opening the TCP connection, so the
+    two are measured together as the ``connect`` phase.
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        """Start timing a request.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request.
+        """
+        self.method = method
+        self.url = url
+        self._started = time.perf_counter()
+        self._first_event: float | None = None
+        self._events: dict[str, float] = {}
+
+    async def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record the time of an httpcore trace event.
+
+        Args:
+            event_name: The event name, e.g. ``"http2.send_request_headers
+                .started"``.
+            info: Event details, unused.
+        """
+        now = time.perf_counter()
+        if self._first_event is None:
+            self._first_event = now
+
+        # Normalize "http11.x" and "http2.x" to "x".
+        prefix, _, name = event_name.partition(".")
+        if prefix in ("http11", "http2"):
+            event_name = name
+        self._events.setdefault(event_name, now)
+
+    def _span(self, start: str, end: str) -> float | None:
+        """Duration between two recorded events, if both happened."""
+        started = self._events.get(start)
+        ended = self._events.get(end)
+        if started is None or ended is None:
+            return None
+        return ended - started
+
+    def finish(self, status_code: int | None = None) -> RequestTimings:
+        """Stop timing and build the timing breakdown.
+
+        Args:
+            status_code: The response status code, if a response arrived.
+
+        Returns:
+            The timings of the request.
+        """
+        total = time.perf_counter() - self._started
+        pool_wait = None
+        if self._first_event is not None:
+            pool_wait = self._first_event - self._started
+
+        connect = self._span(
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+        )
+        if connect is None:
+            connect = self._span(
+                "connection.connect_unix_socket.started",
+                "connection.connect_unix_socket.complete",
+            )
+
+        return RequestTimings(
+            method=self.method,
+            url=self.url,
+            status_code=status_code,
+            pool_wait=pool_wait,
+            connect=connect,
+            tls=self._span(
+                "connection.start_tls.started",
+                "connection.start_tls.complete",
+            ),
+            request_write=self._span(
+                "send_request_headers.started",
+                "send_request_body.complete",
+            ),
+            time_to_first_byte=self._span(
+                "send_request_body.complete",
+                "receive_response_headers.complete",
+            ),
+            body_read=self._span(
+                "receive_response_body.started",
+                "receive_response_body.complete",
+            ),
+            total=total,
+        )
@@ -0,0 +1,119 @@
+"""Backoff, Retry-After parsing and retry budgets."""
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from pyagentai.types.policies import RetryBudgetPolicy, RetryPolicy
+
+
+def backoff_delay(
+    policy: RetryPolicy,
+    retry: int,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """Get the time to wait before a retry.
+
+    Args:
+        policy: The retry policy of the endpoint.
+        retry: The number of the retry, starting at 1.
+        rand: Source of uniform random numbers in [0, 1).
+
+    Returns:
+        The backoff in seconds.
+    """
+    delay = min(
+        policy.max_backoff,
+        policy.initial_backoff * policy.multiplier ** (retry - 1),
+    )
+    if policy.jitter:
+        delay *= rand()
+    return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP
+            date.
+
+    Returns:
+        The seconds to wait, or None if the header is missing or invalid.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Thread-safe cap on retries as a fraction of recent requests.
+
+    Requests and retries are counted in one-second buckets over a sliding
+    window. A retry is allowed while the retries in the window stay below
+    ``ratio`` times the requests in the window plus a fixed allowance of
+    ``min_retries_per_second`` per second.
+    """
+
+    def __init__(
+        self,
+        policy: RetryBudgetPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty budget.
+
+        Args:
+            policy: The size of the budget.
+            clock: Source of the current time in seconds.
+        """
+        self._policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Buckets of [second, requests, retries], oldest first.
+        self._buckets: deque[list[int]] = deque()
+
+    def _current_bucket(self) -> list[int]:
+        """Get the bucket of the current second, dropping expired ones."""
+        second = int(self._clock())
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        while self._buckets[0][0] <= second - self._policy.window:
+            self._buckets.popleft()
+        return self._buckets[-1]
+
+    def record_request(self) -> None:
+        """Record a request, which adds to the budget."""
+        with self._lock:
+            self._current_bucket()[1] += 1
+
+    def try_withdraw(self) -> bool:
+        """Take one retry from the budget if any is left.
+
+        Returns:
+            Whether the retry is allowed.
+        """
+        with self._lock:
+            bucket = self._current_bucket()
+            requests = sum(b[1] for b in self._buckets)
+            retries = sum(b[2] for b in self._buckets)
+            allowed = (
+                self._policy.ratio * requests
+                + self._policy.min_retries_per_second * self._policy.window
+            )
+            if retries + 1 > allowed:
+                return False
+            bucket[2] += 1
+            return True
@@ -0,0 +1,111 @@
+"""Coalescing of identical concurrent calls into one."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """A shared call and the number of callers waiting for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Runs one call at a time per key and shares its outcome.
+
+    Callers that arrive while a call with their key is in flight wait for
+    that call instead of starting their own. A caller that is cancelled
+    stops waiting without cancelling the call, unless it was the last
+    one waiting. Calls only coalesce within an event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._flights: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], _Flight[T]
+        ] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """The number of calls that joined a call already in flight."""
+        return self._coalesced
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> T:
+        """Make a call, or join the one in flight with the same key.
+
+        Args:
+            key: Identifies calls that are interchangeable.
+            call: Makes the call. It runs in the context of the caller
+                that started it.
+            timeout: The longest this caller waits for the call, in
+                seconds. Giving up does not cancel the call while other
+                callers still wait for it.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            asyncio.TimeoutError: If the call did not finish within
+                ``timeout``.
+            Exception: The error of the shared call.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            if flight is None:
+                flight = _Flight(loop.create_task(_await(call)))
+                self._flights[flight_key] = flight
+                flight.task.add_done_callback(
+                    lambda _: self._land(flight_key, flight)
+                )
+            else:
+                self._coalesced += 1
+            flight.waiters += 1
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(flight.task), timeout
+            )
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0
+            if abandoned and not flight.task.done():
+                flight.task.cancel()
+
+    def _land(
+        self,
+        flight_key: tuple[asyncio.AbstractEventLoop, Hashable],
+        flight: _Flight[T],
+    ) -> None:
+        """Forget a finished call, so later callers start a new one."""
+        with self._lock:
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
+        if not flight.task.cancelled():
+            # Mark the error as retrieved if every caller gave up
+            flight.task.exception()
+
+
+async def _await(call: Callable[[], Awaitable[T]]) -> T:
+    """Turn a callable returning an awaitable into a coroutine."""
+    return await call()
@@ -0,0 +1,99 @@
+"""Transport that stripes requests over several HTTP/2 connections."""
+
+from collections.abc import AsyncIterator, Callable, Sequence
+
+import httpx
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response stream that reports when it has been closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+        await self._stream.aclose()
+
+
+class StripedTransport(httpx.AsyncBaseTransport):
+    """Spread requests over several transports, least-loaded first.
+
+    A single HTTP/2 connection is capped by the server's limit on
+    concurrent streams, and large response bodies share its flow-control
+    window. Striping requests over several connections lifts both caps.
+    A request counts as in flight on its stripe until its response body
+    has been read or closed.
+    """
+
+    def __init__(
+        self, transports: Sequence[httpx.AsyncBaseTransport]
+    ) -> None:
+        """Initialize the striped transport.
+
+        Args:
+            transports: The transports to stripe requests over, usually
+                each limited to a single HTTP/2 connection.
+
+        Raises:
+            ValueError: If no transports are given.
+        """
+        if not transports:
+            raise ValueError("At least one transport is required.")
+        self._transports = list(transports)
+        self._in_flight = [0] * len(self._transports)
+
+    @property
+    def in_flight(self) -> list[int]:
+        """Number of in-flight requests on each stripe."""
+        return list(self._in_flight)
+
+    def _release(self, index: int) -> None:
+        self._in_flight[index] -= 1
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """Send a request on the stripe with the fewest in-flight requests.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response, whose stream releases the stripe when closed.
+        """
+        index = min(
+            range(len(self._transports)), key=self._in_flight.__getitem__
+        )
+        self._in_flight[index] += 1
+        try:
+            response = await self._transports[index].handle_async_request(
+                request
+            )
+        except BaseException:
+            self._release(index)
+            raise
+
+        stream = response.stream
+        if not isinstance(stream, httpx.AsyncByteStream):
+            self._release(index)
+            return response
+        response.stream = _TrackedStream(
+            stream, lambda: self._release(index)
+        )
+        return response
+
+    async def aclose(self) -> None:
+        """Close every stripe."""
+        for transport in self._transports:
+            await transport.aclose()
@@ -0,0 +1,130 @@
+"""Process-wide registry of shared HTTP clients."""
+
+import threading
+from collections.abc import Callable, Hashable
+
+import httpx
+
+
+class SharedClientRegistry:
+    """Reference-counted registry of shared ``httpx.AsyncClient`` objects.
+
+    Clients are keyed by base URL and transport settings. Every user
+    acquires a client with :meth:`acquire` and hands it back with
+    :meth:`release`; the client is only closed once its last user has
+    released it. This lets many ``AgentAIClient`` objects multiplex over
+    one warm connection pool instead of each opening its own connections.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._clients: dict[Hashable, httpx.AsyncClient] = {}
+        self._ref_counts: dict[Hashable, int] = {}
+
+    def _get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], httpx.AsyncClient],
+    ) -> httpx.AsyncClient:
+        """Get the live client for a key, replacing it if it was closed.
+
+        Must be called with the registry lock held.
+        """
+        http_client = self._clients.get(key)
+        if http_client is None or http_client.is_closed:
+            http_client = factory()
+            self._clients[key] = http_client
+            self._ref_counts.setdefault(key, 0)
+        return http_client
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], httpx.AsyncClient],
+    ) -> httpx.AsyncClient:
+        """Take a reference to the shared client for a key.
+
+        Args:
+            key: The key identifying the base URL and transport settings.
+            factory: Callable that builds a new client for the key.
+
+        Returns:
+            The shared HTTP client for the key.
+        """
+        with self._lock:
+            http_client = self._get_or_create(key, factory)
+            self._ref_counts[key] += 1
+            return http_client
+
+    def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], httpx.AsyncClient],
+    ) -> httpx.AsyncClient:
+        """Get the shared client for a key already held by the caller.
+
+        Unlike :meth:`acquire`, this does not take a new reference.
+
+        Args:
+            key: The key identifying the base URL and transport settings.
+            factory: Callable that builds a new client for the key.
+
+        Returns:
+            The shared HTTP client for the key.
+        """
+        with self._lock:
+            return self._get_or_create(key, factory)
+
+    async def release(self, key: Hashable) -> None:
+        """Release one reference to the shared client for a key.
+
+        The client is closed and removed from the registry when the
+        last reference is released.
+
+        Args:
+            key: The key the client was acquired with.
+        """
+        with self._lock:
+            if key not in self._ref_counts:
+                return
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key] > 0:
+                return
+            del self._ref_counts[key]
+            http_client = self._clients.pop(key)
+
+        if not http_client.is_closed:
+            await http_client.aclose()
+
+    def discard(self, key: Hashable) -> None:
+        """Release one reference without closing the client.
+
+        Used when the client's event loop is gone and it can no longer
+        be closed gracefully.
+
+        Args:
+            key: The key the client was acquired with.
+        """
+        with self._lock:
+            if key not in self._ref_counts:
+                return
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key] <= 0:
+                del self._ref_counts[key]
+                del self._clients[key]
+
+    def ref_count(self, key: Hashable) -> int:
+        """Get the number of users of the shared client for a key.
+
+        Args:
+            key: The key identifying the shared client.
+
+        Returns:
+            The number of users holding a reference to the client.
+        """
+        with self._lock:
+            return self._ref_counts.get(key, 0)
+
+
+shared_client_registry = SharedClientRegistry()
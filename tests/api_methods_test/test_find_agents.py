@@ -5,6 +5,7 @@ import pytest
 from pytest import MonkeyPatch  # noqa: PT013
 
 from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
 from pyagentai.types.agent_info import AgentInfo
 
 
@@ -219,3 +220,29 @@ async def test_find_agents_handles_empty_response(
 
     assert isinstance(agents, list)
     assert len(agents) == 0
+
+
+@pytest.mark.asyncio()
+async def test_find_agents_serves_pages_from_the_agent_cache(
+    mock_agents_response: dict, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that every page of a cached search is served from memory."""
+    client = AgentAIClient(
+        api_key="test_key", config=AgentAIConfig(agent_cache_ttl=60)
+    )
+    mock_response = httpx.Response(200, json=mock_agents_response)
+    monkeypatch.setattr(
+        client, "_make_request", AsyncMock(return_value=mock_response)
+    )
+
+    first_page = await client.find_agents(tag="a", limit=2)
+    second_page = await client.find_agents(tag=" A ", offset=2, limit=2)
+    await client.find_agents(tag="b")
+
+    assert [agent.agent_id for agent in first_page] == ["1", "2"]
+    assert [agent.agent_id for agent in second_page] == ["3", "4"]
+    assert client._make_request.await_count == 2
+
+    await client.clear_cache()
+    await client.find_agents(tag="a")
+    assert client._make_request.await_count == 3
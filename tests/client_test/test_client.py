@@ -1,3 +1,6 @@
+import asyncio
+import gzip
+import json
 from typing import Any
 
 import httpx
@@ -5,10 +8,13 @@ import pytest
 
 from pyagentai.client import AgentAIClient
 from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.request_timings import RequestTimings
+from pyagentai.types.transport import CompressionConfig, ContentEncoding
 from pyagentai.types.url_endpoint import (
     Endpoint,
     EndpointParameter,
     ParameterType,
+    UrlType,
 )
 
 
@@ -130,7 +136,9 @@ async def test_make_request_successful(
         return httpx.Response(200, json={"status": "ok"})
 
     transport = httpx.MockTransport(mock_response)
-    client._http_client = httpx.AsyncClient(transport=transport)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=transport
+    )
 
     response = await client._make_request(
         endpoint=mock_endpoint, data={"required_param": "value"}
@@ -158,7 +166,9 @@ async def test_make_request_http_status_error(
     transport = httpx.MockTransport(
         lambda req: httpx.Response(500, json={"detail": "Server Error"})
     )
-    client._http_client = httpx.AsyncClient(transport=transport)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=transport
+    )
 
     with pytest.raises(ValueError, match="HTTP error 500"):
         await client._make_request(
@@ -176,9 +186,208 @@ async def test_make_request_timeout_error(
         raise httpx.TimeoutException("timeout")
 
     transport = httpx.MockTransport(raise_timeout)
-    client._http_client = httpx.AsyncClient(transport=transport)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=transport
+    )
 
     with pytest.raises(ValueError, match="API request timed out"):
         await client._make_request(
             endpoint=mock_endpoint, data={"required_param": "value"}
         )
+
+
+@pytest.mark.asyncio()
+async def test_as_tenant_overrides_api_key(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that requests inside as_tenant use the tenant's API key."""
+    seen_keys: list[str] = []
+
+    def mock_response(request: httpx.Request) -> httpx.Response:
+        seen_keys.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"status": "ok"})
+
+    transport = httpx.MockTransport(mock_response)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=transport
+    )
+    data = {"required_param": "value"}
+
+    with client.as_tenant("tenant_key") as tenant:
+        assert tenant is client
+        await client._make_request(endpoint=mock_endpoint, data=data)
+    await client._make_request(endpoint=mock_endpoint, data=data)
+
+    assert seen_keys == ["Bearer tenant_key", "Bearer test_key"]
+    assert client.config.api_key == "test_key"
+
+
+@pytest.mark.asyncio()
+async def test_as_tenant_is_isolated_between_tasks(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that concurrent tenants do not see each other's keys."""
+    seen_keys: dict[str, str] = {}
+
+    def mock_response(request: httpx.Request) -> httpx.Response:
+        tenant = request.url.params["required_param"]
+        seen_keys[tenant] = request.headers["Authorization"]
+        return httpx.Response(200, json={})
+
+    transport = httpx.MockTransport(mock_response)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=transport
+    )
+
+    async def call_as(tenant: str) -> None:
+        with client.as_tenant(f"{tenant}_key"):
+            await asyncio.sleep(0)
+            await client._make_request(
+                endpoint=mock_endpoint, data={"required_param": tenant}
+            )
+
+    await asyncio.gather(call_as("a"), call_as("b"))
+
+    assert seen_keys == {"a": "Bearer a_key", "b": "Bearer b_key"}
+
+
+def test_as_tenant_rejects_empty_key(client: AgentAIClient) -> None:
+    """Test that an empty tenant API key is rejected."""
+    with pytest.raises(ValueError, match="API key cannot be empty"):  # noqa: SIM117
+        with client.as_tenant("  "):
+            pass
+
+
+@pytest.mark.asyncio()
+async def test_make_request_negotiates_compression(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that large bodies are compressed and transfers are counted."""
+    config = AgentAIConfig(
+        compression=CompressionConfig(
+            response_encodings=(ContentEncoding.GZIP,),
+            request_encoding=ContentEncoding.GZIP,
+            request_min_size=10,
+        )
+    )
+    client = AgentAIClient(api_key="test_key", config=config)
+    endpoint = mock_endpoint.with_overrides(
+        body_parameters=[
+            EndpointParameter(name="prompt", param_type=ParameterType.STRING)
+        ]
+    )
+    payload = b'{"response":"' + b"x" * 2000 + b'"}'
+
+    def mock_response(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Accept-Encoding"] == "gzip"
+        assert request.headers["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(request.content))
+        assert body == {"prompt": "p" * 500}
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(gzip.compress(payload)),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(mock_response)
+    )
+
+    response = await client._make_request(
+        endpoint=endpoint,
+        data={"required_param": "value", "prompt": "p" * 500},
+    )
+
+    assert response.content == payload
+    stats = client.transfer_stats
+    assert stats.requests == 1
+    assert stats.request_bytes > stats.request_bytes_sent
+    assert stats.response_bytes == len(payload)
+    assert stats.response_compression_ratio > 10
+
+
+@pytest.mark.asyncio()
+async def test_make_request_skips_compression_for_small_bodies(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that bodies below the size threshold are sent as plain JSON."""
+    client.config.compression = CompressionConfig(
+        request_encoding=ContentEncoding.GZIP
+    )
+
+    def mock_response(request: httpx.Request) -> httpx.Response:
+        assert "Content-Encoding" not in request.headers
+        assert request.content == b"{}"
+        return httpx.Response(200, json={})
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(mock_response)
+    )
+
+    await client._make_request(
+        endpoint=mock_endpoint, data={"required_param": "value"}
+    )
+    assert client.transfer_stats.request_compression_ratio == 1.0
+
+
+@pytest.mark.asyncio()
+async def test_make_request_reports_timings(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that timings reach the response and sync and async hooks."""
+    sync_timings: list[RequestTimings] = []
+    async_timings: list[RequestTimings] = []
+
+    async def async_hook(timings: RequestTimings) -> None:
+        async_timings.append(timings)
+
+    def failing_hook(timings: RequestTimings) -> None:
+        raise RuntimeError("hook failure")
+
+    client.add_timing_hook(sync_timings.append)
+    client.add_timing_hook(async_hook)
+    client.add_timing_hook(failing_hook)
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={}))
+    )
+
+    response = await client._make_request(
+        endpoint=mock_endpoint, data={"required_param": "value"}
+    )
+
+    timings = response.extensions["timings"]
+    assert isinstance(timings, RequestTimings)
+    assert timings.status_code == 200
+    assert timings.method == "GET"
+    assert sync_timings == [timings]
+    assert async_timings == [timings]
+
+    client.remove_timing_hook(async_hook)
+    await client._make_request(
+        endpoint=mock_endpoint, data={"required_param": "value"}
+    )
+    assert len(sync_timings) == 2
+    assert len(async_timings) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_reports_timings_on_failure(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that failed requests still report their timings."""
+    reported: list[RequestTimings] = []
+    client.add_timing_hook(reported.append)
+
+    def raise_error(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(raise_error)
+    )
+
+    with pytest.raises(ValueError, match="HTTP error"):
+        await client._make_request(
+            endpoint=mock_endpoint, data={"required_param": "value"}
+        )
+    assert len(reported) == 1
+    assert reported[0].status_code is None
@@ -0,0 +1,130 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import BulkheadFullError
+from pyagentai.types.policies import BulkheadPolicy
+from pyagentai.types.url_endpoint import (
+    Endpoint,
+    EndpointParameter,
+    ParameterType,
+)
+
+
+@pytest.fixture()
+def gate() -> asyncio.Event:
+    """Provides an event that holds requests until it is set."""
+    return asyncio.Event()
+
+
+@pytest.fixture()
+def gated_client(gate: asyncio.Event) -> AgentAIClient:
+    """Provides a client whose requests hang until the gate opens."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await gate.wait()
+        return httpx.Response(200, json={})
+
+    return AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.fixture()
+def mode_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an endpoint with a mode parameter in its body."""
+    return mock_endpoint.with_overrides(
+        body_parameters=(
+            EndpointParameter(name="mode", param_type=ParameterType.STRING),
+        ),
+    )
+
+
+def _call(
+    client: AgentAIClient, endpoint: Endpoint, mode: str
+) -> "asyncio.Task[httpx.Response]":
+    return asyncio.create_task(
+        client._make_request(
+            endpoint, {"required_param": "value", "mode": mode}
+        )
+    )
+
+
+def test_bulkhead_costs_accept_a_mapping() -> None:
+    """Test that costs may be given as a mapping of value to cost."""
+    policy = BulkheadPolicy(slots=10, parameter="mode", costs={"crawl": 5})
+
+    assert policy.cost_for("crawl") == 5
+    assert policy.cost_for("scrape") == 1
+    assert policy.cost_for(None) == 1
+
+
+@pytest.mark.asyncio()
+async def test_bulkhead_weighs_calls_by_cost(
+    gated_client: AgentAIClient,
+    gate: asyncio.Event,
+    mode_endpoint: Endpoint,
+) -> None:
+    """Test that a costly call fills the bulkhead for cheaper ones."""
+    endpoint = mode_endpoint.with_overrides(
+        bulkhead=BulkheadPolicy(
+            slots=4, parameter="mode", costs={"crawl": 4}, max_wait=0.05
+        )
+    )
+    crawl = _call(gated_client, endpoint, "crawl")
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(BulkheadFullError, match="/test"):
+        await gated_client._make_request(
+            endpoint, {"required_param": "value", "mode": "scrape"}
+        )
+
+    gate.set()
+    await crawl
+
+
+@pytest.mark.asyncio()
+async def test_bulkhead_partitions_by_parameter(
+    gated_client: AgentAIClient,
+    gate: asyncio.Event,
+    mode_endpoint: Endpoint,
+) -> None:
+    """Test that each mode gets a pool of its own."""
+    endpoint = mode_endpoint.with_overrides(
+        bulkhead=BulkheadPolicy(
+            slots=1, parameter="mode", partition=True, max_wait=0.05
+        )
+    )
+    crawls = [_call(gated_client, endpoint, "crawl") for _ in range(2)]
+    scrape = _call(gated_client, endpoint, "scrape")
+    await asyncio.sleep(0.1)
+    gate.set()
+
+    results = await asyncio.gather(*crawls, scrape, return_exceptions=True)
+
+    # One crawl waited past max_wait, the scrape had its own pool
+    assert sum(isinstance(r, BulkheadFullError) for r in results) == 1
+    assert isinstance(results[2], httpx.Response)
+
+
+@pytest.mark.asyncio()
+async def test_bulkhead_slots_are_returned(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that failed and successful calls both free their slots."""
+    client = AgentAIClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda _: httpx.Response(500)),
+    )
+    endpoint = mock_endpoint.with_overrides(
+        bulkhead=BulkheadPolicy(slots=1, max_wait=0)
+    )
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="API request failed"):
+            await client._make_request(endpoint, {"required_param": "v"})
+
+    (pool,) = client._bulkheads.values()
+    assert pool.in_use == 0
@@ -0,0 +1,177 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.exceptions import APIStatusError
+from pyagentai.types.cache import CacheEntry
+from pyagentai.types.policies import CachePolicy, RetryPolicy
+from pyagentai.types.url_endpoint import Endpoint
+from pyagentai.utils.cache import MemoryCache
+
+
+@pytest.fixture()
+def responses() -> list[httpx.Response]:
+    """Provides the responses the mock API returns, in order."""
+    return []
+
+
+@pytest.fixture()
+def cached_client(responses: list[httpx.Response]) -> AgentAIClient:
+    """Provides a client whose API returns the queued responses."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    return AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.fixture()
+def cached_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an idempotent endpoint with a response cache."""
+    return mock_endpoint.with_overrides(
+        idempotent=True,
+        retry=RetryPolicy(max_attempts=1),
+        cache=CachePolicy(ttl=60),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_cache_serves_repeated_requests(
+    cached_client: AgentAIClient,
+    cached_endpoint: Endpoint,
+    responses: list[httpx.Response],
+) -> None:
+    """Test that a repeated request is served from the cache."""
+    responses.append(httpx.Response(200, json={"n": 1}))
+    data = {"required_param": "value"}
+
+    first = await cached_client._make_request(cached_endpoint, data)
+    second = await cached_client._make_request(cached_endpoint, data)
+
+    assert first.json() == second.json() == {"n": 1}
+    stats = cached_client.cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    await cached_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_cache_separates_parameters_and_tenants(
+    cached_client: AgentAIClient,
+    cached_endpoint: Endpoint,
+    responses: list[httpx.Response],
+) -> None:
+    """Test that other parameters or API keys are not served the entry."""
+    responses.extend(httpx.Response(200, json={"n": n}) for n in range(3))
+
+    await cached_client._make_request(cached_endpoint, {"required_param": "a"})
+    other = await cached_client._make_request(
+        cached_endpoint, {"required_param": "b"}
+    )
+    with cached_client.as_tenant("other_key"):
+        tenant = await cached_client._make_request(
+            cached_endpoint, {"required_param": "a"}
+        )
+
+    assert other.json() == {"n": 1}
+    assert tenant.json() == {"n": 2}
+    assert cached_client.cache_stats().hits == 0
+    await cached_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_cache_skips_endpoints_with_side_effects(
+    cached_client: AgentAIClient,
+    cached_endpoint: Endpoint,
+    responses: list[httpx.Response],
+) -> None:
+    """Test that endpoints that are not idempotent are never cached."""
+    endpoint = cached_endpoint.with_overrides(idempotent=False)
+    responses.extend(httpx.Response(200, json={"n": n}) for n in range(2))
+    data = {"required_param": "value"}
+
+    await cached_client._make_request(endpoint, data)
+    second = await cached_client._make_request(endpoint, data)
+
+    assert second.json() == {"n": 1}
+    assert cached_client.cache_stats().misses == 0
+    await cached_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_cache_serves_stale_responses_on_errors(
+    cached_client: AgentAIClient,
+    cached_endpoint: Endpoint,
+    responses: list[httpx.Response],
+) -> None:
+    """Test that an expired response is served when the API fails."""
+    endpoint = cached_endpoint.with_overrides(
+        cache=CachePolicy(ttl=0.01, stale_if_error=60)
+    )
+    responses.append(httpx.Response(200, json={"n": 1}))
+    responses.append(httpx.Response(503, json={"error": "down"}))
+    responses.append(httpx.Response(404, json={"error": "gone"}))
+    data = {"required_param": "value"}
+    await cached_client._make_request(endpoint, data)
+    await asyncio.sleep(0.02)
+
+    stale = await cached_client._make_request(endpoint, data)
+    assert stale.json() == {"n": 1}
+    assert cached_client.cache_stats().stale_hits == 1
+
+    with pytest.raises(APIStatusError):
+        await cached_client._make_request(endpoint, data)
+    await cached_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_clear_cache_drops_responses(
+    cached_client: AgentAIClient,
+    cached_endpoint: Endpoint,
+    responses: list[httpx.Response],
+) -> None:
+    """Test that cleared responses are requested again."""
+    responses.extend(httpx.Response(200, json={"n": n}) for n in range(2))
+    data = {"required_param": "value"}
+    await cached_client._make_request(cached_endpoint, data)
+
+    await cached_client.clear_cache()
+
+    second = await cached_client._make_request(cached_endpoint, data)
+    assert second.json() == {"n": 1}
+    await cached_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_broken_cache_does_not_fail_requests(
+    cached_endpoint: Endpoint, responses: list[httpx.Response]
+) -> None:
+    """Test that requests still succeed when the cache backend fails."""
+
+    class BrokenCache(MemoryCache):
+        async def get(self, key: str) -> CacheEntry | None:
+            raise OSError("disk full")
+
+        async def set(self, key: str, entry: CacheEntry) -> None:
+            raise OSError("disk full")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = AgentAIClient(
+        api_key="test_key",
+        config=AgentAIConfig(cache_backend=BrokenCache(max_entries=1)),
+        transport=httpx.MockTransport(handler),
+    )
+    responses.append(httpx.Response(200, json={"n": 1}))
+
+    response = await client._make_request(
+        cached_endpoint, {"required_param": "value"}
+    )
+    assert response.json() == {"n": 1}
+    await client.close()
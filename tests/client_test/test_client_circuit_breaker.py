@@ -0,0 +1,84 @@
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import APIStatusError, CircuitOpenError
+from pyagentai.types.circuit_breaker import CircuitState
+from pyagentai.types.policies import CircuitBreakerPolicy
+from pyagentai.types.url_endpoint import Endpoint, UrlType
+
+DATA = {"required_param": "value"}
+
+
+@pytest.fixture()
+def guarded_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an endpoint whose breaker opens after two failures."""
+    return mock_endpoint.with_overrides(
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=2)
+    )
+
+
+def _client(status_code: int, sent: list[httpx.Request]) -> AgentAIClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(status_code, json={})
+
+    return AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio()
+async def test_open_breaker_stops_sending_requests(
+    guarded_endpoint: Endpoint,
+) -> None:
+    """Test that requests fail fast once the endpoint keeps failing."""
+    sent: list[httpx.Request] = []
+    client = _client(503, sent)
+
+    for _ in range(2):
+        with pytest.raises(APIStatusError):
+            await client._make_request(guarded_endpoint, DATA)
+    with pytest.raises(CircuitOpenError):
+        await client._make_request(guarded_endpoint, DATA)
+
+    assert len(sent) == 2
+    url = f"{client.config.api_url}/test"
+    assert client.circuit_states() == {url: CircuitState.OPEN}
+
+
+@pytest.mark.asyncio()
+async def test_client_errors_do_not_open_breaker(
+    guarded_endpoint: Endpoint,
+) -> None:
+    """Test that 4xx responses count as a healthy endpoint."""
+    sent: list[httpx.Request] = []
+    client = _client(404, sent)
+
+    for _ in range(3):
+        with pytest.raises(APIStatusError):
+            await client._make_request(guarded_endpoint, DATA)
+
+    assert len(sent) == 3
+    url = f"{client.config.api_url}/test"
+    assert client.circuit_states() == {url: CircuitState.CLOSED}
+
+
+@pytest.mark.asyncio()
+async def test_breakers_are_kept_per_host(guarded_endpoint: Endpoint) -> None:
+    """Test that the same path on the API and web hosts is not merged."""
+    sent: list[httpx.Request] = []
+    client = _client(503, sent)
+    web_endpoint = guarded_endpoint.with_overrides(url_type=UrlType.WEB)
+
+    for _ in range(2):
+        with pytest.raises(APIStatusError):
+            await client._make_request(guarded_endpoint, DATA)
+
+    with pytest.raises(APIStatusError):
+        await client._make_request(web_endpoint, DATA)
+
+    assert client.circuit_states() == {
+        f"{client.config.api_url}/test": CircuitState.OPEN,
+        f"{client.config.web_url}/test": CircuitState.CLOSED,
+    }
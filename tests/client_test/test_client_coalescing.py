@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import DeadlineExceededError
+from pyagentai.types.url_endpoint import Endpoint
+
+
+@pytest.fixture()
+def sent() -> list[httpx.Request]:
+    """Provides the list of requests the mock API received."""
+    return []
+
+
+@pytest.fixture()
+def slow_client(sent: list[httpx.Request]) -> AgentAIClient:
+    """Provides a client whose API answers after a short delay."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"param": len(sent)})
+
+    return AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio()
+async def test_identical_calls_share_one_request(
+    slow_client: AgentAIClient,
+    sent: list[httpx.Request],
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that concurrent identical calls send one request."""
+    endpoint = mock_endpoint.with_overrides(idempotent=True, coalesce=True)
+
+    responses = await asyncio.gather(
+        *(
+            slow_client._make_request(endpoint, {"required_param": p})
+            for p in ("a", "a", "a", "b")
+        )
+    )
+
+    assert len(sent) == 2
+    assert responses[0] is responses[1] is responses[2]
+    assert responses[3] is not responses[0]
+    await slow_client.close()
+
+
+@pytest.mark.asyncio()
+async def test_calls_with_side_effects_are_not_coalesced(
+    slow_client: AgentAIClient,
+    sent: list[httpx.Request],
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that calls to endpoints that are not idempotent all go out."""
+    endpoint = mock_endpoint.with_overrides(coalesce=True)
+
+    await asyncio.gather(
+        *(
+            slow_client._make_request(endpoint, {"required_param": "a"})
+            for _ in range(3)
+        )
+    )
+
+    assert len(sent) == 3
+    await slow_client.close()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("deadline_first", [True, False])
+async def test_coalesced_calls_keep_their_own_deadlines(
+    mock_endpoint: Endpoint, deadline_first: bool
+) -> None:
+    """Test that a joined call is not bound by another caller's deadline."""
+    sent: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={})
+
+    client = AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+    endpoint = mock_endpoint.with_overrides(idempotent=True, coalesce=True)
+
+    async def call(deadline: float | None) -> httpx.Response:
+        if deadline is None:
+            return await client._make_request(
+                endpoint, {"required_param": "a"}
+            )
+        with client.deadline(deadline):
+            return await client._make_request(
+                endpoint, {"required_param": "a"}
+            )
+
+    deadlines = [0.02, None] if deadline_first else [None, 0.02]
+    bounded, unbounded = await asyncio.gather(
+        *(call(deadline) for deadline in deadlines),
+        return_exceptions=True,
+    )
+    if not deadline_first:
+        bounded, unbounded = unbounded, bounded
+
+    assert isinstance(bounded, DeadlineExceededError)
+    assert isinstance(unbounded, httpx.Response)
+    assert unbounded.status_code == 200
+    assert len(sent) == 1
+    await client.close()
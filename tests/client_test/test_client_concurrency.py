@@ -0,0 +1,60 @@
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import APIStatusError
+from pyagentai.types.policies import ConcurrencyPolicy
+from pyagentai.types.url_endpoint import Endpoint
+
+DATA = {"required_param": "value"}
+
+
+@pytest.fixture()
+def adaptive_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an endpoint with an adaptive concurrency limit."""
+    return mock_endpoint.with_overrides(
+        concurrency=ConcurrencyPolicy(initial_limit=4, backoff_ratio=0.5)
+    )
+
+
+@pytest.mark.asyncio()
+async def test_make_request_reports_success_to_limiter(
+    adaptive_endpoint: Endpoint,
+) -> None:
+    """Test that successful requests feed the latency signal."""
+    client = AgentAIClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda _: httpx.Response(200)),
+    )
+
+    await client._make_request(adaptive_endpoint, DATA)
+
+    stats = client.concurrency_stats()[f"{client.config.api_url}/test"]
+    assert stats.in_flight == 0
+    assert stats.limit == 4
+    assert stats.latency is not None
+
+
+@pytest.mark.asyncio()
+async def test_make_request_backs_off_on_throttling(
+    adaptive_endpoint: Endpoint,
+) -> None:
+    """Test that a 429 cuts the endpoint's concurrency limit."""
+    client = AgentAIClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda _: httpx.Response(429)),
+    )
+
+    with pytest.raises(APIStatusError):
+        await client._make_request(adaptive_endpoint, DATA)
+
+    stats = client.concurrency_stats()[f"{client.config.api_url}/test"]
+    assert stats.limit == 2
+    assert stats.in_flight == 0
+
+
+def test_concurrency_stats_are_empty_without_policies(
+    client: AgentAIClient,
+) -> None:
+    """Test that endpoints without a policy are not tracked."""
+    assert client.concurrency_stats() == {}
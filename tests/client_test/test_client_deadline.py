@@ -0,0 +1,135 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import DeadlineExceededError
+from pyagentai.types.policies import TimeoutPolicy
+from pyagentai.types.url_endpoint import Endpoint, UrlType
+
+
+def test_get_timeout_uses_client_timeout_by_default(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that endpoints without a policy use the client-wide timeout."""
+    assert client._get_timeout(mock_endpoint) == httpx.Timeout(60.0)
+
+
+def test_get_timeout_applies_endpoint_policy(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that per-phase endpoint timeouts override the default."""
+    endpoint = mock_endpoint.with_overrides(
+        timeout=TimeoutPolicy(connect=1.0, read=30.0)
+    )
+
+    timeout = client._get_timeout(endpoint)
+
+    assert timeout == httpx.Timeout(60.0, connect=1.0, read=30.0)
+
+
+def test_get_timeout_is_capped_by_remaining_budget(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that no phase may outlast the caller's deadline."""
+    endpoint = mock_endpoint.with_overrides(
+        timeout=TimeoutPolicy(connect=1.0, read=30.0)
+    )
+
+    timeout = client._get_timeout(endpoint, remaining=2.0)
+
+    assert timeout == httpx.Timeout(2.0, connect=1.0)
+
+
+@pytest.mark.asyncio()
+async def test_make_request_passes_endpoint_timeout(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that the endpoint's timeouts reach the transport."""
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    endpoint = mock_endpoint.with_overrides(
+        timeout=TimeoutPolicy(connect=0.5, pool=0.1)
+    )
+
+    await client._make_request(endpoint, data={"required_param": "v"})
+
+    assert seen == [
+        {"connect": 0.5, "read": 60.0, "write": 60.0, "pool": 0.1}
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_deadline_prevents_launching_late_requests(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that no request is sent once the deadline has passed."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    with client.deadline(0.01):
+        await client._make_request(mock_endpoint, {"required_param": "v"})
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceededError, match="before request"):
+            await client._make_request(
+                mock_endpoint, {"required_param": "v"}
+            )
+
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_deadline_cuts_off_requests_in_flight(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that a slow request is abandoned when the deadline expires."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    with client.deadline(0.05), pytest.raises(
+        DeadlineExceededError, match="during request"
+    ):
+        await client._make_request(mock_endpoint, {"required_param": "v"})
+
+
+def test_nested_deadline_never_extends_enclosing(
+    client: AgentAIClient,
+) -> None:
+    """Test that an inner deadline is capped by the outer one."""
+    with client.deadline(1.0) as outer:
+        with client.deadline(10.0) as inner:
+            assert inner == outer
+        with client.deadline(0.5) as shorter:
+            assert shorter < outer
+
+
+def test_deadline_error_is_value_error() -> None:
+    """Test that the typed error stays compatible with ValueError."""
+    assert issubclass(DeadlineExceededError, ValueError)
+
+
+def test_deadline_rejects_non_positive_budget(client: AgentAIClient) -> None:
+    """Test that a deadline needs a positive budget."""
+    with pytest.raises(ValueError, match="positive"), client.deadline(0):
+        pass
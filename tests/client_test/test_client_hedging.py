@@ -0,0 +1,58 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.types.policies import HedgePolicy
+from pyagentai.types.url_endpoint import Endpoint
+
+DATA = {"required_param": "value"}
+
+
+def _slow_first_client(sent: list[httpx.Request]) -> AgentAIClient:
+    """Build a client whose first request hangs and later ones succeed."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if len(sent) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"copy": len(sent)})
+
+    return AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio()
+async def test_make_request_hedges_slow_idempotent_requests(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that a hedge answers for a slow idempotent request."""
+    sent: list[httpx.Request] = []
+    client = _slow_first_client(sent)
+    endpoint = mock_endpoint.with_overrides(
+        idempotent=True, hedge=HedgePolicy(initial_delay=0.01)
+    )
+
+    response = await client._make_request(endpoint, DATA)
+
+    assert response.json() == {"copy": 2}
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio()
+async def test_make_request_never_hedges_non_idempotent_requests(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that the hedging policy is ignored for unsafe endpoints."""
+    sent: list[httpx.Request] = []
+    client = _slow_first_client(sent)
+    endpoint = mock_endpoint.with_overrides(
+        hedge=HedgePolicy(initial_delay=0.01)
+    )
+
+    with client.deadline(0.1), pytest.raises(ValueError, match="Deadline"):
+        await client._make_request(endpoint, DATA)
+
+    assert len(sent) == 1
@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.exceptions import DeadlineExceededError
+from pyagentai.types.policies import HostLimitPolicy
+from pyagentai.types.url_endpoint import Endpoint
+
+
+@pytest.mark.asyncio()
+async def test_clients_share_the_host_wide_slots(
+    tmp_path: Path, mock_endpoint: Endpoint
+) -> None:
+    """Test that clients with the same host limit share its slots."""
+    gate = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await gate.wait()
+        return httpx.Response(200, json={})
+
+    config = AgentAIConfig(
+        host_limit=HostLimitPolicy(
+            path=str(tmp_path / "quota"), max_concurrency=1
+        )
+    )
+    clients = [
+        AgentAIClient(
+            api_key="test_key",
+            config=config.model_copy(),
+            transport=httpx.MockTransport(handler),
+        )
+        for _ in range(2)
+    ]
+    data = {"required_param": "value"}
+    first = asyncio.create_task(clients[0]._make_request(mock_endpoint, data))
+    await asyncio.sleep(0.01)
+
+    with (
+        pytest.raises(DeadlineExceededError, match="host-wide slot"),
+        clients[1].deadline(0.05),
+    ):
+        await clients[1]._make_request(mock_endpoint, data)
+
+    gate.set()
+    await first
+    await clients[1]._make_request(mock_endpoint, data)
+    for client in clients:
+        await client.close()
@@ -1,31 +1,38 @@
+import asyncio
+import threading
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
 from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.transport import ConnectionPoolConfig, TransportMode
+from pyagentai.types.url_endpoint import UrlType
+from pyagentai.utils.borrowed_transport import BorrowedTransport
+from pyagentai.utils.striped_transport import StripedTransport
 
 
 @pytest.mark.asyncio()
 async def test_client_close_idempotent(client: AgentAIClient) -> None:
     """Test that calling close() multiple times on the client is safe."""
-    assert client._http_client is not None
+    http_client = client._initialize_client(UrlType.API)
 
     # First close
     with patch.object(
-        client._http_client, "aclose", new_callable=AsyncMock
+        http_client, "aclose", new_callable=AsyncMock
     ) as mock_aclose:
         await client.close()
         mock_aclose.assert_awaited_once()
 
-    # After the first close, the http_client should be None
-    assert client._http_client is None
+    # After the first close, no http_client should remain
+    assert client._http_clients == {}
 
     # Calling close again should be safe and not raise an error
     await client.close()
 
-    # The http_client should remain None
-    assert client._http_client is None
+    # No http_client should have been re-created
+    assert client._http_clients == {}
 
 
 @pytest.mark.asyncio()
@@ -34,12 +41,11 @@ async def test_client_reinitialization_after_close() -> None:
     Test that the client and its http_client can be re-initialized after close.
     """
     client = AgentAIClient(api_key="test_key")
-    original_http_client = client._http_client
-    assert original_http_client is not None
+    original_http_client = client._initialize_client(UrlType.API)
 
     # Close the client
     await client.close()
-    assert client._http_client is None
+    assert client._http_clients == {}
 
     # A new request should create a new http_client
     with patch("httpx.AsyncClient") as mock_async_client:
@@ -51,7 +57,287 @@ async def test_client_reinitialization_after_close() -> None:
 
         # This call will trigger _initialize_client
         client._initialize_client()
-        new_http_client = client._http_client
+        new_http_client = client._http_clients.get(UrlType.API)
 
         assert new_http_client is not None
         assert new_http_client is not original_http_client
+
+
+@pytest.mark.asyncio()
+async def test_client_close_cancels_agent_cache_refreshes() -> None:
+    """Test that close() leaves no refresh to open a new HTTP client."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"response": []})
+
+    client = AgentAIClient(
+        api_key="test_key",
+        config=AgentAIConfig(agent_cache_ttl=0.01),
+        transport=httpx.MockTransport(handler),
+    )
+    await client.find_agents()
+    await asyncio.sleep(0.02)
+
+    # Starts a background refresh of the stale listing
+    await client.find_agents()
+    await client.close()
+    await asyncio.sleep(0.01)
+
+    assert len(sent) == 1
+    assert client._loop_resources == {}
+
+
+@pytest.mark.asyncio()
+async def test_client_uses_separate_pools_per_host() -> None:
+    """Test that the API and web hosts get separate HTTP clients."""
+    client = AgentAIClient(api_key="test_key")
+
+    api_client = client._initialize_client(UrlType.API)
+    web_client = client._initialize_client(UrlType.WEB)
+
+    assert api_client is not web_client
+    assert client._initialize_client(UrlType.API) is api_client
+    assert client._initialize_client(UrlType.WEB) is web_client
+
+    await client.close()
+    assert api_client.is_closed
+    assert web_client.is_closed
+
+
+@pytest.mark.asyncio()
+async def test_client_applies_pool_limits_per_host() -> None:
+    """Test that each host's pool is built from its own limits."""
+    config = AgentAIConfig(
+        api_pool=ConnectionPoolConfig(
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=30.0,
+        ),
+        web_pool=ConnectionPoolConfig(
+            max_connections=2,
+            max_keepalive_connections=1,
+            keepalive_expiry=None,
+        ),
+    )
+    client = AgentAIClient(api_key="test_key", config=config)
+
+    with patch("httpx.AsyncHTTPTransport") as mock_transport:
+        client._http_clients.clear()
+        client._initialize_client(UrlType.API)
+        client._initialize_client(UrlType.WEB)
+
+    limits = [call.kwargs["limits"] for call in mock_transport.call_args_list]
+    assert limits == [
+        httpx.Limits(
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=30.0,
+        ),
+        httpx.Limits(
+            max_connections=2,
+            max_keepalive_connections=1,
+            keepalive_expiry=None,
+        ),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_clients_share_transport_when_enabled() -> None:
+    """Test that clients with share_transport reuse one connection pool."""
+    config = AgentAIConfig(share_transport=True)
+    first = AgentAIClient(api_key="key_a", config=config)
+    second = AgentAIClient(
+        api_key="key_b", config=AgentAIConfig(share_transport=True)
+    )
+
+    shared_client = first._initialize_client(UrlType.API)
+    assert second._initialize_client(UrlType.API) is shared_client
+
+    # The pool survives until its last user closes
+    await first.close()
+    assert not shared_client.is_closed
+    await second.close()
+    assert shared_client.is_closed
+
+
+@pytest.mark.asyncio()
+async def test_clients_do_not_share_transport_by_default() -> None:
+    """Test that each client owns its pool unless sharing is enabled."""
+    first = AgentAIClient(api_key="key_a")
+    second = AgentAIClient(api_key="key_b")
+
+    assert first._initialize_client() is not second._initialize_client()
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.parametrize(
+    ("mode", "http2"),
+    [(TransportMode.HTTP1, False), (TransportMode.HTTP2, True)],
+)
+def test_client_builds_transport_for_mode(
+    mode: TransportMode, http2: bool
+) -> None:
+    """Test that the HTTP/1.1 and HTTP/2 modes configure the transport."""
+    client = AgentAIClient(config=AgentAIConfig(transport_mode=mode))
+
+    with patch("httpx.AsyncHTTPTransport") as mock_transport:
+        client._create_transport(UrlType.API)
+
+    assert mock_transport.call_args.kwargs["http2"] is http2
+
+
+def test_client_builds_striped_transport() -> None:
+    """Test that the striped mode opens one HTTP/2 connection per stripe."""
+    config = AgentAIConfig(
+        transport_mode=TransportMode.HTTP2_STRIPED, http2_stripes=3
+    )
+    client = AgentAIClient(config=config)
+
+    with patch("httpx.AsyncHTTPTransport") as mock_transport:
+        transport = client._create_transport(UrlType.API)
+
+    assert isinstance(transport, StripedTransport)
+    assert mock_transport.call_count == 3
+    for call in mock_transport.call_args_list:
+        assert call.kwargs["http2"] is True
+        assert call.kwargs["limits"].max_connections == 1
+
+
+@pytest.mark.asyncio()
+async def test_client_uses_injected_transport_for_all_hosts() -> None:
+    """Test that a custom transport serves both hosts and stays open."""
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json={})
+
+    transport = httpx.MockTransport(handler)
+    client = AgentAIClient(api_key="test_key", transport=transport)
+
+    await client._initialize_client(UrlType.API).get("https://a.test/")
+    await client._initialize_client(UrlType.WEB).get("https://b.test/")
+    with patch.object(
+        transport, "aclose", new_callable=AsyncMock
+    ) as mock_aclose:
+        await client.close()
+
+    assert hosts == ["a.test", "b.test"]
+    mock_aclose.assert_not_awaited()
+
+
+def test_client_transport_argument_overrides_config() -> None:
+    """Test that the constructor transport wins over the config's."""
+    config_transport = httpx.MockTransport(lambda _: httpx.Response(200))
+    transport = httpx.MockTransport(lambda _: httpx.Response(200))
+    client = AgentAIClient(
+        config=AgentAIConfig(transport=config_transport),
+        transport=transport,
+    )
+
+    created = client._create_transport(UrlType.API)
+
+    assert isinstance(created, BorrowedTransport)
+    assert created.transport is transport
+
+
+@pytest.mark.parametrize("mode", list(TransportMode))
+def test_client_routes_over_unix_domain_socket(mode: TransportMode) -> None:
+    """Test that uds_path is applied in every transport mode."""
+    config = AgentAIConfig(uds_path="/run/sidecar.sock", transport_mode=mode)
+    client = AgentAIClient(config=config)
+
+    with patch("httpx.AsyncHTTPTransport") as mock_transport:
+        client._create_transport(UrlType.API)
+
+    for call in mock_transport.call_args_list:
+        assert call.kwargs["uds"] == "/run/sidecar.sock"
+
+
+def test_client_creates_http_clients_lazily() -> None:
+    """Test that constructing a client opens no connection pool."""
+    client = AgentAIClient(api_key="test_key")
+    assert client._loop_resources == {}
+
+
+def test_client_keeps_one_pool_per_event_loop() -> None:
+    """Test that each event loop gets its own HTTP clients."""
+    client = AgentAIClient(api_key="test_key")
+
+    async def get_http_client() -> httpx.AsyncClient:
+        return client._initialize_client(UrlType.API)
+
+    first = asyncio.run(get_http_client())
+    second = asyncio.run(get_http_client())
+
+    assert first is not second
+    # The resources of the closed first loop were dropped
+    assert len(client._loop_resources) == 1
+
+
+def test_client_is_usable_from_concurrent_loops() -> None:
+    """Test that loops in several threads can drive one client at once."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    client = AgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+    barrier = threading.Barrier(3)
+    results: list[httpx.AsyncClient] = []
+    errors: list[BaseException] = []
+
+    async def use_client() -> None:
+        http_client = client._initialize_client(UrlType.API)
+        barrier.wait()
+        await http_client.get("https://api.test/")
+        results.append(http_client)
+
+    def run_loop() -> None:
+        try:
+            asyncio.run(use_client())
+        except BaseException as e:  # noqa: B036
+            errors.append(e)
+
+    threads = [threading.Thread(target=run_loop) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len({id(http_client) for http_client in results}) == 3
+
+
+def test_client_close_reaches_other_running_loops() -> None:
+    """Test that close() closes pools owned by another running loop."""
+    client = AgentAIClient(api_key="test_key")
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+
+    async def get_http_client() -> httpx.AsyncClient:
+        return client._initialize_client(UrlType.API)
+
+    try:
+        other_client = asyncio.run_coroutine_threadsafe(
+            get_http_client(), other_loop
+        ).result()
+
+        async def close_from_here() -> httpx.AsyncClient:
+            own_client = client._initialize_client(UrlType.API)
+            await client.close()
+            return own_client
+
+        own_client = asyncio.run(close_from_here())
+
+        assert own_client.is_closed
+        assert other_client.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
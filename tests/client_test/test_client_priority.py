@@ -0,0 +1,163 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.priority import RequestPriority
+from pyagentai.types.transport import ConnectionPoolConfig, TransportMode
+from pyagentai.types.url_endpoint import Endpoint
+from pyagentai.utils.request_context import request_priority
+
+
+@pytest.mark.asyncio()
+async def test_priority_sets_the_priority_within_a_block() -> None:
+    """Test that the priority applies only inside the block."""
+    client = AgentAIClient(api_key="test_key")
+
+    with client.priority(RequestPriority.LOW) as priority:
+        assert priority == RequestPriority.LOW
+        assert request_priority.get() == RequestPriority.LOW
+    assert request_priority.get() == RequestPriority.NORMAL
+    await client.close()
+
+
+@pytest.mark.asyncio()
+async def test_high_priority_requests_are_sent_first(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that queued high-priority requests overtake low ones."""
+    gate = asyncio.Event()
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.params["required_param"])
+        await gate.wait()
+        return httpx.Response(200, json={})
+
+    client = AgentAIClient(
+        api_key="test_key",
+        config=AgentAIConfig(max_in_flight=1),
+        transport=httpx.MockTransport(handler),
+    )
+    endpoint = mock_endpoint.with_overrides(method="GET")
+
+    async def call(tag: str, priority: RequestPriority) -> None:
+        with client.priority(priority):
+            await client._make_request(
+                endpoint, {"required_param": tag}
+            )
+
+    first = asyncio.create_task(call("first", RequestPriority.NORMAL))
+    await asyncio.sleep(0.01)
+    low = asyncio.create_task(call("low", RequestPriority.LOW))
+    await asyncio.sleep(0.01)
+    high = asyncio.create_task(call("high", RequestPriority.HIGH))
+    await asyncio.sleep(0.01)
+
+    gate.set()
+    await asyncio.gather(first, low, high)
+    assert sent == ["first", "high", "low"]
+    await client.close()
+
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("mode", "max_connections", "expected"),
+    [
+        (TransportMode.HTTP1, 2, 2),
+        (TransportMode.HTTP1, None, 3),
+        (TransportMode.HTTP2, 2, 3),
+        (TransportMode.HTTP2, None, 3),
+    ],
+)
+async def test_default_in_flight_limit_follows_the_transport(
+    mock_endpoint: Endpoint,
+    mode: TransportMode,
+    max_connections: int | None,
+    expected: int,
+) -> None:
+    """Test that only HTTP/1.1 pools limit the requests in flight."""
+    gate = asyncio.Event()
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await gate.wait()
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = AgentAIClient(
+        api_key="test_key",
+        config=AgentAIConfig(
+            transport_mode=mode,
+            api_pool=ConnectionPoolConfig(max_connections=max_connections),
+        ),
+        transport=httpx.MockTransport(handler),
+    )
+    endpoint = mock_endpoint.with_overrides(method="GET")
+
+    calls = [
+        asyncio.create_task(
+            client._make_request(endpoint, {"required_param": str(n)})
+        )
+        for n in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    assert peak == expected
+
+    gate.set()
+    await asyncio.gather(*calls)
+    await client.close()
+
+@pytest.mark.asyncio()
+async def test_tenants_share_the_queue_fairly(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that a tenant's backlog does not hold back other tenants."""
+    gate = asyncio.Event()
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.params["required_param"])
+        await gate.wait()
+        return httpx.Response(200, json={})
+
+    client = AgentAIClient(
+        api_key="test_key",
+        config=AgentAIConfig(max_in_flight=1),
+        transport=httpx.MockTransport(handler),
+    )
+    endpoint = mock_endpoint.with_overrides(method="GET")
+
+    async def call(tenant: str) -> None:
+        with client.tenant(tenant):
+            await client._make_request(endpoint, {"required_param": tenant})
+
+    calls = [asyncio.create_task(call("bulk")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    calls.append(asyncio.create_task(call("small")))
+    await asyncio.sleep(0.01)
+
+    gate.set()
+    await asyncio.gather(*calls)
+    assert sent.index("small") <= 2
+
+    stats = client.tenant_stats()
+    assert stats["bulk"].dispatched == 5
+    assert stats["small"].dispatched == 1
+    assert stats["bulk"].queued == 0
+    await client.close()
+
+
+def test_tenant_rejects_an_empty_id() -> None:
+    """Test that a tenant ID is required."""
+    client = AgentAIClient(api_key="test_key")
+
+    with pytest.raises(ValueError, match="Tenant ID"), client.tenant(""):
+        pass
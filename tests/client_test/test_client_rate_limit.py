@@ -0,0 +1,120 @@
+import hashlib
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.exceptions import DeadlineExceededError
+from pyagentai.types.policies import RateLimitPolicy
+from pyagentai.types.url_endpoint import Endpoint, UrlType
+from pyagentai.utils.rate_limiter import TokenBucket
+
+DATA = {"required_param": "value"}
+
+
+@pytest.fixture()
+def limited_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an endpoint limited to one request per second."""
+    return mock_endpoint.with_overrides(
+        rate_limit=RateLimitPolicy(rate=1.0)
+    )
+
+
+@pytest.fixture()
+def ok_client() -> AgentAIClient:
+    """Provides a client whose API answers every request with a 200."""
+    return AgentAIClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda _: httpx.Response(200)),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_make_request_waits_for_rate_limit(
+    ok_client: AgentAIClient, limited_endpoint: Endpoint
+) -> None:
+    """Test that requests beyond the rate wait locally."""
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await ok_client._make_request(limited_endpoint, DATA)
+        await ok_client._make_request(limited_endpoint, DATA)
+
+    mock_sleep.assert_awaited_once()
+    assert mock_sleep.await_args.args[0] == pytest.approx(1.0, abs=0.1)
+
+
+@pytest.mark.asyncio()
+async def test_rate_limits_are_kept_per_credential(
+    ok_client: AgentAIClient, limited_endpoint: Endpoint
+) -> None:
+    """Test that each API key gets its own bucket."""
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await ok_client._make_request(limited_endpoint, DATA)
+        with ok_client.as_tenant("other_key"):
+            await ok_client._make_request(limited_endpoint, DATA)
+
+    mock_sleep.assert_not_awaited()
+    assert len(ok_client._rate_limiters) == 2
+
+
+@pytest.mark.asyncio()
+async def test_rate_limits_forget_idle_credentials(
+    ok_client: AgentAIClient,
+    limited_endpoint: Endpoint,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that idle buckets are dropped and no API key is kept."""
+    monkeypatch.setattr("pyagentai.client._MAX_RATE_LIMITERS", 2)
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        for tenant in ("key_a", "key_b", "key_c"):
+            with ok_client.as_tenant(tenant):
+                await ok_client._make_request(limited_endpoint, DATA)
+
+    # The buckets just spent their token, so none is idle yet
+    assert len(ok_client._rate_limiters) == 3
+    monkeypatch.setattr(TokenBucket, "idle", property(lambda _: True))
+    with ok_client.as_tenant("key_d"):
+        await ok_client._make_request(limited_endpoint, DATA)
+
+    credentials = [key[-1] for key in ok_client._rate_limiters]
+    assert credentials == [
+        hashlib.sha256(tenant.encode()).hexdigest()
+        for tenant in ("key_c", "key_d")
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_rate_limit_wait_respects_deadline(
+    ok_client: AgentAIClient, limited_endpoint: Endpoint
+) -> None:
+    """Test that a wait longer than the deadline fails at once."""
+    await ok_client._make_request(limited_endpoint, DATA)
+
+    with (
+        ok_client.deadline(0.5),
+        pytest.raises(DeadlineExceededError, match="rate limit"),
+    ):
+        await ok_client._make_request(limited_endpoint, DATA)
+
+
+@pytest.mark.asyncio()
+async def test_rate_limit_adapts_to_response_headers(
+    client: AgentAIClient, limited_endpoint: Endpoint
+) -> None:
+    """Test that the bucket follows the API's rate limit headers."""
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Remaining": "100",
+                    "X-RateLimit-Reset": "10",
+                },
+            )
+        )
+    )
+
+    await client._make_request(limited_endpoint, DATA)
+
+    (limiter,) = client._rate_limiters.values()
+    assert limiter.rate == 10.0
@@ -0,0 +1,205 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.exceptions import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+)
+from pyagentai.types.policies import RetryBudgetPolicy, RetryPolicy
+from pyagentai.types.url_endpoint import Endpoint, UrlType
+
+DATA = {"required_param": "value"}
+
+
+def _serve(client: AgentAIClient, responses: list) -> list[httpx.Request]:
+    """Answer requests with the given responses or exceptions in order."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client._http_clients[UrlType.API] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return sent
+
+
+@pytest.fixture()
+def idempotent_endpoint(mock_endpoint: Endpoint) -> Endpoint:
+    """Provides an idempotent endpoint with a fast retry policy."""
+    return mock_endpoint.with_overrides(
+        idempotent=True,
+        retry=RetryPolicy(max_attempts=3, jitter=False),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_make_request_retries_retryable_status(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that a 503 is retried with backoff until it succeeds."""
+    sent = _serve(
+        client,
+        [httpx.Response(503), httpx.Response(503), httpx.Response(200)],
+    )
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = await client._make_request(idempotent_endpoint, DATA)
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [0.1, 0.2]
+
+
+@pytest.mark.asyncio()
+async def test_make_request_honors_retry_after(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that the Retry-After header replaces the backoff."""
+    _serve(
+        client,
+        [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200),
+        ],
+    )
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await client._make_request(idempotent_endpoint, DATA)
+
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio()
+async def test_make_request_gives_up_on_long_retry_after(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that a Retry-After beyond the policy's cap is not waited."""
+    sent = _serve(
+        client, [httpx.Response(503, headers={"Retry-After": "3600"})]
+    )
+
+    with pytest.raises(APIStatusError) as exc_info:
+        await client._make_request(idempotent_endpoint, DATA)
+
+    assert exc_info.value.retry_after == 3600.0
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_does_not_retry_client_errors(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that a 400 fails at once with a typed, non-retryable error."""
+    sent = _serve(client, [httpx.Response(400, json={"error": "bad"})])
+
+    with pytest.raises(APIStatusError, match="HTTP error 400") as exc_info:
+        await client._make_request(idempotent_endpoint, DATA)
+
+    assert exc_info.value.status_code == 400
+    assert not exc_info.value.retryable
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_does_not_retry_non_idempotent_endpoints(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that endpoints not marked idempotent are never retried."""
+    sent = _serve(client, [httpx.Response(503)])
+
+    with pytest.raises(APIStatusError) as exc_info:
+        await client._make_request(mock_endpoint, DATA)
+
+    assert exc_info.value.retryable
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_retries_transport_failures(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that timeouts and connection errors are retried."""
+    endpoint = idempotent_endpoint.with_overrides(
+        retry=RetryPolicy(max_attempts=3, jitter=False, retry_on_timeout=True)
+    )
+    sent = _serve(
+        client,
+        [
+            httpx.ReadTimeout("slow"),
+            httpx.ConnectError("refused"),
+            httpx.ConnectError("refused"),
+        ],
+    )
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        pytest.raises(APIConnectionError, match="HTTP error") as exc_info,
+    ):
+        await client._make_request(endpoint, DATA)
+
+    assert exc_info.value.retryable
+    assert len(sent) == 3
+
+
+@pytest.mark.asyncio()
+async def test_make_request_does_not_retry_timeouts_by_default(
+    client: AgentAIClient, idempotent_endpoint: Endpoint
+) -> None:
+    """Test that timeouts are only retried when the policy opts in."""
+    sent = _serve(client, [httpx.ReadTimeout("slow"), httpx.Response(200)])
+
+    with pytest.raises(APITimeoutError) as exc_info:
+        await client._make_request(idempotent_endpoint, DATA)
+
+    assert exc_info.value.retryable
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_makes_one_attempt_by_default(
+    client: AgentAIClient, mock_endpoint: Endpoint
+) -> None:
+    """Test that the default policy leaves retries disabled."""
+    endpoint = mock_endpoint.with_overrides(idempotent=True)
+    sent = _serve(client, [httpx.Response(503), httpx.Response(200)])
+
+    with pytest.raises(APIStatusError):
+        await client._make_request(endpoint, DATA)
+
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio()
+async def test_make_request_stops_when_retry_budget_is_spent(
+    mock_endpoint: Endpoint,
+) -> None:
+    """Test that the retry budget bounds retries across requests."""
+    config = AgentAIConfig(
+        retry_budget=RetryBudgetPolicy(
+            ratio=0.0, min_retries_per_second=0.1, window=10
+        )
+    )
+    client = AgentAIClient(api_key="test_key", config=config)
+    endpoint = mock_endpoint.with_overrides(
+        idempotent=True, retry=RetryPolicy(max_attempts=5, jitter=False)
+    )
+    sent = _serve(client, [httpx.Response(503)] * 5)
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        pytest.raises(APIStatusError),
+    ):
+        await client._make_request(endpoint, DATA)
+
+    # The budget allows a single retry in the window
+    assert len(sent) == 2
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pyagentai.client import AgentAIClient
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.types.transport import ConnectionPoolConfig
+from pyagentai.types.url_endpoint import UrlType
+
+
+def _install_mock_transport(
+    client: AgentAIClient, requests: list[httpx.Request]
+) -> None:
+    """Route both hosts of the client through a recording transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404)
+
+    for url_type in UrlType:
+        client._http_clients[url_type] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+
+@pytest.mark.asyncio()
+async def test_warmup_resolves_and_connects_to_both_hosts() -> None:
+    """Test that warmup resolves and pings the API and web hosts."""
+    client = AgentAIClient(api_key="test_key")
+    requests: list[httpx.Request] = []
+    _install_mock_transport(client, requests)
+    loop = asyncio.get_running_loop()
+
+    with patch.object(
+        loop, "getaddrinfo", new_callable=AsyncMock
+    ) as mock_getaddrinfo:
+        await client.warmup(connections=2)
+
+    resolved_hosts = {call.args for call in mock_getaddrinfo.call_args_list}
+    assert resolved_hosts == {
+        ("api-lr.agent.ai", 443),
+        ("api.agent.ai", 443),
+    }
+    assert len(requests) == 4
+    assert all(request.method == "HEAD" for request in requests)
+    await client.close()
+
+
+@pytest.mark.asyncio()
+async def test_warmup_caps_connections_at_pool_size() -> None:
+    """Test that warmup never opens more connections than the pool allows."""
+    config = AgentAIConfig(
+        api_pool=ConnectionPoolConfig(max_connections=1),
+        web_pool=ConnectionPoolConfig(max_connections=1),
+    )
+    client = AgentAIClient(api_key="test_key", config=config)
+    requests: list[httpx.Request] = []
+    _install_mock_transport(client, requests)
+
+    with patch.object(
+        asyncio.get_running_loop(), "getaddrinfo", new_callable=AsyncMock
+    ):
+        await client.warmup(connections=5)
+
+    assert len(requests) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio()
+async def test_warmup_tolerates_unreachable_hosts(
+    client: AgentAIClient,
+) -> None:
+    """Test that warmup does not raise when hosts cannot be reached."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable")
+
+    for url_type in UrlType:
+        client._http_clients[url_type] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+    with patch.object(
+        asyncio.get_running_loop(),
+        "getaddrinfo",
+        new_callable=AsyncMock,
+        side_effect=OSError("no dns"),
+    ):
+        await client.warmup()
+
+    await client.close()
+
+
+@pytest.mark.asyncio()
+async def test_warmup_rejects_invalid_connections(
+    client: AgentAIClient,
+) -> None:
+    """Test that warmup validates the number of connections."""
+    with pytest.raises(ValueError, match="at least 1"):
+        await client.warmup(connections=0)
+
+
+@pytest.mark.asyncio()
+async def test_warmup_starts_keepalive_pings_until_close() -> None:
+    """Test that keep-alive pings run in the background until close()."""
+    client = AgentAIClient(api_key="test_key")
+    requests: list[httpx.Request] = []
+    _install_mock_transport(client, requests)
+
+    with patch.object(
+        asyncio.get_running_loop(), "getaddrinfo", new_callable=AsyncMock
+    ):
+        await client.warmup(keepalive_interval=0.01)
+    warmup_requests = len(requests)
+
+    await asyncio.sleep(0.05)
+    assert len(requests) > warmup_requests
+    keepalive_task = client._keepalive_task
+    assert keepalive_task is not None
+
+    await client.close()
+    assert keepalive_task.done()
+    assert client._keepalive_task is None
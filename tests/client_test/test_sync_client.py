@@ -0,0 +1,111 @@
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from pyagentai import SyncAgentAIClient
+from pyagentai.exceptions import DeadlineExceededError
+
+
+@pytest.fixture()
+def seen_requests() -> list[tuple[httpx.Request, threading.Thread]]:
+    """Collects the requests sent and the thread that sent them."""
+    return []
+
+
+@pytest.fixture()
+def sync_client(
+    seen_requests: list[tuple[httpx.Request, threading.Thread]],
+) -> Iterator[SyncAgentAIClient]:
+    """Provides a sync client backed by a mock transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append((request, threading.current_thread()))
+        return httpx.Response(200, json={"response": []})
+
+    client = SyncAgentAIClient(
+        api_key="test_key", transport=httpx.MockTransport(handler)
+    )
+    yield client
+    client.close()
+
+
+def test_sync_client_exposes_registered_methods(
+    sync_client: SyncAgentAIClient,
+    seen_requests: list[tuple[httpx.Request, threading.Thread]],
+) -> None:
+    """Test that registered methods run as blocking calls."""
+    assert sync_client.find_agents(query="marketing") == []
+    assert sync_client.find_agents.__name__ == "find_agents"
+
+    request, _ = seen_requests[0]
+    assert request.url.path.endswith("/action/find_agents")
+
+
+def test_sync_client_rejects_unknown_attributes(
+    sync_client: SyncAgentAIClient,
+) -> None:
+    """Test that only registered methods are forwarded."""
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        sync_client.nope()  # type: ignore[attr-defined]
+
+
+def test_sync_client_reuses_one_loop_across_threads(
+    sync_client: SyncAgentAIClient,
+    seen_requests: list[tuple[httpx.Request, threading.Thread]],
+) -> None:
+    """Test that calls from many threads share one loop and pool."""
+    # Distinct queries, so that the calls are not coalesced
+    threads = [
+        threading.Thread(
+            target=sync_client.find_agents, kwargs={"query": f"q{i}"}
+        )
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(seen_requests) == 8
+    assert {thread for _, thread in seen_requests} == {sync_client._thread}
+    assert len(sync_client.client._loop_resources) == 1
+
+
+def test_sync_client_propagates_tenant(
+    sync_client: SyncAgentAIClient,
+    seen_requests: list[tuple[httpx.Request, threading.Thread]],
+) -> None:
+    """Test that as_tenant applies to calls made on the background loop."""
+    with sync_client.as_tenant("tenant_key"):
+        sync_client.find_agents()
+    sync_client.find_agents()
+
+    keys = [r.headers["Authorization"] for r, _ in seen_requests]
+    assert keys == ["Bearer tenant_key", "Bearer test_key"]
+
+
+def test_sync_client_propagates_deadline(
+    sync_client: SyncAgentAIClient,
+    seen_requests: list[tuple[httpx.Request, threading.Thread]],
+) -> None:
+    """Test that an expired deadline fails the call before sending."""
+    with sync_client.deadline(0.001):
+        time.sleep(0.01)
+        with pytest.raises(DeadlineExceededError):
+            sync_client.find_agents()
+
+    assert seen_requests == []
+
+
+def test_sync_client_close_stops_loop() -> None:
+    """Test that close() stops the loop and is safe to repeat."""
+    client = SyncAgentAIClient(api_key="test_key")
+    client.close()
+    client.close()
+
+    assert not client._thread.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.find_agents()
@@ -0,0 +1,87 @@
+import pydantic
+import pytest
+
+from pyagentai.config.agentai_config import AgentAIConfig
+from pyagentai.config.agentai_endpoints import (
+    AgentAIEndpoints,
+    get_default_endpoints,
+)
+from pyagentai.types.url_endpoint import (
+    Endpoint,
+    EndpointParameter,
+    ParameterType,
+    RequestMethod,
+    UrlType,
+)
+
+
+def test_configs_share_default_endpoints() -> None:
+    """Test that default configs share one endpoint registry."""
+    first = AgentAIConfig()
+    second = AgentAIConfig()
+
+    assert first.endpoints is second.endpoints
+    assert first.endpoints is get_default_endpoints()
+
+
+def test_endpoints_are_immutable() -> None:
+    """Test that the shared registry and its endpoints cannot be mutated."""
+    endpoints = get_default_endpoints()
+
+    with pytest.raises(pydantic.ValidationError):
+        endpoints.find_agents = endpoints.grab_web_text  # type: ignore[misc]
+    with pytest.raises(pydantic.ValidationError):
+        endpoints.find_agents.url = "/changed"  # type: ignore[misc]
+    assert isinstance(endpoints.find_agents.body_parameters, tuple)
+
+
+def test_with_overrides_is_copy_on_write() -> None:
+    """Test that overrides share every endpoint they do not replace."""
+    endpoints = get_default_endpoints()
+
+    custom = endpoints.with_overrides(
+        find_agents={"url": "/v2/action/find_agents"}
+    )
+
+    assert custom is not endpoints
+    assert custom.find_agents.url == "/v2/action/find_agents"
+    assert endpoints.find_agents.url == "/action/find_agents"
+    assert custom.grab_web_text is endpoints.grab_web_text
+    assert all(
+        custom_param is param
+        for custom_param, param in zip(
+            custom.find_agents.body_parameters,
+            endpoints.find_agents.body_parameters,
+            strict=True,
+        )
+    )
+
+
+def test_with_overrides_accepts_endpoint() -> None:
+    """Test that an endpoint can be replaced by a complete Endpoint."""
+    replacement = Endpoint(
+        url="/custom",
+        url_type=UrlType.WEB,
+        method=RequestMethod.GET,
+        query_parameters=[
+            EndpointParameter(name="q", param_type=ParameterType.STRING)
+        ],
+    )
+
+    custom = AgentAIEndpoints().with_overrides(get_twitter_users=replacement)
+
+    assert custom.get_twitter_users is replacement
+
+
+def test_with_overrides_validates_fields() -> None:
+    """Test that field overrides are validated."""
+    with pytest.raises(pydantic.ValidationError):
+        get_default_endpoints().with_overrides(
+            find_agents={"method": "FETCH"}
+        )
+
+
+def test_with_overrides_rejects_unknown_endpoint() -> None:
+    """Test that overriding an unknown endpoint raises a ValueError."""
+    with pytest.raises(ValueError, match="Unknown endpoint: 'missing'"):
+        get_default_endpoints().with_overrides(missing={"url": "/missing"})
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from pyagentai.types.agent_info import AgentInfo
+from pyagentai.types.priority import RequestPriority
+from pyagentai.utils.agent_catalog import AgentCatalog
+from pyagentai.utils.request_context import request_priority
+
+
+class _Api:
+    """Fake API that returns a new listing on every fetch."""
+
+    def __init__(self, agent: AgentInfo) -> None:
+        self.agent = agent
+        self.fetches = 0
+        self.fail = False
+        self.priorities: list[RequestPriority] = []
+
+    async def fetch(self) -> list[AgentInfo]:
+        self.fetches += 1
+        self.priorities.append(request_priority.get())
+        if self.fail:
+            raise RuntimeError("API down")
+        return [self.agent] * self.fetches
+
+
+@pytest.fixture()
+def api(sample_agent_info: dict) -> _Api:
+    """Provides a fake API."""
+    return _Api(AgentInfo.model_validate(sample_agent_info))
+
+
+@pytest.mark.asyncio()
+async def test_catalog_serves_repeated_searches(api: _Api) -> None:
+    """Test that a fresh listing is served without fetching."""
+    catalog = AgentCatalog(ttl=60, max_entries=10)
+
+    first = await catalog.get("k", api.fetch)
+    second = await catalog.get("k", api.fetch)
+
+    assert first is second
+    assert api.fetches == 1
+
+
+@pytest.mark.asyncio()
+async def test_catalog_refreshes_stale_listings_in_background(
+    api: _Api,
+) -> None:
+    """Test that a stale listing is served while it is refreshed."""
+    now = 0.0
+    catalog = AgentCatalog(ttl=10, max_entries=10, clock=lambda: now)
+    await catalog.get("k", api.fetch)
+
+    now = 10.0
+    stale = await catalog.get("k", api.fetch)
+    assert len(stale) == 1
+    await asyncio.sleep(0)
+
+    assert len(await catalog.get("k", api.fetch)) == 2
+    assert api.priorities == [RequestPriority.NORMAL, RequestPriority.LOW]
+
+
+@pytest.mark.asyncio()
+async def test_catalog_keeps_listing_when_refresh_fails(api: _Api) -> None:
+    """Test that a failed refresh keeps serving the stale listing."""
+    now = 0.0
+    catalog = AgentCatalog(ttl=10, max_entries=10, clock=lambda: now)
+    await catalog.get("k", api.fetch)
+    api.fail = True
+
+    now = 10.0
+    await catalog.get("k", api.fetch)
+    await asyncio.sleep(0)
+    assert len(await catalog.get("k", api.fetch)) == 1
+    await asyncio.sleep(0)
+
+    # Each use retries the failed refresh
+    assert api.fetches == 3
+
+
+def test_catalog_restarts_refresh_cancelled_with_its_loop(api: _Api) -> None:
+    """Test that a refresh cancelled by loop shutdown is started again."""
+    now = 0.0
+    catalog = AgentCatalog(ttl=10, max_entries=10, clock=lambda: now)
+    asyncio.run(catalog.get("k", api.fetch))
+
+    async def slow_fetch() -> list[AgentInfo]:
+        await asyncio.sleep(60)
+        return await api.fetch()
+
+    now = 10.0
+    # The loop closes while the refresh it started is in flight
+    asyncio.run(catalog.get("k", slow_fetch))
+    assert api.fetches == 1
+
+    async def refresh() -> list[AgentInfo]:
+        await catalog.get("k", api.fetch)
+        await asyncio.sleep(0)
+        return await catalog.get("k", api.fetch)
+
+    assert len(asyncio.run(refresh())) == 2
+
+
+@pytest.mark.asyncio()
+async def test_catalog_aclose_cancels_refreshes(api: _Api) -> None:
+    """Test that aclose() stops a refresh in flight."""
+    now = 0.0
+    catalog = AgentCatalog(ttl=10, max_entries=10, clock=lambda: now)
+    await catalog.get("k", api.fetch)
+
+    async def slow_fetch() -> list[AgentInfo]:
+        await asyncio.sleep(60)
+        return await api.fetch()
+
+    now = 10.0
+    await catalog.get("k", slow_fetch)
+    await asyncio.sleep(0)
+    await catalog.aclose()
+
+    assert api.fetches == 1
+    assert catalog._refreshes == set()
+
+
+@pytest.mark.asyncio()
+async def test_catalog_evicts_least_recently_used(api: _Api) -> None:
+    """Test that the catalog keeps at most max_entries searches."""
+    catalog = AgentCatalog(ttl=60, max_entries=2)
+    await catalog.get("a", api.fetch)
+    await catalog.get("b", api.fetch)
+    await catalog.get("a", api.fetch)
+    await catalog.get("c", api.fetch)
+
+    assert len(catalog) == 2
+    await catalog.get("b", api.fetch)
+    assert api.fetches == 4
+
+
+@pytest.mark.asyncio()
+async def test_catalog_without_ttl_always_fetches(api: _Api) -> None:
+    """Test that a TTL of 0 disables the cache."""
+    catalog = AgentCatalog(ttl=0, max_entries=10)
+
+    await catalog.get("k", api.fetch)
+    await catalog.get("k", api.fetch)
+
+    assert api.fetches == 2
+    assert len(catalog) == 0
@@ -0,0 +1,212 @@
+import sqlite3
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pyagentai.types.cache import CacheEntry
+from pyagentai.types.url_endpoint import Endpoint
+from pyagentai.utils.cache import MemoryCache, SQLiteCache, cache_key
+
+
+def _entry(content: bytes = b"{}", stale_until: float = 100) -> CacheEntry:
+    return CacheEntry(
+        status_code=200,
+        headers=[],
+        content=content,
+        expires_at=stale_until,
+        stale_until=stale_until,
+    )
+
+
+def test_cache_key_ignores_parameter_order(mock_endpoint: Endpoint) -> None:
+    """Test that the key normalizes the order of parameters."""
+    first = cache_key(mock_endpoint, {"a": 1, "b": 2}, {}, "key")
+    second = cache_key(mock_endpoint, {"b": 2, "a": 1}, {}, "key")
+
+    assert first == second
+    assert first != cache_key(mock_endpoint, {"a": 1, "b": 3}, {}, "key")
+    assert first != cache_key(mock_endpoint, {"a": 1, "b": 2}, {}, "other")
+    assert "key" not in first
+
+
+def test_cache_entry_round_trips_a_response() -> None:
+    """Test that an entry rebuilds the response without its encoding."""
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(
+        200,
+        headers={"X-Id": "1", "Content-Length": "2"},
+        content=b"{}",
+        request=request,
+    )
+
+    entry = CacheEntry.from_response(response, expires_at=1, stale_until=2)
+    rebuilt = entry.to_response(request)
+
+    assert rebuilt.json() == {}
+    assert rebuilt.headers["X-Id"] == "1"
+    assert ("Content-Length", "2") not in entry.headers
+
+
+@pytest.mark.asyncio()
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache = MemoryCache(max_entries=2, clock=lambda: 0)
+    await cache.set("a", _entry())
+    await cache.set("b", _entry())
+    await cache.get("a")
+
+    await cache.set("c", _entry())
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.evictions == 1
+
+
+@pytest.mark.asyncio()
+async def test_memory_cache_bounds_its_bytes() -> None:
+    """Test that entries are evicted to stay within the byte limit."""
+    cache = MemoryCache(max_entries=10, max_bytes=10, clock=lambda: 0)
+    await cache.set("a", _entry(b"x" * 6))
+    await cache.set("b", _entry(b"y" * 6))
+    await cache.set("huge", _entry(b"z" * 11))
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") is not None
+    assert await cache.get("huge") is None
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio()
+async def test_memory_cache_drops_unusable_entries() -> None:
+    """Test that entries past their stale time are not returned."""
+    now = 0.0
+    cache = MemoryCache(max_entries=10, clock=lambda: now)
+    await cache.set("a", _entry(stale_until=5))
+
+    now = 5.0
+    assert await cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.evictions == 0
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> str:
+    """Provides the path of a cache database."""
+    return str(tmp_path / "cache.db")
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_cache_is_shared_and_persistent(db_path: str) -> None:
+    """Test that a new cache on the same file sees the stored entries."""
+    writer = SQLiteCache(db_path, clock=lambda: 0)
+    entry = CacheEntry(
+        status_code=200,
+        headers=[("X-Id", "1")],
+        content=b"transcript " * 200,
+        expires_at=50,
+        stale_until=100,
+    )
+    await writer.set("a", entry)
+    writer.close()
+
+    reader = SQLiteCache(db_path, clock=lambda: 0)
+    assert await reader.get("a") == entry
+    assert await reader.get("missing") is None
+
+    mode = sqlite3.connect(db_path).execute("PRAGMA journal_mode")
+    assert mode.fetchone()[0] == "wal"
+    reader.close()
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_cache_compresses_large_bodies(db_path: str) -> None:
+    """Test that bodies above the threshold are stored compressed."""
+    cache = SQLiteCache(db_path, compress_min_size=100, clock=lambda: 0)
+    await cache.set("small", _entry(b"x" * 10))
+    await cache.set("large", _entry(b"y" * 1000))
+
+    rows = dict(
+        sqlite3.connect(db_path).execute(
+            "SELECT key, length(content) FROM responses"
+        )
+    )
+    assert rows["small"] == 10
+    assert rows["large"] < 100
+    large = await cache.get("large")
+    assert large is not None
+    assert large.content == b"y" * 1000
+    cache.close()
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_cache_evicts_by_size(db_path: str) -> None:
+    """Test that the least recently used entries go beyond max_bytes."""
+    now = 0.0
+    cache = SQLiteCache(db_path, max_bytes=10, clock=lambda: now)
+    await cache.set("a", _entry(b"x" * 4))
+    now = 1.0
+    await cache.set("b", _entry(b"y" * 4))
+    now = 2.0
+    await cache.get("a")
+    now = 3.0
+    await cache.set("c", _entry(b"z" * 4))
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert await cache.get("c") is not None
+    assert cache.evictions == 1
+    cache.close()
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_cache_drops_unusable_entries(db_path: str) -> None:
+    """Test that entries past their stale time are deleted."""
+    now = 0.0
+    cache = SQLiteCache(db_path, max_entries=10, clock=lambda: now)
+    await cache.set("a", _entry(stale_until=5))
+
+    now = 5.0
+    assert await cache.get("a") is None
+    await cache.set("b", _entry(stale_until=10))
+    await cache.clear()
+    assert await cache.get("b") is None
+    assert cache.evictions == 0
+    cache.close()
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_cache_reads_while_another_process_writes(
+    db_path: str,
+) -> None:
+    """Test that reads neither take nor wait for the write lock."""
+    now = 0.0
+    cache = SQLiteCache(
+        db_path, max_entries=10, busy_timeout=0.1, clock=lambda: now
+    )
+    await cache.set("a", _entry(b"x" * 4))
+    await cache.set("b", _entry(b"y" * 4))
+
+    other = sqlite3.connect(db_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    now = 1.0
+    assert await cache.get("a") is not None
+    other.execute("ROLLBACK")
+    other.close()
+
+    rows = dict(
+        sqlite3.connect(db_path).execute(
+            "SELECT key, accessed_at FROM responses"
+        )
+    )
+    assert rows == {"a": 0.0, "b": 0.0}
+
+    # The access is recorded with the next write
+    await cache.set("c", _entry(b"z" * 4))
+    rows = dict(
+        sqlite3.connect(db_path).execute(
+            "SELECT key, accessed_at FROM responses"
+        )
+    )
+    assert rows == {"a": 1.0, "b": 0.0, "c": 1.0}
+    cache.close()
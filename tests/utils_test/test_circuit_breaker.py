@@ -0,0 +1,121 @@
+import pytest
+
+from pyagentai.exceptions import CircuitOpenError
+from pyagentai.types.circuit_breaker import CircuitState
+from pyagentai.types.policies import CircuitBreakerPolicy
+from pyagentai.utils.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    """Provides a controllable clock."""
+    return FakeClock()
+
+
+@pytest.fixture()
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Provides a breaker that opens after two failures for ten seconds."""
+    policy = CircuitBreakerPolicy(
+        failure_threshold=2, open_duration=10.0, half_open_max_calls=1
+    )
+    return CircuitBreaker(policy, name="/test", clock=clock)
+
+
+def _fail(breaker: CircuitBreaker) -> None:
+    breaker.record(breaker.acquire(), success=False)
+
+
+def test_breaker_opens_after_consecutive_failures(
+    breaker: CircuitBreaker,
+) -> None:
+    """Test that only consecutive failures open the breaker."""
+    _fail(breaker)
+    breaker.record(breaker.acquire(), success=True)
+    _fail(breaker)
+    assert breaker.state == CircuitState.CLOSED
+
+    _fail(breaker)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_open_breaker_fails_fast(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that an open breaker rejects requests until it is due."""
+    _fail(breaker)
+    _fail(breaker)
+    clock.now = 4.0
+
+    with pytest.raises(CircuitOpenError, match="/test") as exc_info:
+        breaker.acquire()
+
+    assert exc_info.value.retry_after == 6.0
+    assert not exc_info.value.retryable
+
+
+def test_half_open_breaker_allows_limited_trials(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that a half-open breaker lets one trial through at a time."""
+    _fail(breaker)
+    _fail(breaker)
+    clock.now = 10.0
+
+    ticket = breaker.acquire()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+    breaker.record(ticket, success=True)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failed_trial_reopens_breaker(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that a failed trial opens the breaker again."""
+    _fail(breaker)
+    _fail(breaker)
+    clock.now = 10.0
+
+    _fail(breaker)
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 19.0
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+
+def test_neutral_trial_frees_its_slot(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that an abandoned trial lets another trial through."""
+    _fail(breaker)
+    _fail(breaker)
+    clock.now = 10.0
+
+    breaker.record(breaker.acquire(), success=None)
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.acquire()
+
+
+def test_breaker_ignores_stale_outcomes(breaker: CircuitBreaker) -> None:
+    """Test that requests from an earlier state do not count."""
+    stale = breaker.acquire()
+    _fail(breaker)
+    _fail(breaker)
+
+    breaker.record(stale, success=True)
+
+    assert breaker.state == CircuitState.OPEN
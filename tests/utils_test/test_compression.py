@@ -0,0 +1,99 @@
+import gzip
+import zlib
+
+import pytest
+
+from pyagentai.types.transport import ContentEncoding
+from pyagentai.utils import compression
+from pyagentai.utils.compression import (
+    TransferStats,
+    accept_encoding,
+    compress,
+    is_available,
+)
+
+
+def test_stdlib_encodings_are_always_available() -> None:
+    """Test that gzip and deflate need no optional packages."""
+    assert is_available(ContentEncoding.GZIP)
+    assert is_available(ContentEncoding.DEFLATE)
+
+
+def test_accept_encoding_orders_by_preference() -> None:
+    """Test that earlier encodings get higher quality values."""
+    header = accept_encoding((ContentEncoding.GZIP, ContentEncoding.DEFLATE))
+    assert header == "gzip, deflate;q=0.67"
+
+
+def test_accept_encoding_skips_unavailable_encodings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that encodings that cannot be decoded are not advertised."""
+    monkeypatch.delitem(
+        compression._COMPRESSORS, ContentEncoding.ZSTD, raising=False
+    )
+    accept_encoding.cache_clear()
+
+    header = accept_encoding((ContentEncoding.ZSTD, ContentEncoding.GZIP))
+
+    assert header == "gzip"
+    accept_encoding.cache_clear()
+
+
+def test_accept_encoding_without_usable_encodings() -> None:
+    """Test that an empty preference list asks for identity encoding."""
+    assert accept_encoding(()) == "identity"
+
+
+@pytest.mark.parametrize(
+    ("encoding", "decompress"),
+    [
+        (ContentEncoding.GZIP, gzip.decompress),
+        (ContentEncoding.DEFLATE, zlib.decompress),
+    ],
+)
+def test_compress_round_trip(encoding: ContentEncoding, decompress) -> None:  # noqa: ANN001
+    """Test that compressed bodies decompress to the original."""
+    data = b'{"text":"' + b"a" * 1000 + b'"}'
+    compressed = compress(data, encoding)
+    assert len(compressed) < len(data)
+    assert decompress(compressed) == data
+
+
+def test_compress_unavailable_encoding_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that compressing with a missing package raises a ValueError."""
+    monkeypatch.delitem(
+        compression._COMPRESSORS, ContentEncoding.BROTLI, raising=False
+    )
+    with pytest.raises(ValueError, match="'br' is not available"):
+        compress(b"data", ContentEncoding.BROTLI)
+
+
+def test_transfer_stats_ratios() -> None:
+    """Test that transfer stats accumulate and report ratios."""
+    stats = TransferStats()
+    assert stats.request_compression_ratio == 1.0
+    assert stats.response_compression_ratio == 1.0
+
+    stats.record(
+        request_bytes=1000,
+        request_bytes_sent=250,
+        response_bytes_received=100,
+        response_bytes=400,
+    )
+    stats.record(
+        request_bytes=0,
+        request_bytes_sent=0,
+        response_bytes_received=100,
+        response_bytes=400,
+    )
+
+    assert stats.requests == 2
+    assert stats.request_compression_ratio == 4.0
+    assert stats.response_compression_ratio == 4.0
+
+    stats.reset()
+    assert stats.requests == 0
+    assert stats.response_bytes == 0
@@ -0,0 +1,315 @@
+import asyncio
+import threading
+
+import pydantic
+import pytest
+
+from pyagentai.types.policies import ConcurrencyPolicy
+from pyagentai.types.priority import RequestPriority
+from pyagentai.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    CapacityLimiter,
+    PriorityLimiter,
+)
+
+
+@pytest.mark.asyncio()
+async def test_capacity_limiter_queues_beyond_capacity() -> None:
+    """Test that work beyond the capacity waits for a release."""
+    limiter = CapacityLimiter(2)
+    assert await limiter.acquire()
+    assert await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limiter.waiting == 1
+
+    limiter.release()
+    assert await waiter
+    assert limiter.in_use == 2
+
+
+@pytest.mark.asyncio()
+async def test_capacity_limiter_gives_up_after_max_wait() -> None:
+    """Test that a timed-out waiter leaves the queue."""
+    limiter = CapacityLimiter(1)
+    await limiter.acquire()
+
+    assert not await limiter.acquire(max_wait=0.01)
+    assert limiter.waiting == 0
+    assert limiter.in_use == 1
+
+
+@pytest.mark.asyncio()
+async def test_capacity_limiter_weighs_work_by_cost() -> None:
+    """Test that costly work waits until its cost fits."""
+    limiter = CapacityLimiter(4)
+    await limiter.acquire(cost=3)
+
+    heavy = asyncio.create_task(limiter.acquire(cost=2))
+    await asyncio.sleep(0)
+    assert not heavy.done()
+
+    limiter.release(cost=3)
+    assert await heavy
+
+
+@pytest.mark.asyncio()
+async def test_capacity_limiter_grows_with_capacity() -> None:
+    """Test that raising the capacity admits waiters."""
+    limiter = CapacityLimiter(1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.capacity = 2
+    assert await waiter
+
+
+def test_capacity_limiter_wakes_waiters_on_other_loops() -> None:
+    """Test that a release on one loop wakes a waiter on another."""
+    limiter = CapacityLimiter(1)
+    acquired = threading.Event()
+    asyncio.run(limiter.acquire())
+
+    def wait_in_thread() -> None:
+        asyncio.run(limiter.acquire())
+        acquired.set()
+
+    thread = threading.Thread(target=wait_in_thread)
+    thread.start()
+    while limiter.waiting == 0:
+        pass
+    limiter.release()
+    thread.join(timeout=5)
+
+    assert acquired.is_set()
+
+
+def _adaptive(**kwargs: float) -> AdaptiveConcurrencyLimiter:
+    now = [0.0]
+
+    def clock() -> float:
+        now[0] += 1.0
+        return now[0]
+
+    return AdaptiveConcurrencyLimiter(
+        ConcurrencyPolicy(**kwargs),  # type: ignore[arg-type]
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_adaptive_limit_grows_while_latency_is_stable() -> None:
+    """Test the additive increase of a fully used limit."""
+    limiter = _adaptive(initial_limit=2, increase=1.0)
+
+    for _ in range(4):
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+        limiter.release(latency=0.1)
+
+    assert limiter.limit > 3
+    assert limiter.latency == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio()
+async def test_adaptive_limit_does_not_grow_when_unused() -> None:
+    """Test that an idle limit is not raised."""
+    limiter = _adaptive(initial_limit=10)
+
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio()
+async def test_adaptive_limit_backs_off_on_overload() -> None:
+    """Test the multiplicative decrease on overload, down to the floor."""
+    limiter = _adaptive(initial_limit=10, backoff_ratio=0.5, min_limit=2)
+
+    await limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 5
+
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio()
+async def test_adaptive_limit_recovers_after_latency_steps_up() -> None:
+    """Test that a lasting rise in latency becomes the new baseline."""
+    limiter = _adaptive(
+        initial_limit=4,
+        backoff_ratio=0.5,
+        latency_tolerance=2.0,
+        smoothing=0.5,
+    )
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+
+    for _ in range(50):
+        await limiter.acquire()
+        assert await limiter.acquire(max_wait=0.1)
+        limiter.release(latency=0.5)
+        limiter.release(latency=0.5)
+
+    assert limiter.latency == pytest.approx(0.5, rel=0.01)
+    assert limiter.limit >= 4
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        {"max_limit": 5},
+        {"min_limit": 50, "max_limit": 10},
+        {"initial_limit": 1, "min_limit": 2},
+    ],
+)
+def test_concurrency_policy_rejects_initial_limit_out_of_bounds(
+    limits: dict[str, int],
+) -> None:
+    """Test that the initial limit must lie within the bounds."""
+    with pytest.raises(pydantic.ValidationError):
+        ConcurrencyPolicy(**limits)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio()
+async def test_adaptive_limit_backs_off_on_latency_spike() -> None:
+    """Test that a latency spike counts as overload."""
+    limiter = _adaptive(
+        initial_limit=10, backoff_ratio=0.5, latency_tolerance=2.0
+    )
+    await limiter.acquire()
+    limiter.release(latency=0.1)
+
+    await limiter.acquire()
+    limiter.release(latency=1.0)
+
+    assert limiter.limit == 5
+    stats = limiter.stats()
+    assert stats.limit == 5
+    assert stats.in_flight == 0
+    assert stats.latency == pytest.approx(0.19)
+
+
+@pytest.mark.asyncio()
+async def test_priority_limiter_serves_high_priority_first() -> None:
+    """Test that freed capacity goes to the most urgent waiter."""
+    limiter = PriorityLimiter(1, aging_interval=60)
+    await limiter.acquire()
+    served: list[RequestPriority] = []
+
+    async def wait(priority: RequestPriority) -> None:
+        await limiter.acquire(priority=priority)
+        served.append(priority)
+        limiter.release()
+
+    tasks = [
+        asyncio.create_task(wait(priority))
+        for priority in (
+            RequestPriority.LOW,
+            RequestPriority.NORMAL,
+            RequestPriority.HIGH,
+        )
+    ]
+    await asyncio.sleep(0)
+    assert limiter.waiting == 3
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert served == [
+        RequestPriority.HIGH,
+        RequestPriority.NORMAL,
+        RequestPriority.LOW,
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_priority_limiter_ages_waiting_work() -> None:
+    """Test that low-priority work overtakes once it has waited long."""
+    now = 0.0
+    limiter = PriorityLimiter(1, aging_interval=1, clock=lambda: now)
+    await limiter.acquire()
+
+    low = asyncio.create_task(limiter.acquire(priority=RequestPriority.LOW))
+    await asyncio.sleep(0)
+    now = 3.0
+    high = asyncio.create_task(
+        limiter.acquire(priority=RequestPriority.HIGH)
+    )
+    await asyncio.sleep(0)
+
+    limiter.release()
+    assert await low
+    assert not high.done()
+    limiter.release()
+    assert await high
+
+
+@pytest.mark.asyncio()
+async def test_priority_limiter_gives_up_after_max_wait() -> None:
+    """Test that a timed-out waiter leaves its lane."""
+    limiter = PriorityLimiter(1, aging_interval=1)
+    await limiter.acquire()
+
+    assert not await limiter.acquire(
+        max_wait=0.01, priority=RequestPriority.HIGH
+    )
+    assert limiter.waiting == 0
+    limiter.release()
+    assert await limiter.acquire(priority=RequestPriority.LOW)
+
+
+@pytest.mark.asyncio()
+async def test_priority_limiter_shares_capacity_fairly() -> None:
+    """Test that a tenant with a deep queue does not delay the others."""
+    limiter = PriorityLimiter(1, aging_interval=60, weights={"b": 2})
+    await limiter.acquire()
+    served: list[str] = []
+
+    async def wait(tenant: str) -> None:
+        await limiter.acquire(tenant=tenant)
+        served.append(tenant)
+        limiter.release()
+
+    tasks = [asyncio.create_task(wait("a")) for _ in range(6)]
+    tasks += [asyncio.create_task(wait("b")) for _ in range(4)]
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert served[:6] == ["a", "b", "b", "a", "b", "b"]
+
+    stats = limiter.tenant_stats()
+    assert stats["a"].dispatched == 6
+    assert stats["b"].dispatched == 4
+    assert stats["a"].queued == 0
+    assert stats[None].dispatched == 1
+    assert stats["a"].max_wait >= stats["a"].mean_wait > 0
+
+
+@pytest.mark.asyncio()
+async def test_priority_limiter_forgets_idle_tenants() -> None:
+    """Test that only the most recently active tenants are tracked."""
+    limiter = PriorityLimiter(1, aging_interval=60, max_tenants=2)
+    await limiter.acquire(tenant="a")
+    waiter = asyncio.create_task(limiter.acquire(tenant="b"))
+    await asyncio.sleep(0)
+    limiter.release()
+    await waiter
+    limiter.release()
+
+    for tenant in ("c", "d", "e"):
+        await limiter.acquire(tenant=tenant)
+        limiter.release()
+
+    # "b" has used its share ahead of the virtual time, so it is kept
+    assert list(limiter.tenant_stats()) == ["b", "e"]
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from pyagentai.types.policies import HedgePolicy
+from pyagentai.utils.hedging import Hedger
+
+
+def test_hedger_uses_initial_delay_without_history() -> None:
+    """Test the delay while too few latencies are known."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.5, min_samples=3))
+    hedger.record(0.1)
+
+    assert hedger.delay() == 0.5
+
+
+def test_hedger_delay_is_latency_percentile() -> None:
+    """Test that the delay follows the configured percentile."""
+    hedger = Hedger(HedgePolicy(percentile=90, min_samples=10))
+    for latency in range(1, 11):
+        hedger.record(latency / 10)
+
+    assert hedger.delay() == 0.9
+
+
+@pytest.mark.asyncio()
+async def test_hedger_races_a_hedge_against_a_slow_request() -> None:
+    """Test that a fast hedge wins and the slow original is cancelled."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.01))
+    delays = [10.0, 0.0]
+    cancelled: list[int] = []
+
+    async def send() -> int:
+        copy = 2 - len(delays)
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(copy)
+            raise
+        return copy
+
+    assert await hedger.run(send) == 1
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio()
+async def test_hedger_does_not_hedge_fast_requests() -> None:
+    """Test that a request answered before the delay is sent once."""
+    hedger = Hedger(HedgePolicy(initial_delay=1.0))
+    calls: list[None] = []
+
+    async def send() -> str:
+        calls.append(None)
+        return "ok"
+
+    assert await hedger.run(send) == "ok"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio()
+async def test_hedger_caps_hedges_by_ratio() -> None:
+    """Test that hedges stop once the hedge budget is spent."""
+    hedger = Hedger(
+        HedgePolicy(
+            initial_delay=0.001, max_hedge_ratio=0.5, min_hedges_per_second=0
+        )
+    )
+    calls: list[None] = []
+
+    async def send() -> None:
+        calls.append(None)
+        await asyncio.sleep(0.01)
+
+    for _ in range(4):
+        await hedger.run(send)
+
+    # Four requests allow two hedges
+    assert len(calls) == 6
+
+
+@pytest.mark.asyncio()
+async def test_hedger_raises_first_error_when_all_copies_fail() -> None:
+    """Test that the original's error is raised if the hedge fails too."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.01))
+    errors = [ValueError("first"), ValueError("second")]
+
+    async def send() -> None:
+        error = errors.pop(0)
+        await asyncio.sleep(0.02 if str(error) == "first" else 0.03)
+        raise error
+
+    with pytest.raises(ValueError, match="first"):
+        await hedger.run(send)
@@ -0,0 +1,84 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pyagentai.types.policies import HostLimitPolicy
+from pyagentai.utils.host_limiter import HostLimiter
+
+
+@pytest.fixture()
+def path(tmp_path: Path) -> str:
+    """Provides a path prefix for the shared files."""
+    return str(tmp_path / "quota")
+
+
+@pytest.mark.asyncio()
+async def test_host_limiters_share_one_token_bucket(path: str) -> None:
+    """Test that limiters using the same files share their tokens."""
+    now = 100.0
+    policy = HostLimitPolicy(path=path, rate=10, burst=2)
+    first = HostLimiter(policy, clock=lambda: now)
+    second = HostLimiter(policy, clock=lambda: now)
+
+    assert await first.acquire(max_wait=0)
+    assert await second.acquire(max_wait=0)
+    assert not await first.acquire(max_wait=0)
+
+    now += 0.2
+    assert await second.acquire(max_wait=0)
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio()
+async def test_host_limiters_share_concurrency_slots(path: str) -> None:
+    """Test that a slot held by one limiter is not given to another."""
+    policy = HostLimitPolicy(path=path, max_concurrency=1)
+    first = HostLimiter(policy)
+    second = HostLimiter(policy)
+
+    slot = await first.acquire_slot()
+    assert slot == 0
+    assert await second.acquire_slot(max_wait=0.02) is None
+
+    waiter = asyncio.create_task(second.acquire_slot())
+    await asyncio.sleep(0.02)
+    first.release_slot(slot)
+    assert await waiter == 0
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio()
+async def test_host_limiter_counts_its_own_slots(path: str) -> None:
+    """Test that coroutines of one process do not share a slot."""
+    limiter = HostLimiter(HostLimitPolicy(path=path, max_concurrency=2))
+
+    assert await limiter.acquire_slot() == 0
+    assert await limiter.acquire_slot() == 1
+    assert await limiter.acquire_slot(max_wait=0.02) is None
+    limiter.close()
+
+
+@pytest.mark.asyncio()
+async def test_closing_a_host_limiter_frees_its_slots(path: str) -> None:
+    """Test that slots are freed when their holder goes away."""
+    policy = HostLimitPolicy(path=path, max_concurrency=1)
+    first = HostLimiter(policy)
+    second = HostLimiter(policy)
+    await first.acquire_slot()
+
+    first.close()
+    assert await second.acquire_slot(max_wait=0) == 0
+    second.close()
+
+
+@pytest.mark.asyncio()
+async def test_host_limiter_without_limits_never_waits(path: str) -> None:
+    """Test that a policy without limits lets everything through."""
+    limiter = HostLimiter(HostLimitPolicy(path=path))
+
+    assert await limiter.acquire(max_wait=0)
+    assert await limiter.acquire_slot(max_wait=0) == -1
+    limiter.release_slot(-1)
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from pyagentai.types.policies import RateLimitPolicy
+from pyagentai.utils.rate_limiter import (
+    TokenBucket,
+    parse_rate_limit_headers,
+)
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_paces_requests_after_burst() -> None:
+    """Test that reservations beyond the burst wait in order."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=2.0, burst=2), clock=clock)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_bucket_refills_up_to_burst() -> None:
+    """Test that tokens accrue over time but never beyond the burst."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0, burst=3), clock=clock)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 2
+    assert bucket.tokens == 2.0
+    clock.now += 60
+    assert bucket.tokens == 3.0
+
+
+def test_bucket_refuses_waits_beyond_max_wait() -> None:
+    """Test that a too-long wait reserves nothing."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0), clock=clock)
+    bucket.reserve()
+
+    assert bucket.reserve(max_wait=0.5) is None
+    assert bucket.reserve(max_wait=1.0) == 1.0
+
+
+def test_bucket_follows_rate_limit_headers() -> None:
+    """Test that the rate spreads the remaining quota until reset."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0, burst=5), clock=clock)
+
+    bucket.observe(
+        {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "10"}, 200
+    )
+
+    assert bucket.rate == 3.0
+
+
+def test_bucket_pauses_when_quota_is_exhausted() -> None:
+    """Test that no request is sent before the window resets."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0, burst=5), clock=clock)
+
+    bucket.observe({"RateLimit-Remaining": "0", "RateLimit-Reset": "7"}, 200)
+
+    assert bucket.reserve() == 8.0
+
+
+def test_bucket_pauses_on_retry_after() -> None:
+    """Test that a 429 with Retry-After pauses the bucket."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=10.0, burst=5), clock=clock)
+
+    bucket.observe({"Retry-After": "3"}, 429)
+
+    assert bucket.reserve() == pytest.approx(3.1)
+
+
+def test_bucket_is_idle_once_full_again() -> None:
+    """Test that a bucket is idle only when full and not paused."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0, burst=2), clock=clock)
+    assert bucket.idle
+
+    bucket.reserve()
+    assert not bucket.idle
+    clock.now += 1
+    assert bucket.idle
+
+    bucket.pause(5)
+    clock.now += 4
+    assert not bucket.idle
+
+
+def test_bucket_ignores_headers_when_not_adapting() -> None:
+    """Test that adapt_to_headers=False keeps the configured rate."""
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0, adapt_to_headers=False))
+
+    bucket.observe({"RateLimit-Remaining": "0", "RateLimit-Reset": "7"}, 429)
+
+    assert bucket.rate == 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_parse_rate_limit_headers_converts_timestamps() -> None:
+    """Test that a reset given as a Unix timestamp becomes a delay."""
+    remaining, reset = parse_rate_limit_headers(
+        {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "1700000000"}
+    )
+
+    assert remaining == 5.0
+    assert reset == 0.0
+
+
+@pytest.mark.asyncio()
+async def test_bucket_returns_token_when_cancelled() -> None:
+    """Test that a cancelled wait gives its token back."""
+    bucket = TokenBucket(RateLimitPolicy(rate=1.0))
+    await bucket.acquire()
+
+    task = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert bucket.tokens > -0.5
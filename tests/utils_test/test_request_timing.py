@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from pyagentai.utils.request_timing import RequestTimer
+
+
+@pytest.mark.asyncio()
+async def test_request_timer_derives_phases_from_trace_events() -> None:
+    """Test that trace events of a new connection produce every phase."""
+    clock = iter(float(tick) for tick in range(20))
+    with patch("time.perf_counter", lambda: next(clock)):
+        timer = RequestTimer("POST", "https://api.test/action")  # t=0
+        for event in [
+            "connection.connect_tcp.started",  # t=1
+            "connection.connect_tcp.complete",  # t=2
+            "connection.start_tls.started",  # t=3
+            "connection.start_tls.complete",  # t=4
+            "http2.send_request_headers.started",  # t=5
+            "http2.send_request_body.started",  # t=6
+            "http2.send_request_body.complete",  # t=7
+            "http2.receive_response_headers.started",  # t=8
+            "http2.receive_response_headers.complete",  # t=9
+            "http2.receive_response_body.started",  # t=10
+            "http2.receive_response_body.complete",  # t=11
+        ]:
+            await timer.trace(event, {})
+        timings = timer.finish(200)  # t=12
+
+    assert timings.status_code == 200
+    assert timings.pool_wait == 1
+    assert timings.connect == 1
+    assert timings.tls == 1
+    assert timings.request_write == 2
+    assert timings.time_to_first_byte == 2
+    assert timings.body_read == 1
+    assert timings.total == 12
+    assert not timings.reused_connection
+
+
+@pytest.mark.asyncio()
+async def test_request_timer_on_reused_connection() -> None:
+    """Test that a reused HTTP/1.1 connection has no connect or TLS phase."""
+    timer = RequestTimer("GET", "https://api.test/")
+    for event in [
+        "http11.send_request_headers.started",
+        "http11.send_request_headers.complete",
+        "http11.send_request_body.started",
+        "http11.send_request_body.complete",
+        "http11.receive_response_headers.started",
+        "http11.receive_response_headers.complete",
+    ]:
+        await timer.trace(event, {})
+    timings = timer.finish(204)
+
+    assert timings.reused_connection
+    assert timings.tls is None
+    assert timings.request_write is not None
+    assert timings.time_to_first_byte is not None
+    assert timings.body_read is None
+
+
+def test_request_timer_without_trace_events() -> None:
+    """Test that transports without tracing only report the total."""
+    timings = RequestTimer("GET", "https://api.test/").finish()
+
+    assert timings.status_code is None
+    assert timings.pool_wait is None
+    assert timings.total >= 0
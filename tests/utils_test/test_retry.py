@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from pyagentai.types.policies import RetryBudgetPolicy, RetryPolicy
+from pyagentai.utils.retry import (
+    RetryBudget,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+def test_backoff_grows_exponentially_up_to_the_cap() -> None:
+    """Test the backoff without jitter."""
+    policy = RetryPolicy(
+        initial_backoff=0.5, multiplier=2.0, max_backoff=3.0, jitter=False
+    )
+
+    delays = [backoff_delay(policy, retry) for retry in range(1, 5)]
+
+    assert delays == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_backoff_applies_full_jitter() -> None:
+    """Test that jitter scales the backoff by a random factor."""
+    policy = RetryPolicy(initial_backoff=1.0, multiplier=2.0)
+
+    assert backoff_delay(policy, 2, rand=lambda: 0.25) == 0.5
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("3", 3.0), (" 0 ", 0.0), ("soon", None)],
+)
+def test_parse_retry_after_seconds(
+    value: str | None, expected: float | None
+) -> None:
+    """Test parsing Retry-After given in seconds."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Test parsing Retry-After given as an HTTP date."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert delay is not None
+    assert 28 <= delay <= 30
+
+
+def test_retry_budget_caps_retries_by_traffic() -> None:
+    """Test that retries are limited to a fraction of requests."""
+    now = [100.0]
+    budget = RetryBudget(
+        RetryBudgetPolicy(ratio=0.5, min_retries_per_second=0, window=10),
+        clock=lambda: now[0],
+    )
+    for _ in range(4):
+        budget.record_request()
+
+    assert [budget.try_withdraw() for _ in range(3)] == [True, True, False]
+
+
+def test_retry_budget_refills_as_window_slides() -> None:
+    """Test that old requests and retries leave the window."""
+    now = [100.0]
+    budget = RetryBudget(
+        RetryBudgetPolicy(ratio=0.0, min_retries_per_second=0.1, window=10),
+        clock=lambda: now[0],
+    )
+
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    now[0] += 10
+    assert budget.try_withdraw()
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from pyagentai.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_shares_one_call() -> None:
+    """Test that concurrent callers with one key share a single call."""
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.run("k", call) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert flight.coalesced == 4
+    assert len(flight) == 0
+    assert await flight.run("k", call) == 2
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_survives_a_cancelled_caller() -> None:
+    """Test that cancelling one caller leaves the others waiting."""
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.run("k", call))
+    second = asyncio.create_task(flight.run("k", call))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "done"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_cancels_an_abandoned_call() -> None:
+    """Test that the call is cancelled once every caller has gone."""
+    flight: SingleFlight[None] = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(flight.run("k", call))
+    await asyncio.sleep(0)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_shares_errors() -> None:
+    """Test that every caller sees the error of the shared call."""
+    flight: SingleFlight[None] = SingleFlight()
+
+    async def call() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.run("k", call), flight.run("k", call), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_times_out_one_caller() -> None:
+    """Test that a caller's timeout leaves the call to the others."""
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.05)
+        return "done"
+
+    impatient = asyncio.create_task(flight.run("k", call, timeout=0.01))
+    patient = asyncio.create_task(flight.run("k", call))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await impatient
+    assert await patient == "done"
@@ -0,0 +1,86 @@
+import httpx
+import pytest
+
+from pyagentai.utils.striped_transport import StripedTransport
+
+
+class _RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport that records requests and returns a streamed body."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(
+            200, stream=httpx.ByteStream(b"body"), request=request
+        )
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_striped_transport_requires_transports() -> None:
+    """Test that at least one stripe is required."""
+    with pytest.raises(ValueError, match="At least one transport"):
+        StripedTransport([])
+
+
+@pytest.mark.asyncio()
+async def test_striped_transport_uses_least_loaded_stripe() -> None:
+    """Test that open responses steer new requests to other stripes."""
+    stripes = [_RecordingTransport(), _RecordingTransport()]
+    transport = StripedTransport(stripes)
+    request = httpx.Request("GET", "https://example.com")
+
+    first = await transport.handle_async_request(request)
+    second = await transport.handle_async_request(request)
+
+    assert transport.in_flight == [1, 1]
+    assert len(stripes[0].requests) == 1
+    assert len(stripes[1].requests) == 1
+
+    # Closing the first response frees its stripe for the next request
+    await first.aclose()
+    assert transport.in_flight == [0, 1]
+    await transport.handle_async_request(request)
+    assert len(stripes[0].requests) == 2
+    await second.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_striped_transport_releases_stripe_once() -> None:
+    """Test that reading and closing a response releases it exactly once."""
+    transport = StripedTransport([_RecordingTransport()])
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        response = await http_client.get("https://example.com")
+        assert response.content == b"body"
+        await response.aclose()
+
+    assert transport.in_flight == [0]
+
+
+@pytest.mark.asyncio()
+async def test_striped_transport_releases_stripe_on_error() -> None:
+    """Test that a failed request does not leave its stripe occupied."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("boom")
+
+    transport = StripedTransport([httpx.MockTransport(handler)])
+    request = httpx.Request("GET", "https://example.com")
+
+    with pytest.raises(httpx.ConnectError):
+        await transport.handle_async_request(request)
+    assert transport.in_flight == [0]
+
+
+@pytest.mark.asyncio()
+async def test_striped_transport_closes_all_stripes() -> None:
+    """Test that closing the transport closes every stripe."""
+    stripes = [_RecordingTransport(), _RecordingTransport()]
+    await StripedTransport(stripes).aclose()
+    assert all(stripe.closed for stripe in stripes)
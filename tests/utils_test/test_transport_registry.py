@@ -0,0 +1,81 @@
+import httpx
+import pytest
+
+from pyagentai.utils.transport_registry import SharedClientRegistry
+
+
+@pytest.mark.asyncio()
+async def test_acquire_returns_same_client_for_same_key() -> None:
+    """Test that users of the same key share one client."""
+    registry = SharedClientRegistry()
+
+    first = registry.acquire("key", httpx.AsyncClient)
+    second = registry.acquire("key", httpx.AsyncClient)
+
+    assert first is second
+    assert registry.ref_count("key") == 2
+    await registry.release("key")
+    await registry.release("key")
+
+
+@pytest.mark.asyncio()
+async def test_acquire_returns_different_clients_for_different_keys() -> None:
+    """Test that different keys get separate clients."""
+    registry = SharedClientRegistry()
+
+    first = registry.acquire("key_a", httpx.AsyncClient)
+    second = registry.acquire("key_b", httpx.AsyncClient)
+
+    assert first is not second
+    await registry.release("key_a")
+    await registry.release("key_b")
+
+
+@pytest.mark.asyncio()
+async def test_release_closes_client_after_last_user() -> None:
+    """Test that the client is only closed when its last user is gone."""
+    registry = SharedClientRegistry()
+    http_client = registry.acquire("key", httpx.AsyncClient)
+    registry.acquire("key", httpx.AsyncClient)
+
+    await registry.release("key")
+    assert not http_client.is_closed
+    assert registry.ref_count("key") == 1
+
+    await registry.release("key")
+    assert http_client.is_closed
+    assert registry.ref_count("key") == 0
+
+    # Releasing an unknown key is a no-op
+    await registry.release("key")
+
+
+@pytest.mark.asyncio()
+async def test_get_replaces_closed_client_without_new_reference() -> None:
+    """Test that get() replaces a closed client but keeps the count."""
+    registry = SharedClientRegistry()
+    http_client = registry.acquire("key", httpx.AsyncClient)
+    await http_client.aclose()
+
+    replacement = registry.get("key", httpx.AsyncClient)
+
+    assert replacement is not http_client
+    assert not replacement.is_closed
+    assert registry.ref_count("key") == 1
+    await registry.release("key")
+    assert replacement.is_closed
+
+
+@pytest.mark.asyncio()
+async def test_discard_drops_client_without_closing() -> None:
+    """Test that discard() forgets a client whose loop is gone."""
+    registry = SharedClientRegistry()
+    http_client = registry.acquire("key", httpx.AsyncClient)
+
+    registry.discard("key")
+
+    assert registry.ref_count("key") == 0
+    assert not http_client.is_closed
+    assert registry.acquire("key", httpx.AsyncClient) is not http_client
+    await http_client.aclose()
+    await registry.release("key")